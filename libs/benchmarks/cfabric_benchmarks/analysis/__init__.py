@@ -1,10 +1,13 @@
 """Statistical analysis module for benchmark results."""
 
 from cfabric_benchmarks.analysis.comparison import (
+    compare_all,
     compare_latency_results,
     compare_load_times,
     compare_memory_results,
+    compute_latency_stats_by_categories,
     compute_latency_stats_by_category,
+    compute_latency_stats_by_queries,
     compute_latency_stats_by_query,
     format_comparison_summary,
 )
@@ -16,7 +19,9 @@ from cfabric_benchmarks.analysis.statistics import (
     compute_percentiles,
     compute_summary,
     linear_regression,
+    paired_t_test,
     welch_t_test,
+    welch_t_test_from_moments,
 )
 
 __all__ = [
@@ -28,12 +33,17 @@ __all__ = [
     "compute_percentiles",
     "compute_summary",
     "linear_regression",
+    "paired_t_test",
     "welch_t_test",
+    "welch_t_test_from_moments",
     # Comparison
+    "compare_all",
     "compare_latency_results",
     "compare_load_times",
     "compare_memory_results",
+    "compute_latency_stats_by_categories",
     "compute_latency_stats_by_category",
+    "compute_latency_stats_by_queries",
     "compute_latency_stats_by_query",
     "format_comparison_summary",
 ]
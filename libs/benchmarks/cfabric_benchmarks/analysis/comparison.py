@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Literal
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal
+
+import numpy as np
 
 from cfabric_benchmarks.analysis.statistics import (
     compare_implementations,
@@ -16,6 +21,154 @@ from cfabric_benchmarks.models.latency import (
 )
 from cfabric_benchmarks.models.statistics import ComparisonResult, StatisticalSummary
 
+# Column dtypes for the measurement fields the comparisons filter and read
+_COLUMN_DTYPES: dict[str, Any] = {
+    "implementation": str,
+    "mode": str,
+    "query_id": str,
+    "success": bool,
+    "memory_used_mb": np.float64,
+    "load_time_s": np.float64,
+    "execution_time_ms": np.float64,
+}
+
+
+class _Columns:
+    """Measurement fields as arrays, for one top-level comparison call.
+
+    The stats builders run once per query or category and implementation
+    over the same measurements, so each field is pulled out of the
+    measurement objects once and then filtered with masks. An instance
+    lives only as long as the call that created it, so changes to the
+    measurement list are always seen by the next call.
+    """
+
+    def __init__(self, measurements: list[Any]) -> None:
+        self._measurements = measurements
+        self._arrays: dict[str, np.ndarray] = {}
+        self._groups: tuple[np.ndarray, dict[str, tuple[int, int]]] | None = None
+        # compare_all shares an instance between threads
+        self._lock = threading.Lock()
+
+    def get(self, *fields: str) -> tuple[np.ndarray, ...]:
+        """Return measurement fields as arrays, one per field.
+
+        Args:
+            fields: Field names, keys of `_COLUMN_DTYPES`
+
+        Returns:
+            One array per field, aligned with the measurements
+        """
+        with self._lock:
+            for field in fields:
+                if field not in self._arrays:
+                    self._arrays[field] = np.array(
+                        [getattr(m, field) for m in self._measurements],
+                        dtype=_COLUMN_DTYPES[field],
+                    )
+            return tuple(self._arrays[field] for field in fields)
+
+    def query_rows(self, query_ids: Iterable[str]) -> np.ndarray:
+        """Return the positions of the measurements of some queries.
+
+        The first call sorts the positions by query id once (keeping
+        measurement order within a query) and records where each query's
+        run starts and ends, so each later lookup is a dict hit and a slice
+        instead of a comparison against every measurement.
+
+        Args:
+            query_ids: Queries to select
+
+        Returns:
+            Positions into the measurements, in measurement order
+        """
+        (column,) = self.get("query_id")
+        with self._lock:
+            if self._groups is None:
+                order = np.argsort(column, kind="stable")
+                ids, starts = np.unique(column[order], return_index=True)
+                stops = np.append(starts[1:], len(column))
+                bounds = dict(zip(ids.tolist(), zip(starts.tolist(), stops.tolist())))
+                self._groups = (order, bounds)
+            order, bounds = self._groups
+
+        slices = [order[slice(*bounds[q])] for q in query_ids if q in bounds]
+        if len(slices) == 1:
+            return slices[0]
+        # Several queries: back to measurement order, so sums match a plain filter
+        return np.sort(np.concatenate(slices)) if slices else np.empty(0, dtype=np.intp)
+
+
+def _category_index(queries: list[Any]) -> dict[str, frozenset[str]]:
+    """Return the ids of the queries in each category.
+
+    Args:
+        queries: Search queries
+
+    Returns:
+        Query ids keyed by category
+    """
+    ids: dict[str, set[str]] = {}
+    for q in queries:
+        ids.setdefault(q.category, set()).add(q.id)
+    return {c: frozenset(members) for c, members in ids.items()}
+
+
+def _memory_comparison(columns: _Columns, mode: str) -> ComparisonResult:
+    """Compare TF vs CF memory usage for a mode; see compare_memory_results."""
+    impl, modes, memory = columns.get("implementation", "mode", "memory_used_mb")
+    in_mode = modes == mode
+
+    return compare_implementations(
+        memory[in_mode & (impl == "TF")],
+        memory[in_mode & (impl == "CF")],
+        metric_name=f"memory_{mode}",
+        unit="MB",
+        metric_type="memory",
+    )
+
+
+def _load_time_comparison(columns: _Columns) -> ComparisonResult:
+    """Compare TF vs CF load times; see compare_load_times."""
+    impl, modes, times = columns.get("implementation", "mode", "load_time_s")
+    single = modes == "single"
+
+    return compare_implementations(
+        times[single & (impl == "TF")],
+        times[single & (impl == "CF")],
+        metric_name="load_time",
+        unit="s",
+        metric_type="time",
+    )
+
+
+def _latency_comparison(
+    columns: _Columns,
+    category: str | None = None,
+    query_ids: Iterable[str] = (),
+) -> ComparisonResult:
+    """Compare TF vs CF query latency; see compare_latency_results.
+
+    Args:
+        columns: Columns of the query measurements
+        category: Optional category to filter by
+        query_ids: Ids of the queries in `category`
+    """
+    impl, success, times = columns.get("implementation", "success", "execution_time_ms")
+    if category:
+        rows = columns.query_rows(query_ids)
+        impl, success, times = impl[rows], success[rows], times[rows]
+
+    metric_name = f"latency_{category}" if category else "latency_overall"
+
+    return compare_implementations(
+        times[success & (impl == "TF")],
+        times[success & (impl == "CF")],
+        metric_name=metric_name,
+        unit="ms",
+        metric_type="time",
+    )
+
 
 def compare_memory_results(
     result: MemoryBenchmarkResult,
@@ -30,24 +183,7 @@ def compare_memory_results(
     Returns:
         ComparisonResult with memory comparison statistics
     """
-    tf_measurements = [
-        m.memory_used_mb
-        for m in result.measurements
-        if m.implementation == "TF" and m.mode == mode
-    ]
-    cf_measurements = [
-        m.memory_used_mb
-        for m in result.measurements
-        if m.implementation == "CF" and m.mode == mode
-    ]
-
-    return compare_implementations(
-        tf_measurements,
-        cf_measurements,
-        metric_name=f"memory_{mode}",
-        unit="MB",
-        metric_type="memory",
-    )
+    return _memory_comparison(_Columns(result.measurements), mode)
 
 
 def compare_load_times(result: MemoryBenchmarkResult) -> ComparisonResult:
@@ -59,24 +195,7 @@ def compare_load_times(result: MemoryBenchmarkResult) -> ComparisonResult:
     Returns:
         ComparisonResult with load time comparison statistics
     """
-    tf_times = [
-        m.load_time_s
-        for m in result.measurements
-        if m.implementation == "TF" and m.mode == "single"
-    ]
-    cf_times = [
-        m.load_time_s
-        for m in result.measurements
-        if m.implementation == "CF" and m.mode == "single"
-    ]
-
-    return compare_implementations(
-        tf_times,
-        cf_times,
-        metric_name="load_time",
-        unit="s",
-        metric_type="time",
-    )
+    return _load_time_comparison(_Columns(result.measurements))
 
 
 def compare_latency_results(
@@ -92,91 +211,96 @@ def compare_latency_results(
     Returns:
         ComparisonResult with latency comparison statistics
     """
-    tf_measurements = [
-        m.execution_time_ms
-        for m in result.measurements
-        if m.implementation == "TF" and m.success
-    ]
-    cf_measurements = [
-        m.execution_time_ms
-        for m in result.measurements
-        if m.implementation == "CF" and m.success
-    ]
+    columns = _Columns(result.measurements)
+    if not category:
+        return _latency_comparison(columns)
+    query_ids = _category_index(result.queries).get(category, frozenset())
+    return _latency_comparison(columns, category, query_ids)
+
+
+def compare_all(
+    memory_result: MemoryBenchmarkResult | None = None,
+    latency_result: LatencyBenchmarkResult | None = None,
+    modes: list[Literal["single", "spawn", "fork"]] | None = None,
+    categories: list[str] | None = None,
+    max_workers: int | None = None,
+) -> dict[str, ComparisonResult]:
+    """Run every TF vs CF comparison for a set of results concurrently.
+
+    The comparisons are independent, and their numpy reductions and SciPy
+    calls release the GIL, so they run on a thread pool; threads also
+    share the measurement columns, extracted once per result, which
+    processes could not.
 
-    if category:
-        # Filter by category using pattern mapping
-        query_ids_in_category = {
-            p.id for p in result.queries if p.category == category
-        }
-        tf_measurements = [
-            m.execution_time_ms
-            for m in result.measurements
-            if m.implementation == "TF"
-            and m.success
-            and m.query_id in query_ids_in_category
-        ]
-        cf_measurements = [
-            m.execution_time_ms
-            for m in result.measurements
-            if m.implementation == "CF"
-            and m.success
-            and m.query_id in query_ids_in_category
-        ]
-
-    metric_name = f"latency_{category}" if category else "latency_overall"
-
-    return compare_implementations(
-        tf_measurements,
-        cf_measurements,
-        metric_name=metric_name,
-        unit="ms",
-        metric_type="time",
-    )
+    Args:
+        memory_result: Memory benchmark result to compare per mode, plus
+            load times
+        latency_result: Latency benchmark result to compare overall and
+            per category
+        modes: Memory modes to compare (default: all three)
+        categories: Query categories to compare (default: the categories
+            of the result's queries)
+        max_workers: Thread pool size (default: ThreadPoolExecutor's)
 
+    Returns:
+        Comparisons keyed by metric name
 
-def compute_latency_stats_by_query(
-    measurements: list[QueryMeasurement],
-    query_id: str,
+    Raises:
+        ValueError: If a category is empty or "overall", whose metric name
+            would overwrite the overall latency comparison
+    """
+    jobs: list[tuple[Any, ...]] = []
+    if memory_result is not None:
+        memory_columns = _Columns(memory_result.measurements)
+        for mode in modes or ["single", "spawn", "fork"]:
+            jobs.append((_memory_comparison, memory_columns, mode))
+        jobs.append((_load_time_comparison, memory_columns))
+    if latency_result is not None:
+        latency_columns = _Columns(latency_result.measurements)
+        index = _category_index(latency_result.queries)
+        jobs.append((_latency_comparison, latency_columns))
+        if categories is None:
+            categories = sorted(index)
+        for category in categories:
+            if not category or category == "overall":
+                raise ValueError(
+                    f"Category {category!r} collides with the overall latency comparison"
+                )
+            query_ids = index.get(category, frozenset())
+            jobs.append((_latency_comparison, latency_columns, category, query_ids))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        comparisons = list(pool.map(lambda job: job[0](*job[1:]), jobs))
+    return {c.metric_name: c for c in comparisons}
+
+
+def _latency_statistics(
+    columns: _Columns,
+    rows: np.ndarray,
     implementation: Literal["TF", "CF"],
+    metric_name: str,
+    **labels: str,
 ) -> LatencyStatistics:
-    """Compute latency statistics for a specific pattern and implementation.
+    """Build latency statistics for one implementation's runs of a selection.
 
     Args:
-        measurements: All query measurements
-        query_id: Pattern ID to filter by
+        columns: Columns of all query measurements
+        rows: Positions of the selected queries' measurements
         implementation: Implementation to filter by
+        metric_name: Name for the underlying summary
+        labels: `query_id` or `category` of the selection
 
     Returns:
-        LatencyStatistics for the pattern
+        LatencyStatistics; all zeros when there are no successful runs
     """
-    filtered = [
-        m
-        for m in measurements
-        if m.query_id == query_id and m.implementation == implementation
-    ]
-
-    successful = [m for m in filtered if m.success]
-    times = [m.execution_time_ms for m in successful]
-
-    if not times:
-        return LatencyStatistics(
-            query_id=query_id,
-            implementation=implementation,
-            mean_ms=0.0,
-            std_ms=0.0,
-            min_ms=0.0,
-            max_ms=0.0,
-            p50_ms=0.0,
-            p95_ms=0.0,
-            p99_ms=0.0,
-            sample_count=0,
-            error_count=len(filtered) - len(successful),
-        )
-
-    summary = compute_summary(times, f"latency_{query_id}", "ms")
+    impl, success, all_times = columns.get("implementation", "success", "execution_time_ms")
+    rows = rows[impl[rows] == implementation]
+    times = all_times[rows[success[rows]]]
+    error_count = len(rows) - len(times)
+    summary = compute_summary(times, metric_name, "ms")
 
     return LatencyStatistics(
-        query_id=query_id,
+        **labels,
         implementation=implementation,
         mean_ms=summary.mean,
         std_ms=summary.std,
@@ -185,11 +309,61 @@ def compute_latency_stats_by_query(
         p50_ms=summary.p50,
         p95_ms=summary.p95,
         p99_ms=summary.p99,
-        sample_count=len(successful),
-        error_count=len(filtered) - len(successful),
+        sample_count=summary.n,
+        error_count=error_count,
     )
 
 
+def compute_latency_stats_by_query(
+    measurements: list[QueryMeasurement],
+    query_id: str,
+    implementation: Literal["TF", "CF"],
+) -> LatencyStatistics:
+    """Compute latency statistics for a specific pattern and implementation.
+
+    Args:
+        measurements: All query measurements
+        query_id: Pattern ID to filter by
+        implementation: Implementation to filter by
+
+    Returns:
+        LatencyStatistics for the pattern
+    """
+    (stats,) = compute_latency_stats_by_queries(measurements, [query_id], [implementation])
+    return stats
+
+
+def compute_latency_stats_by_queries(
+    measurements: list[QueryMeasurement],
+    query_ids: Iterable[str],
+    implementations: Iterable[Literal["TF", "CF"]] = ("TF", "CF"),
+) -> list[LatencyStatistics]:
+    """Compute latency statistics for several patterns at once.
+
+    Measurement fields are extracted once for all patterns, instead of
+    once per call of compute_latency_stats_by_query.
+
+    Args:
+        measurements: All query measurements
+        query_ids: Pattern IDs
+        implementations: Implementations to compute statistics for
+
+    Returns:
+        LatencyStatistics per pattern and implementation, ordered by
+        pattern, then implementation
+    """
+    columns = _Columns(measurements)
+    implementations = list(implementations)
+    statistics = []
+    for query_id in query_ids:
+        rows = columns.query_rows([query_id])
+        for implementation in implementations:
+            statistics.append(_latency_statistics(
+                columns, rows, implementation, f"latency_{query_id}", query_id=query_id
+            ))
+    return statistics
+
+
 def compute_latency_stats_by_category(
     measurements: list[QueryMeasurement],
     queries: list,  # list[SearchPattern]
@@ -207,47 +381,50 @@ def compute_latency_stats_by_category(
     Returns:
         LatencyStatistics for the category
     """
-    query_ids = {p.id for p in queries if p.category == category}
-
-    filtered = [
-        m
-        for m in measurements
-        if m.query_id in query_ids and m.implementation == implementation
-    ]
-
-    successful = [m for m in filtered if m.success]
-    times = [m.execution_time_ms for m in successful]
-
-    if not times:
-        return LatencyStatistics(
-            category=category,
-            implementation=implementation,
-            mean_ms=0.0,
-            std_ms=0.0,
-            min_ms=0.0,
-            max_ms=0.0,
-            p50_ms=0.0,
-            p95_ms=0.0,
-            p99_ms=0.0,
-            sample_count=0,
-            error_count=len(filtered) - len(successful),
-        )
-
-    summary = compute_summary(times, f"latency_{category}", "ms")
-
-    return LatencyStatistics(
-        category=category,
-        implementation=implementation,
-        mean_ms=summary.mean,
-        std_ms=summary.std,
-        min_ms=summary.min,
-        max_ms=summary.max,
-        p50_ms=summary.p50,
-        p95_ms=summary.p95,
-        p99_ms=summary.p99,
-        sample_count=len(successful),
-        error_count=len(filtered) - len(successful),
+    (stats,) = compute_latency_stats_by_categories(
+        measurements, queries, [category], [implementation]
     )
+    return stats
+
+
+def compute_latency_stats_by_categories(
+    measurements: list[QueryMeasurement],
+    queries: list,  # list[SearchPattern]
+    categories: Iterable[str],
+    implementations: Iterable[Literal["TF", "CF"]] = ("TF", "CF"),
+) -> list[LatencyStatistics]:
+    """Compute latency statistics for several categories at once.
+
+    Args:
+        measurements: All query measurements
+        queries: All search queries
+        categories: Categories to compute statistics for
+        implementations: Implementations to compute statistics for
+
+    Returns:
+        LatencyStatistics per category and implementation, ordered by
+        category, then implementation
+    """
+    columns = _Columns(measurements)
+    index = _category_index(queries)
+    implementations = list(implementations)
+    statistics = []
+    for category in categories:
+        rows = columns.query_rows(index.get(category, frozenset()))
+        for implementation in implementations:
+            statistics.append(_latency_statistics(
+                columns, rows, implementation, f"latency_{category}", category=category
+            ))
+    return statistics
+
+
+# Fixed part of format_comparison_summary, formatted in a single call
+_SUMMARY_TEMPLATE = "\n".join([
+    "Comparison: {name}",
+    "-" * 40,
+    "TF: mean={tf_mean:.2f} {tf_unit} (std={tf_std:.2f}, n={tf_n})",
+    "CF: mean={cf_mean:.2f} {cf_unit} (std={cf_std:.2f}, n={cf_n})",
+])
 
 
 def format_comparison_summary(comparison: ComparisonResult) -> str:
@@ -259,24 +436,26 @@ def format_comparison_summary(comparison: ComparisonResult) -> str:
     Returns:
         Formatted string summary
     """
-    lines = [f"Comparison: {comparison.metric_name}"]
-    lines.append("-" * 40)
-    lines.append(
-        f"TF: mean={comparison.tf_stats.mean:.2f} {comparison.tf_stats.unit} "
-        f"(std={comparison.tf_stats.std:.2f}, n={comparison.tf_stats.n})"
-    )
-    lines.append(
-        f"CF: mean={comparison.cf_stats.mean:.2f} {comparison.cf_stats.unit} "
-        f"(std={comparison.cf_stats.std:.2f}, n={comparison.cf_stats.n})"
+    tf, cf = comparison.tf_stats, comparison.cf_stats
+    summary = _SUMMARY_TEMPLATE.format(
+        name=comparison.metric_name,
+        tf_mean=tf.mean,
+        tf_std=tf.std,
+        tf_n=tf.n,
+        tf_unit=tf.unit,
+        cf_mean=cf.mean,
+        cf_std=cf.std,
+        cf_n=cf.n,
+        cf_unit=cf.unit,
     )
 
     if comparison.speedup_factor is not None:
-        lines.append(f"Speedup: {comparison.speedup_factor:.2f}x")
+        summary += f"\nSpeedup: {comparison.speedup_factor:.2f}x"
     if comparison.reduction_percent is not None:
-        lines.append(f"Reduction: {comparison.reduction_percent:.1f}%")
+        summary += f"\nReduction: {comparison.reduction_percent:.1f}%"
 
     if comparison.p_value is not None:
         sig = "significant" if comparison.statistically_significant else "not significant"
-        lines.append(f"P-value: {comparison.p_value:.4f} ({sig})")
+        summary += f"\nP-value: {comparison.p_value:.4f} ({sig})"
 
-    return "\n".join(lines)
+    return summary
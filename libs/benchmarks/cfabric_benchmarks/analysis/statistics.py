@@ -3,89 +3,149 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable, Sized
+from functools import lru_cache
 from typing import Literal
 
 import numpy as np
-from scipy import stats
+from scipy import special
 
 from cfabric_benchmarks.models.statistics import ComparisonResult, StatisticalSummary
 
+# Below this many values compute_summary takes its moments in pure Python
+_SMALL_SAMPLE = 64
+
+# Quantiles reported by compute_summary: min, p25, p50, p75, p90, p95, p99, max
+_SUMMARY_QUANTILES = [0.0, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 1.0]
+
+
+def _as_float_array(values: np.ndarray | Iterable[float]) -> np.ndarray:
+    """Return values as a float64 array, without copying arrays that already are.
+
+    Other iterables are read with ``np.fromiter``, straight into a buffer
+    of the right size when their length is known.
+    """
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    count = len(values) if isinstance(values, Sized) else -1
+    return np.fromiter(values, dtype=np.float64, count=count)
+
+
+@lru_cache(maxsize=1024)
+def _t_critical(confidence: float, df: int) -> float:
+    """Two-sided critical value of Student's t distribution.
+
+    Computed with ``special.stdtrit``, which is what ``stats.t.ppf`` calls,
+    so the slow scipy.stats import is avoided. It is still slow relative
+    to the rest of a summary, and the same few sample sizes recur across
+    every metric of a report.
+    """
+    return float(special.stdtrit(df, 1 - (1 - confidence) / 2))
+
+
+@lru_cache(maxsize=256)
+def _empty_summary(metric_name: str, unit: str) -> StatisticalSummary:
+    """Summary for no data, all zeros.
+
+    Cached per metric; hand out copies, as the model is mutable.
+    """
+    return StatisticalSummary(
+        metric_name=metric_name,
+        unit=unit,
+        mean=0.0,
+        median=0.0,
+        std=0.0,
+        variance=0.0,
+        min=0.0,
+        max=0.0,
+        range=0.0,
+        n=0,
+        ci_lower=0.0,
+        ci_upper=0.0,
+        p25=0.0,
+        p50=0.0,
+        p75=0.0,
+        p90=0.0,
+        p95=0.0,
+        p99=0.0,
+    )
+
 
 def compute_summary(
-    values: list[float],
+    values: np.ndarray | Iterable[float],
     metric_name: str,
     unit: str,
 ) -> StatisticalSummary:
     """Compute comprehensive statistical summary for a set of values.
 
     Args:
-        values: List of measurement values
+        values: Measurement values; float arrays are used without copying
         metric_name: Name of the metric (e.g., "load_time", "memory")
         unit: Unit of measurement (e.g., "ms", "MB", "s")
 
     Returns:
         StatisticalSummary with all computed statistics
     """
-    arr = np.array(values)
+    if isinstance(values, Sized) and len(values) == 0:
+        return _empty_summary(metric_name, unit).model_copy()
+
+    arr = _as_float_array(values)
     n = len(arr)
 
     if n == 0:
-        # Return empty summary for no data
-        return StatisticalSummary(
-            metric_name=metric_name,
-            unit=unit,
-            mean=0.0,
-            median=0.0,
-            std=0.0,
-            variance=0.0,
-            min=0.0,
-            max=0.0,
-            range=0.0,
-            n=0,
-            ci_lower=0.0,
-            ci_upper=0.0,
-            p25=0.0,
-            p50=0.0,
-            p75=0.0,
-            p90=0.0,
-            p95=0.0,
-            p99=0.0,
-        )
-
-    mean = float(np.mean(arr))
-    std = float(np.std(arr, ddof=1)) if n > 1 else 0.0
-    variance = std**2
-
-    # Confidence interval (95%)
-    ci_lower, ci_upper = compute_confidence_interval(arr, confidence=0.95)
-
-    # Percentiles
-    percentiles = compute_percentiles(arr, [25, 50, 75, 90, 95, 99])
+        return _empty_summary(metric_name, unit).model_copy()
+
+    if n < _SMALL_SAMPLE:
+        # Per-query samples are small: correctly rounded Python sums are
+        # both cheaper than numpy's per-call overhead and more accurate
+        # when values span several orders of magnitude
+        vals = arr.tolist()
+        mean = math.fsum(vals) / n
+        variance = math.fsum([(x - mean) ** 2 for x in vals]) / (n - 1) if n > 1 else 0.0
+    else:
+        mean = float(arr.mean())
+        # Reuse the mean for the sum of squared deviations (a BLAS dot
+        # product) rather than letting var() compute it again
+        dev = arr - mean
+        variance = float(dev @ dev) / (n - 1)
+    std = math.sqrt(variance)
+
+    # Confidence interval (95%) from the standard error of the mean, as in
+    # compute_confidence_interval, without another pass over the data
+    if n > 1:
+        margin = _t_critical(0.95, n - 1) * std / math.sqrt(n)
+        ci_lower, ci_upper = mean - margin, mean + margin
+    else:
+        ci_lower = ci_upper = mean
+
+    # Extremes and percentiles from a single partition of the data; tolist()
+    # converts them to Python floats in one call
+    lo, p25, p50, p75, p90, p95, p99, hi = np.quantile(arr, _SUMMARY_QUANTILES).tolist()
 
     return StatisticalSummary(
         metric_name=metric_name,
         unit=unit,
         mean=mean,
-        median=float(np.median(arr)),
+        median=p50,
         std=std,
         variance=variance,
-        min=float(np.min(arr)),
-        max=float(np.max(arr)),
-        range=float(np.max(arr) - np.min(arr)),
+        min=lo,
+        max=hi,
+        range=hi - lo,
         n=n,
         ci_lower=ci_lower,
         ci_upper=ci_upper,
-        p25=percentiles[25],
-        p50=percentiles[50],
-        p75=percentiles[75],
-        p90=percentiles[90],
-        p95=percentiles[95],
-        p99=percentiles[99],
+        p25=p25,
+        p50=p50,
+        p75=p75,
+        p90=p90,
+        p95=p95,
+        p99=p99,
     )
 
 
 def compute_confidence_interval(
-    values: np.ndarray | list[float],
+    values: np.ndarray | Iterable[float],
     confidence: float = 0.95,
 ) -> tuple[float, float]:
     """Compute confidence interval for the mean.
@@ -97,26 +157,22 @@ def compute_confidence_interval(
     Returns:
         Tuple of (lower_bound, upper_bound)
     """
-    arr = np.array(values)
+    arr = _as_float_array(values)
     n = len(arr)
 
     if n < 2:
         mean = float(np.mean(arr)) if n > 0 else 0.0
         return mean, mean
 
-    mean = float(np.mean(arr))
-    std_err = float(stats.sem(arr))
+    mean = float(arr.mean())
+    std_err = math.sqrt(float(arr.var(ddof=1)) / n)
 
-    # t-value for the given confidence level
-    alpha = 1 - confidence
-    t_val = stats.t.ppf(1 - alpha / 2, df=n - 1)
-
-    margin = t_val * std_err
+    margin = _t_critical(confidence, n - 1) * std_err
     return mean - margin, mean + margin
 
 
 def compute_percentiles(
-    values: np.ndarray | list[float],
+    values: np.ndarray | Iterable[float],
     percentiles: list[int],
 ) -> dict[int, float]:
     """Compute multiple percentiles.
@@ -128,19 +184,16 @@ def compute_percentiles(
     Returns:
         Dictionary mapping percentile to value
     """
-    arr = np.array(values)
+    arr = _as_float_array(values)
     if len(arr) == 0:
         return {p: 0.0 for p in percentiles}
 
-    result = {}
-    for p in percentiles:
-        result[p] = float(np.percentile(arr, p))
-    return result
+    return dict(zip(percentiles, np.percentile(arr, percentiles).tolist()))
 
 
 def welch_t_test(
-    sample_a: list[float],
-    sample_b: list[float],
+    sample_a: np.ndarray | list[float],
+    sample_b: np.ndarray | list[float],
 ) -> tuple[float, float]:
     """Perform Welch's t-test for independent samples.
 
@@ -156,17 +209,118 @@ def welch_t_test(
     if len(sample_a) < 2 or len(sample_b) < 2:
         return 0.0, 1.0
 
-    t_stat, p_value = stats.ttest_ind(sample_a, sample_b, equal_var=False)
-    return float(t_stat), float(p_value)
+    a = _as_float_array(sample_a)
+    b = _as_float_array(sample_b)
+    return welch_t_test_from_moments(
+        float(a.mean()),
+        float(a.var(ddof=1)),
+        len(a),
+        float(b.mean()),
+        float(b.var(ddof=1)),
+        len(b),
+    )
+
+
+def welch_t_test_from_moments(
+    mean_a: float,
+    var_a: float,
+    n_a: int,
+    mean_b: float,
+    var_b: float,
+    n_b: int,
+) -> tuple[float, float]:
+    """Perform Welch's t-test from the sample means and variances.
+
+    Lets callers that already summarised both samples run the test without
+    another pass over the data.
+
+    Args:
+        mean_a: Mean of the first sample
+        var_a: Variance (ddof=1) of the first sample
+        n_a: Size of the first sample
+        mean_b: Mean of the second sample
+        var_b: Variance (ddof=1) of the second sample
+        n_b: Size of the second sample
+
+    Returns:
+        Tuple of (t_statistic, p_value)
+    """
+    if n_a < 2 or n_b < 2:
+        return 0.0, 1.0
+
+    # Same result as stats.ttest_ind(..., equal_var=False), without its
+    # argument handling, which dominates on benchmark-sized samples
+    diff = mean_a - mean_b
+    se_a = var_a / n_a
+    se_b = var_b / n_b
+    se = se_a + se_b
+
+    if se == 0.0:
+        # No spread at all: the test is undefined for equal means and
+        # infinitely significant otherwise
+        if diff == 0.0:
+            return math.nan, math.nan
+        return math.copysign(math.inf, diff), 0.0
+
+    t_stat = diff / math.sqrt(se)
+    # Welch-Satterthwaite degrees of freedom
+    df = se**2 / (se_a**2 / (n_a - 1) + se_b**2 / (n_b - 1))
+    p_value = 2 * float(special.stdtr(df, -abs(t_stat)))
+    return t_stat, p_value
+
+
+def paired_t_test(
+    sample_a: np.ndarray | list[float],
+    sample_b: np.ndarray | list[float],
+) -> tuple[float, float]:
+    """Perform a paired t-test on matched samples.
+
+    Tests whether the mean of the pairwise differences is zero. Use it when
+    ``sample_a[i]`` and ``sample_b[i]`` were measured under the same
+    conditions, e.g. TF and CF in the same benchmark run; the run-to-run
+    noise they share then cancels out.
+
+    Args:
+        sample_a: First sample
+        sample_b: Second sample, in the same order as the first
+
+    Returns:
+        Tuple of (t_statistic, p_value)
+
+    Raises:
+        ValueError: If the samples differ in length
+    """
+    if len(sample_a) != len(sample_b):
+        raise ValueError(
+            f"Paired samples must have equal length, got {len(sample_a)} and {len(sample_b)}"
+        )
+    n = len(sample_a)
+    if n < 2:
+        return 0.0, 1.0
+
+    # Same result as stats.ttest_rel, computed on the differences directly
+    diffs = _as_float_array(sample_a) - _as_float_array(sample_b)
+    mean = float(diffs.mean())
+    se = float(diffs.var(ddof=1)) / n
+
+    if se == 0.0:
+        if mean == 0.0:
+            return math.nan, math.nan
+        return math.copysign(math.inf, mean), 0.0
+
+    t_stat = mean / math.sqrt(se)
+    p_value = 2 * float(special.stdtr(n - 1, -abs(t_stat)))
+    return t_stat, p_value
 
 
 def compare_implementations(
-    tf_values: list[float],
-    cf_values: list[float],
+    tf_values: np.ndarray | list[float],
+    cf_values: np.ndarray | list[float],
     metric_name: str,
     unit: str,
     metric_type: Literal["time", "memory", "other"] = "other",
     significance_level: float = 0.05,
+    paired: bool = False,
 ) -> ComparisonResult:
     """Compare TF and CF measurements for a metric.
 
@@ -177,15 +331,34 @@ def compare_implementations(
         unit: Unit of measurement
         metric_type: Type of metric for computing comparison ratios
         significance_level: P-value threshold for statistical significance
+        paired: The i-th TF and CF values were measured together (same run),
+            so test them with a paired t-test instead of Welch's test
 
     Returns:
         ComparisonResult with statistics, comparison metrics, and effect size
+
+    Raises:
+        ValueError: If `paired` is set and the samples differ in length
     """
+    if paired:
+        tf_values = _as_float_array(tf_values)
+        cf_values = _as_float_array(cf_values)
+
     tf_stats = compute_summary(tf_values, f"{metric_name}_TF", unit)
     cf_stats = compute_summary(cf_values, f"{metric_name}_CF", unit)
 
-    # Statistical test
-    t_stat, p_value = welch_t_test(tf_values, cf_values)
+    if paired:
+        t_stat, p_value = paired_t_test(tf_values, cf_values)
+    else:
+        # Statistical test, from the moments the summaries already hold
+        t_stat, p_value = welch_t_test_from_moments(
+            tf_stats.mean,
+            tf_stats.variance,
+            tf_stats.n,
+            cf_stats.mean,
+            cf_stats.variance,
+            cf_stats.n,
+        )
     significant = p_value < significance_level
 
     # Compute comparison metrics based on type
@@ -243,6 +416,9 @@ def linear_regression(
     Returns:
         Tuple of (slope, intercept, r_squared)
     """
+    # scipy.stats takes longer to import than everything else here together
+    from scipy import stats
+
     x_arr = np.array(x)
     y_arr = np.array(y)
 
@@ -269,16 +445,26 @@ def aggregate_runs(
     if not measurements:
         return [], []
 
-    # Transpose to get values per step
+    # One row per run, reduced over the run axis
     num_steps = len(measurements[0])
-    step_values = [[] for _ in range(num_steps)]
-
-    for run in measurements:
-        for i, val in enumerate(run):
-            if i < num_steps:
-                step_values[i].append(val)
-
-    means = [float(np.mean(vals)) for vals in step_values]
-    stds = [float(np.std(vals, ddof=1)) if len(vals) > 1 else 0.0 for vals in step_values]
-
-    return means, stds
+    if all(len(run) == num_steps for run in measurements):
+        arr = np.asarray(measurements, dtype=np.float64).reshape(len(measurements), num_steps)
+        means = arr.mean(axis=0)
+        stds = arr.std(axis=0, ddof=1) if len(arr) > 1 else np.zeros(num_steps)
+        return means.tolist(), stds.tolist()
+
+    # Ragged runs: pad shorter ones with NaN and cut longer ones to the
+    # length of the first, so each step only counts the runs that reached it
+    arr = np.full((len(measurements), num_steps), np.nan)
+    for row, run in zip(arr, measurements):
+        values = run[:num_steps]
+        row[: len(values)] = values
+
+    counts = np.count_nonzero(~np.isnan(arr), axis=0)
+    means = np.nanmean(arr, axis=0)
+    stds = np.zeros(num_steps)
+    spread = counts > 1
+    if spread.any():
+        stds[spread] = np.nanstd(arr[:, spread], axis=0, ddof=1)
+
+    return means.tolist(), stds.tolist()
@@ -2,28 +2,15 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Literal
 
 import click
 
-from cfabric_benchmarks.models.config import (
-    BenchmarkConfig,
-    CorpusConfig,
-    discover_corpora,
-    get_corpora_by_size,
-)
-from cfabric_benchmarks.output.csv_writer import (
-    write_cross_corpus_summary_csv,
-    write_latency_measurements_csv,
-    write_latency_statistics_csv,
-    write_memory_measurements_csv,
-    write_memory_summary_csv,
-    write_progressive_steps_csv,
-)
-from cfabric_benchmarks.output.metadata import collect_environment
+# Everything beyond click is imported inside the commands that need it, so
+# that --help and light commands do not pay for pandas, matplotlib and the
+# runners.
 
 
 def get_default_corpora_dir() -> Path:
@@ -32,11 +19,13 @@ def get_default_corpora_dir() -> Path:
     return package_dir / "corpora"
 
 
-def create_output_dir(base_dir: Path) -> Path:
-    """Create timestamped output directory."""
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-    output_dir = base_dir / timestamp
-    output_dir.mkdir(parents=True, exist_ok=True)
+def create_output_dir(base_dir: Path, subdirs: tuple[str, ...] = ()) -> Path:
+    """Create a new timestamped output directory and its subdirectories."""
+    from cfabric_benchmarks.output.metadata import create_run_directory
+
+    output_dir = create_run_directory(base_dir)
+    for name in subdirs:
+        (output_dir / name).mkdir()
     return output_dir
 
 
@@ -113,6 +102,37 @@ def cli() -> None:
     show_default=True,
 )
 @click.option("--no-pdf", is_flag=True, help="Skip PDF chart generation")
+@click.option(
+    "--cf-prefault",
+    is_flag=True,
+    help="Include paging in CF's mmapped arrays in the CF load time",
+)
+@click.option(
+    "--cf-prefault-threads",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Threads used by --cf-prefault to page in arrays concurrently",
+    show_default=True,
+)
+@click.option(
+    "--no-warm-cache",
+    is_flag=True,
+    help="Do not read corpus caches into the page cache before timed loads",
+)
+@click.option(
+    "--spawn-context",
+    type=click.Choice(["spawn", "forkserver"]),
+    default="spawn",
+    help="Start method for spawn-mode workers (forkserver preloads TF and CF once)",
+    show_default=True,
+)
+@click.option(
+    "--parallel-corpora",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Corpora to memory-benchmark concurrently (skews measurements above 1)",
+    show_default=True,
+)
 def full(
     memory_runs: int,
     latency_runs: int,
@@ -125,8 +145,28 @@ def full(
     iterations: int,
     max_corpora: int,
     no_pdf: bool,
+    cf_prefault: bool,
+    cf_prefault_threads: int,
+    no_warm_cache: bool,
+    spawn_context: str,
+    parallel_corpora: int,
 ) -> None:
     """Run full benchmark suite (memory, latency, progressive)."""
+    from cfabric_benchmarks.models.config import (
+        BenchmarkConfig,
+        corpus_size_rank,
+        discover_corpora,
+    )
+    from cfabric_benchmarks.output.csv_writer import (
+        write_cross_corpus_summary_csv,
+        write_latency_measurements_csv,
+        write_latency_statistics_csv,
+        write_memory_measurements_csv,
+        write_memory_summary_csv,
+        write_progressive_steps_csv,
+    )
+    from cfabric_benchmarks.output.json_writer import write_json
+    from cfabric_benchmarks.output.metadata import collect_environment
     from cfabric_benchmarks.runners.latency import LatencyBenchmarkRunner
     from cfabric_benchmarks.runners.memory import MemoryBenchmarkRunner
     from cfabric_benchmarks.runners.progressive import ProgressiveLoadRunner
@@ -136,7 +176,7 @@ def full(
     )
 
     corpora_dir = corpora_dir or get_default_corpora_dir()
-    output_dir = create_output_dir(output_dir)
+    output_dir = create_output_dir(output_dir, subdirs=("memory", "progressive", "latency"))
 
     click.echo(f"Running full benchmark suite")
     click.echo(f"  Memory runs: {memory_runs}, Latency runs: {latency_runs}, Progressive runs: {progressive_runs}")
@@ -156,20 +196,25 @@ def full(
         latency_iterations=iterations,
         max_corpora=max_corpora,
         generate_pdf=not no_pdf,
+        cf_prefault=cf_prefault,
+        cf_prefault_threads=cf_prefault_threads,
+        warm_cache=not no_warm_cache,
+        spawn_context=spawn_context,
+        parallel_corpora=parallel_corpora,
     )
 
     # Save config
-    with open(output_dir / "config.json", "w") as f:
-        json.dump(config.model_dump(mode="json"), f, indent=2, default=str)
+    write_json(config, output_dir / "config.json")
 
-    # Collect environment metadata
+    # Collect environment metadata while the corpora are discovered; both
+    # mostly wait on /proc, subprocesses and the file system
     click.echo("\nCollecting environment metadata...")
-    env_meta = collect_environment()
-    with open(output_dir / "environment.json", "w") as f:
-        json.dump(env_meta.model_dump(mode="json"), f, indent=2)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        env_future = pool.submit(collect_environment)
+        corpora = discover_corpora(corpora_dir)
+        env_meta = env_future.result()
+    write_json(env_meta, output_dir / "environment.json")
 
-    # Discover corpora
-    corpora = discover_corpora(corpora_dir)
     if not corpora:
         click.echo(f"No corpora found in {corpora_dir}", err=True)
         return
@@ -182,25 +227,37 @@ def full(
     click.echo("=" * 60)
 
     memory_dir = output_dir / "memory"
-    memory_dir.mkdir(exist_ok=True)
+
+    # Result files are written by a background thread, so the next benchmark
+    # starts while the previous results are still being written. The writers
+    # only read finished results. Memory and progressive runs measure in
+    # subprocesses; latency times queries in this process, so pending writes
+    # are drained before it starts.
+    writer = ThreadPoolExecutor(max_workers=1)
+    writes: list[Future] = []
 
     memory_runner = MemoryBenchmarkRunner(config)
     memory_results = []
 
-    for corpus in corpora:
-        click.echo(f"\nBenchmarking {corpus.name}...")
-        result = memory_runner.run(corpus)
+    for corpus, result in zip(corpora, memory_runner.run_many(corpora)):
         memory_results.append(result)
 
         # Write per-corpus CSV
-        write_memory_measurements_csv(
+        writes.append(writer.submit(
+            write_memory_measurements_csv,
             result.measurements,
             memory_dir / f"raw_{corpus.name}.csv",
-        )
+        ))
 
     # Write summary CSV
-    write_memory_summary_csv(memory_results, memory_dir / "summary.csv")
-    write_cross_corpus_summary_csv(memory_results, memory_dir / "cross_corpus_summary.csv")
+    writes.append(writer.submit(
+        write_memory_summary_csv, memory_results, memory_dir / "summary.csv"
+    ))
+    writes.append(writer.submit(
+        write_cross_corpus_summary_csv,
+        memory_results,
+        memory_dir / "cross_corpus_summary.csv",
+    ))
 
     # Progressive loading
     click.echo("\n" + "=" * 60)
@@ -208,23 +265,24 @@ def full(
     click.echo("=" * 60)
 
     progressive_dir = output_dir / "progressive"
-    progressive_dir.mkdir(exist_ok=True)
 
     progressive_runner = ProgressiveLoadRunner(config)
     progressive_result = progressive_runner.run(corpora, max_corpora=max_corpora)
 
-    write_progressive_steps_csv(
+    writes.append(writer.submit(
+        write_progressive_steps_csv,
         progressive_result.steps,
         progressive_dir / "raw_steps.csv",
-    )
+    ))
 
     if progressive_result.tf_scaling or progressive_result.cf_scaling:
         scaling_data = {
-            "tf": progressive_result.tf_scaling.model_dump() if progressive_result.tf_scaling else None,
-            "cf": progressive_result.cf_scaling.model_dump() if progressive_result.cf_scaling else None,
+            "tf": progressive_result.tf_scaling,
+            "cf": progressive_result.cf_scaling,
         }
-        with open(progressive_dir / "scaling_analysis.json", "w") as f:
-            json.dump(scaling_data, f, indent=2)
+        writes.append(writer.submit(
+            write_json, scaling_data, progressive_dir / "scaling_analysis.json"
+        ))
 
     # Latency benchmarks
     click.echo("\n" + "=" * 60)
@@ -232,20 +290,19 @@ def full(
     click.echo("=" * 60)
 
     latency_dir = output_dir / "latency"
-    latency_dir.mkdir(exist_ok=True)
 
     # Find validation corpus (cuc or smallest available)
-    sorted_corpora = get_corpora_by_size(corpora)
-    validation_corpus = sorted_corpora[0] if sorted_corpora else None
+    validation_corpus = min(corpora, key=corpus_size_rank, default=None)
 
-    # Use largest corpus for latency test
-    target_corpus = sorted_corpora[-1] if sorted_corpora else None
+    # Use largest corpus for latency test (the last one listed on ties)
+    target_corpus = max(reversed(corpora), key=corpus_size_rank, default=None)
 
     if target_corpus:
         click.echo(f"\nRunning latency benchmark on {target_corpus.name}...")
         if validation_corpus and validation_corpus.name != target_corpus.name:
             click.echo(f"  Validating patterns on {validation_corpus.name} first")
 
+        wait(writes)
         latency_runner = LatencyBenchmarkRunner(config)
         latency_result = latency_runner.run(
             target_corpus,
@@ -253,18 +310,20 @@ def full(
         )
 
         # Save patterns
-        patterns_data = [p.model_dump() for p in latency_result.queries]
-        with open(latency_dir / "queries.json", "w") as f:
-            json.dump(patterns_data, f, indent=2)
+        writes.append(writer.submit(
+            write_json, latency_result.queries, latency_dir / "queries.json"
+        ))
 
-        write_latency_measurements_csv(
+        writes.append(writer.submit(
+            write_latency_measurements_csv,
             latency_result.measurements,
             latency_dir / "raw_measurements.csv",
-        )
-        write_latency_statistics_csv(
+        ))
+        writes.append(writer.submit(
+            write_latency_statistics_csv,
             latency_result.statistics,
             latency_dir / "statistics.csv",
-        )
+        ))
     else:
         latency_result = None
         click.echo("No corpus available for latency benchmark")
@@ -289,6 +348,11 @@ def full(
             progressive_result=progressive_result,
         )
 
+    # Wait for the result files; result() re-raises any write error
+    writer.shutdown(wait=True)
+    for write in writes:
+        write.result()
+
     click.echo("\n" + "=" * 60)
     click.echo(f"COMPLETE - Results saved to {output_dir}")
     click.echo("=" * 60)
@@ -312,6 +376,37 @@ def full(
     help="Output directory",
     show_default=True,
 )
+@click.option(
+    "--cf-prefault",
+    is_flag=True,
+    help="Include paging in CF's mmapped arrays in the CF load time",
+)
+@click.option(
+    "--cf-prefault-threads",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Threads used by --cf-prefault to page in arrays concurrently",
+    show_default=True,
+)
+@click.option(
+    "--no-warm-cache",
+    is_flag=True,
+    help="Do not read corpus caches into the page cache before timed loads",
+)
+@click.option(
+    "--spawn-context",
+    type=click.Choice(["spawn", "forkserver"]),
+    default="spawn",
+    help="Start method for spawn-mode workers (forkserver preloads TF and CF once)",
+    show_default=True,
+)
+@click.option(
+    "--parallel-corpora",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Corpora to benchmark concurrently (skews measurements above 1)",
+    show_default=True,
+)
 def memory(
     corpus: tuple[str, ...],
     runs: int,
@@ -319,8 +414,20 @@ def memory(
     workers: int,
     corpora_dir: Path | None,
     output_dir: Path,
+    cf_prefault: bool,
+    cf_prefault_threads: int,
+    no_warm_cache: bool,
+    spawn_context: str,
+    parallel_corpora: int,
 ) -> None:
     """Run memory benchmarks only."""
+    from cfabric_benchmarks.models.config import BenchmarkConfig, discover_corpora
+    from cfabric_benchmarks.output.csv_writer import (
+        write_all,
+        write_cross_corpus_summary_csv,
+        write_memory_measurements_csv,
+        write_memory_summary_csv,
+    )
     from cfabric_benchmarks.runners.memory import MemoryBenchmarkRunner
     from cfabric_benchmarks.visualization.charts import create_memory_comparison_chart
 
@@ -333,12 +440,18 @@ def memory(
         corpora_dir=corpora_dir,
         output_dir=output_dir,
         num_workers=workers,
+        cf_prefault=cf_prefault,
+        cf_prefault_threads=cf_prefault_threads,
+        warm_cache=not no_warm_cache,
+        spawn_context=spawn_context,
+        parallel_corpora=parallel_corpora,
     )
 
     # Discover corpora
     all_corpora = discover_corpora(corpora_dir)
     if corpus:
-        corpora_list = [c for c in all_corpora if c.name in corpus]
+        selected = frozenset(corpus)
+        corpora_list = [c for c in all_corpora if c.name in selected]
         if not corpora_list:
             click.echo(f"No matching corpora found. Available: {', '.join(c.name for c in all_corpora)}", err=True)
             return
@@ -350,9 +463,7 @@ def memory(
     runner = MemoryBenchmarkRunner(config)
     results = []
 
-    for c in corpora_list:
-        click.echo(f"\nBenchmarking {c.name}...")
-        result = runner.run(c)
+    for c, result in zip(corpora_list, runner.run_many(corpora_list)):
         results.append(result)
 
         # Write raw data
@@ -365,9 +476,11 @@ def memory(
         create_memory_comparison_chart(result, output_dir / f"fig_memory_{c.name}.pdf")
         create_memory_comparison_chart(result, output_dir / f"fig_memory_{c.name}.png")
 
-    # Write summary
-    write_memory_summary_csv(results, output_dir / "memory_summary.csv")
-    write_cross_corpus_summary_csv(results, output_dir / "cross_corpus_summary.csv")
+    # Write summaries
+    write_all([
+        (write_memory_summary_csv, (results, output_dir / "memory_summary.csv")),
+        (write_cross_corpus_summary_csv, (results, output_dir / "cross_corpus_summary.csv")),
+    ])
 
     click.echo(f"\nResults saved to {output_dir}")
 
@@ -401,6 +514,13 @@ def latency(
     output_dir: Path,
 ) -> None:
     """Run latency benchmarks only."""
+    from cfabric_benchmarks.models.config import BenchmarkConfig, discover_corpora
+    from cfabric_benchmarks.output.csv_writer import (
+        write_all,
+        write_latency_measurements_csv,
+        write_latency_statistics_csv,
+    )
+    from cfabric_benchmarks.output.json_writer import write_json
     from cfabric_benchmarks.queries.curated import get_bhsa_queries
     from cfabric_benchmarks.runners.latency import LatencyBenchmarkRunner
     from cfabric_benchmarks.visualization.charts import (
@@ -432,9 +552,9 @@ def latency(
         click.echo(f"Latency benchmark only supports BHSA corpus (has curated patterns)", err=True)
         return
 
+    # A fresh list on every call, so it can be trimmed in place
     curated_queries = get_bhsa_queries()
-    if queries < len(curated_queries):
-        curated_queries = curated_queries[:queries]
+    del curated_queries[queries:]
     click.echo(f"Using {len(curated_queries)} curated BHSA queries")
 
     click.echo(f"Running latency benchmark on {corpus}")
@@ -443,12 +563,11 @@ def latency(
     result = runner.run(target, queries=curated_queries)
 
     # Save results
-    patterns_data = [p.model_dump() for p in result.queries]
-    with open(output_dir / "queries.json", "w") as f:
-        json.dump(patterns_data, f, indent=2)
-
-    write_latency_measurements_csv(result.measurements, output_dir / "latency_raw.csv")
-    write_latency_statistics_csv(result.statistics, output_dir / "latency_statistics.csv")
+    write_all([
+        (write_json, (result.queries, output_dir / "queries.json")),
+        (write_latency_measurements_csv, (result.measurements, output_dir / "latency_raw.csv")),
+        (write_latency_statistics_csv, (result.statistics, output_dir / "latency_statistics.csv")),
+    ])
 
     # Create charts
     create_latency_distribution_chart(result, output_dir / "fig_latency_distribution.pdf")
@@ -482,6 +601,9 @@ def progressive(
     output_dir: Path,
 ) -> None:
     """Run progressive loading benchmark."""
+    from cfabric_benchmarks.models.config import BenchmarkConfig, discover_corpora
+    from cfabric_benchmarks.output.csv_writer import write_progressive_steps_csv
+    from cfabric_benchmarks.output.json_writer import write_json
     from cfabric_benchmarks.runners.progressive import ProgressiveLoadRunner
     from cfabric_benchmarks.visualization.charts import create_progressive_scaling_chart
 
@@ -510,12 +632,8 @@ def progressive(
     write_progressive_steps_csv(result.steps, output_dir / "progressive_steps.csv")
 
     if result.tf_scaling or result.cf_scaling:
-        scaling_data = {
-            "tf": result.tf_scaling.model_dump() if result.tf_scaling else None,
-            "cf": result.cf_scaling.model_dump() if result.cf_scaling else None,
-        }
-        with open(output_dir / "scaling_analysis.json", "w") as f:
-            json.dump(scaling_data, f, indent=2)
+        scaling_data = {"tf": result.tf_scaling, "cf": result.cf_scaling}
+        write_json(scaling_data, output_dir / "scaling_analysis.json")
 
     # Create chart
     create_progressive_scaling_chart(result, output_dir / "fig_scaling_progressive.pdf")
@@ -544,6 +662,8 @@ def validate_patterns(
 ) -> None:
     """Validate curated BHSA patterns on the BHSA corpus."""
     from cfabric_benchmarks.generators.validator import validate_queries_on_corpus
+    from cfabric_benchmarks.models.config import discover_corpora
+    from cfabric_benchmarks.output.json_writer import write_json
     from cfabric_benchmarks.queries.curated import get_bhsa_queries
     from cfabric_benchmarks.runners.base import load_tf_api
 
@@ -567,33 +687,33 @@ def validate_patterns(
     # Validate
     report = validate_queries_on_corpus(patterns, api, corpus_name="bhsa")
 
+    # Dump each query once; the failure list shares the same dicts
+    dumped_queries = [q.model_dump(mode="json") for q in report.queries]
+    failures = [d for d in dumped_queries if not d["validated"]]
+
     # Show results
-    valid_count = sum(1 for p in report.queries if p.validated)
     click.echo(f"\nValidation Results:")
     click.echo(f"  Total: {report.total_queries}")
-    click.echo(f"  Valid: {valid_count}")
-    click.echo(f"  Invalid: {report.total_queries - valid_count}")
+    click.echo(f"  Valid: {report.validated_count}")
+    click.echo(f"  Invalid: {report.failed_count}")
 
     # Show failures
-    if report.failures:
+    if failures:
         click.echo(f"\nFailed patterns:")
-        for f in report.failures[:10]:  # Show first 10
-            click.echo(f"  - {f.pattern_id}: {f.error_message[:60]}...")
+        for f in failures[:10]:  # Show first 10
+            click.echo(f"  - {f['id']}: {(f['validation_error'] or '')[:60]}...")
 
     # Save results
-    patterns_data = [p.model_dump() for p in report.queries]
-    with open(output_dir / "queries.json", "w") as f:
-        json.dump(patterns_data, f, indent=2)
+    write_json(dumped_queries, output_dir / "queries.json")
 
     report_data = {
-        "corpus": report.corpus_name,
+        "corpus": report.validation_corpus,
         "total": report.total_queries,
-        "valid": valid_count,
-        "invalid": report.total_queries - valid_count,
-        "failures": [f.model_dump() for f in report.failures],
+        "valid": report.validated_count,
+        "invalid": report.failed_count,
+        "failures": failures,
     }
-    with open(output_dir / "validation_report.json", "w") as f:
-        json.dump(report_data, f, indent=2)
+    write_json(report_data, output_dir / "validation_report.json")
 
     click.echo(f"\nResults saved to {output_dir}")
 
@@ -624,11 +744,13 @@ def visualize(results_dir: Path, format: Literal["pdf", "png", "both"], charts:
         create_multi_corpus_memory_chart,
         create_progressive_scaling_chart,
     )
+    from cfabric_benchmarks.visualization.reports import render_charts
 
     chart_types = {c.strip().lower() for c in charts.split(",")}
     click.echo(f"Loading results from {results_dir}...")
 
-    created: list[Path] = []
+    # Charts are collected first and rendered together in worker processes
+    tasks = []
 
     # Progressive chart
     if "progressive" in chart_types:
@@ -637,8 +759,7 @@ def visualize(results_dir: Path, format: Literal["pdf", "png", "both"], charts:
             click.echo("  Loaded progressive results")
             for ext in ["pdf", "png"] if format == "both" else [format]:
                 path = results_dir / f"fig_scaling_progressive.{ext}"
-                create_progressive_scaling_chart(progressive_result, path)
-                created.append(path)
+                tasks.append((create_progressive_scaling_chart, progressive_result, path))
 
     # Multi-corpus memory chart
     if "multicorpus" in chart_types:
@@ -647,8 +768,7 @@ def visualize(results_dir: Path, format: Literal["pdf", "png", "both"], charts:
             click.echo(f"  Loaded {len(memory_results)} memory results")
             for ext in ["pdf", "png"] if format == "both" else [format]:
                 path = results_dir / f"fig_memory_multicorpus.{ext}"
-                create_multi_corpus_memory_chart(memory_results, path)
-                created.append(path)
+                tasks.append((create_multi_corpus_memory_chart, memory_results, path))
 
     # Latency charts
     if "latency" in chart_types:
@@ -661,15 +781,17 @@ def visualize(results_dir: Path, format: Literal["pdf", "png", "both"], charts:
                     (create_latency_percentiles_chart, "fig_latency_percentiles"),
                 ]:
                     path = results_dir / f"{name}.{ext}"
-                    chart_func(latency_result, path)
-                    created.append(path)
+                    tasks.append((chart_func, latency_result, path))
 
-    click.echo(f"\nCreated {len(created)} chart files in {results_dir}")
+    render_charts(tasks)
+    click.echo(f"\nCreated {len(tasks)} chart files in {results_dir}")
 
 
 @cli.command()
 def environment() -> None:
     """Print test environment information."""
+    from cfabric_benchmarks.output.metadata import collect_environment
+
     env = collect_environment()
 
     click.echo("Test Environment")
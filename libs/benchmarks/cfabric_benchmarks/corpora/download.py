@@ -13,9 +13,18 @@ import os
 import shutil
 import subprocess
 import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+# Clones are network-bound and run as git subprocesses, so threads suffice
+MAX_PARALLEL_DOWNLOADS = 10
+
+# File copies kept in flight at once; the copy syscalls release the GIL,
+# so this is the I/O queue depth seen by the device
+MAX_PARALLEL_COPIES = 8
+
 # Configuration for each corpus
 CORPORA: dict[str, dict[str, str]] = {
     "bhsa": {
@@ -81,14 +90,72 @@ CORPORA: dict[str, dict[str, str]] = {
 }
 
 
+def _copy_file(src: str, dst: Path, size: int) -> None:
+    """Copy file contents in the kernel where possible.
+
+    Tries copy_file_range (zero-copy, reflinks on some filesystems), then
+    sendfile, then a plain buffered copy.
+    """
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        fd_in, fd_out = fin.fileno(), fout.fileno()
+        for kernel_copy in ("copy_file_range", "sendfile"):
+            copy = getattr(os, kernel_copy, None)
+            if copy is None:
+                continue
+            try:
+                copied = 0
+                while copied < size:
+                    if kernel_copy == "sendfile":
+                        n = copy(fd_out, fd_in, copied, size - copied)
+                    else:
+                        n = copy(fd_in, fd_out, size - copied, copied, copied)
+                    if n == 0:
+                        break
+                    copied += n
+                return
+            except OSError:
+                # EXDEV, ENOSYS, EINVAL...: try the next method from scratch,
+                # rewinding first as a partial copy may have moved the offset
+                fout.seek(0)
+                fout.truncate(0)
+        fin.seek(0)
+        shutil.copyfileobj(fin, fout, 1 << 20)
+
+
+def _copy_tf_file(entry: os.DirEntry, dst: Path) -> None:
+    """Copy one .tf file, keeping its times (TF compares them with its cache)."""
+    st = entry.stat()
+    target = dst / entry.name
+    _copy_file(entry.path, target, st.st_size)
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
 def copy_tf_files(src: Path, dst: Path) -> int:
-    """Copy only .tf files from src to dst, excluding cache dirs."""
+    """Copy only .tf files from src to dst, excluding cache dirs.
+
+    Corpora have up to hundreds of small feature files, so several copies
+    are kept in flight at once rather than waiting on each in turn.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    with os.scandir(src) as entries:
+        tf_files = [e for e in entries if e.name.endswith(".tf") and e.is_file()]
+    if not tf_files:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_COPIES, len(tf_files))) as pool:
+        # list() re-raises the first copy error, if any
+        list(pool.map(_copy_tf_file, tf_files, [dst] * len(tf_files)))
+    return len(tf_files)
+
+
+def move_tf_files(src: Path, dst: Path) -> int:
+    """Move only .tf files from src to dst; both must be on one file system."""
     dst.mkdir(parents=True, exist_ok=True)
     count = 0
-    for tf_file in src.glob("*.tf"):
-        if tf_file.is_file():
-            shutil.copy2(tf_file, dst / tf_file.name)
-            count += 1
+    with os.scandir(src) as entries:
+        for entry in entries:
+            if entry.name.endswith(".tf") and entry.is_file():
+                os.replace(entry.path, dst / entry.name)
+                count += 1
     return count
 
 
@@ -125,49 +192,97 @@ api = TF.loadAll()
 """
 
 
-def download_from_github(repo: str, tf_path: str, dest: Path) -> int:
-    """Clone a GitHub repo and copy TF files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        clone_path = Path(tmpdir) / "repo"
+def download_from_github(
+    repo: str, tf_path: str, dest: Path, log: Callable[[str], None] = print
+) -> int:
+    """Clone a GitHub repo and move its TF files into dest.
 
-        print(f"  Cloning https://github.com/{repo}...")
-        result = subprocess.run(
-            ["git", "clone", "--depth", "1", f"https://github.com/{repo}.git", str(clone_path)],
-            capture_output=True,
-            text=True,
-        )
+    The clone is shallow, blobless and sparse, so only the files under
+    tf_path are fetched (requires git 2.25+). It is made next to dest, so
+    the files can be renamed into place instead of copied.
+    """
+    with tempfile.TemporaryDirectory(dir=dest.parent, prefix=".clone-") as tmpdir:
+        clone_path = Path(tmpdir) / "repo"
 
-        if result.returncode != 0:
-            print(f"  ERROR: Failed to clone {repo}")
-            print(f"  {result.stderr}")
-            return 0
+        log(f"  Cloning https://github.com/{repo}...")
+        for cmd in (
+            [
+                "git", "clone", "--depth", "1", "--filter=blob:none", "--sparse",
+                f"https://github.com/{repo}.git", str(clone_path),
+            ],
+            ["git", "-C", str(clone_path), "sparse-checkout", "set", tf_path],
+        ):
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                log(f"  ERROR: Failed to clone {repo}")
+                log(f"  {result.stderr}")
+                return 0
 
         # Find the TF directory
         src_tf = clone_path / tf_path
         if not src_tf.exists():
-            print(f"  ERROR: TF path not found: {tf_path}")
+            log(f"  ERROR: TF path not found: {tf_path}")
             return 0
 
-        # Copy TF files
-        count = copy_tf_files(src_tf, dest)
-        print(f"  Copied {count} .tf files")
+        count = move_tf_files(src_tf, dest)
+        log(f"  Fetched {count} .tf files")
         return count
 
 
-def copy_from_local(source: str, dest: Path) -> int:
+def copy_from_local(source: str, dest: Path, log: Callable[[str], None] = print) -> int:
     """Copy TF files from a local directory."""
     src_path = Path(source).expanduser()
 
     if not src_path.exists():
-        print(f"  ERROR: Local path not found: {src_path}")
+        log(f"  ERROR: Local path not found: {src_path}")
         return 0
 
     # Copy only .tf files, excluding cache directories
     count = copy_tf_files(src_path, dest)
-    print(f"  Copied {count} .tf files from {src_path}")
+    log(f"  Copied {count} .tf files from {src_path}")
     return count
 
 
+def download_one(
+    corpus_name: str, config: dict, corpora_dir: Path
+) -> tuple[int, list[str]]:
+    """Download one corpus and write its README.
+
+    Output is collected rather than printed, so that concurrent downloads
+    do not interleave their messages.
+
+    Returns:
+        Number of .tf files and the log lines for this corpus
+    """
+    lines = [f"\n[{corpus_name}] {config['description']}"]
+    log = lines.append
+
+    corpus_dir = corpora_dir / corpus_name
+    tf_dir = corpus_dir / "tf"
+
+    # Remove existing corpus directory for fresh download
+    if corpus_dir.exists():
+        shutil.rmtree(corpus_dir)
+
+    tf_dir.mkdir(parents=True, exist_ok=True)
+
+    # Download or copy
+    if "source" in config:
+        count = copy_from_local(config["source"], tf_dir, log)
+    else:
+        count = download_from_github(config["repo"], config["tf_path"], tf_dir, log)
+
+    if count > 0:
+        # Generate README
+        readme_content = generate_readme(corpus_name, config, tf_dir)
+        readme_path = corpus_dir / "README.md"
+        readme_path.write_text(readme_content)
+        log(f"  Created README.md")
+    else:
+        log(f"  SKIPPED: No TF files found")
+    return count, lines
+
+
 def main():
     """Download all corpora."""
     # Output to package root (.corpora at libs/benchmarks/ level)
@@ -181,33 +296,17 @@ def main():
 
     success_count = 0
 
-    for corpus_name, config in CORPORA.items():
-        print(f"\n[{corpus_name}] {config['description']}")
-
-        corpus_dir = corpora_dir / corpus_name
-        tf_dir = corpus_dir / "tf"
-
-        # Remove existing corpus directory for fresh download
-        if corpus_dir.exists():
-            shutil.rmtree(corpus_dir)
-
-        tf_dir.mkdir(parents=True, exist_ok=True)
-
-        # Download or copy
-        if "source" in config:
-            count = copy_from_local(config["source"], tf_dir)
-        else:
-            count = download_from_github(config["repo"], config["tf_path"], tf_dir)
-
-        if count > 0:
-            # Generate README
-            readme_content = generate_readme(corpus_name, config, tf_dir)
-            readme_path = corpus_dir / "README.md"
-            readme_path.write_text(readme_content)
-            print(f"  Created README.md")
-            success_count += 1
-        else:
-            print(f"  SKIPPED: No TF files found")
+    # Report each corpus as soon as it finishes
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DOWNLOADS, len(CORPORA))) as pool:
+        futures = [
+            pool.submit(download_one, corpus_name, config, corpora_dir)
+            for corpus_name, config in CORPORA.items()
+        ]
+        for future in as_completed(futures):
+            count, lines = future.result()
+            print("\n".join(lines), flush=True)
+            if count > 0:
+                success_count += 1
 
     print("\n" + "=" * 60)
     print(f"Download complete: {success_count}/{len(CORPORA)} corpora")
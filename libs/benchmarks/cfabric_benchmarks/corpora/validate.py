@@ -5,24 +5,42 @@ Validate Text-Fabric corpora loading in both Text-Fabric and Context-Fabric.
 Tests each corpus with:
 1. Text-Fabric loading from .tf files
 2. Context-Fabric loading from .tf files (which auto-compiles to .cfm)
-3. Context-Fabric loading from .cfm cache
+3. Context-Fabric .cfm cache check
 
-Also samples feature values from both .tf and .cfm loading paths to verify
-data integrity through the compile/load cycle.
+The cache check compares the counts in the compiled meta.json and a digest of
+the .cfm files against the first Context-Fabric pass, without loading the
+corpus again. With --deep-mmap-check it loads the corpus from the cache
+instead, and samples feature values from both the .tf and .cfm loading paths
+to verify data integrity through the compile/load cycle.
 
-Tests each corpus one at a time to ensure clean memory state and accurate error attribution.
+With --jobs above 1, corpora are validated several at once, each in a fresh
+worker process, so memory state stays clean and errors stay attributed to
+their corpus; --jobs 1 validates them one at a time in this process.
 
 Usage:
     python benchmarks/validate_corpora.py
     python benchmarks/validate_corpora.py --corpus bhsa  # Test single corpus
+    python benchmarks/validate_corpora.py --jobs 1       # One corpus at a time
+    python benchmarks/validate_corpora.py --deep-mmap-check  # Reload from .cfm
 """
 
 import argparse
 import gc
+import hashlib
+import io
+import json
+import mmap
+import multiprocessing as mp
+import os
 import shutil
 import sys
+import threading
 import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -30,26 +48,75 @@ from typing import Any
 sys.path.insert(0, str(Path(__file__).parent.parent / "packages"))
 
 
+# Modules the forkserver imports once for all validate_corpora() workers
+# (missing ones are skipped, and fail in the worker's own load instead)
+WORKER_PRELOAD = ["numpy", "tf.fabric", "cfabric.core.fabric"]
+
+# Errors a feature lookup raises for a node it cannot read; anything else
+# is a bug and propagates
+FEATURE_LOOKUP_ERRORS = (KeyError, IndexError, ValueError)
+
+# Cache directories being deleted in the background by clear_caches()
+_cleanup_threads: list[threading.Thread] = []
+
+# Mapping options for hash_cfm_cache(), which reads every page once; on Linux
+# MAP_POPULATE reads each file in at mmap() time instead of a fault per page
+if hasattr(mmap, "MAP_POPULATE"):
+    _HASH_MMAP_OPTIONS = {"flags": mmap.MAP_SHARED | mmap.MAP_POPULATE, "prot": mmap.PROT_READ}
+else:
+    _HASH_MMAP_OPTIONS = {"access": mmap.ACCESS_READ}
+
+
 def clear_caches(tf_path: Path) -> None:
-    """Clear Text-Fabric and Context-Fabric cache directories."""
+    """Clear Text-Fabric and Context-Fabric cache directories.
+
+    Each cache directory is renamed to a unique sibling first, which is
+    instant and frees the original name for the next load, and the renamed
+    tree is deleted on a background thread. Call wait_for_cache_cleanup()
+    before exiting to make sure the deletions have finished. Renamed trees
+    left behind by an interrupted run are deleted along with them.
+    """
     for cache_name in [".tf", ".cfm"]:
         cache_path = tf_path / cache_name
+        doomed_paths = list(tf_path.glob(f"{cache_name}.del-*"))
         if cache_path.exists():
-            shutil.rmtree(cache_path)
-
-
-@dataclass
+            try:
+                # An empty cache needs no rename or thread
+                cache_path.rmdir()
+            except OSError:
+                doomed = cache_path.with_name(f"{cache_name}.del-{uuid.uuid4().hex}")
+                try:
+                    cache_path.rename(doomed)
+                    doomed_paths.append(doomed)
+                except OSError:
+                    shutil.rmtree(cache_path)
+        for doomed in doomed_paths:
+            thread = threading.Thread(
+                target=shutil.rmtree, args=(doomed,), kwargs={"ignore_errors": True}
+            )
+            thread.start()
+            _cleanup_threads.append(thread)
+
+
+def wait_for_cache_cleanup() -> None:
+    """Wait for background cache deletions started by clear_caches()."""
+    while _cleanup_threads:
+        _cleanup_threads.pop().join()
+
+
+@dataclass(slots=True)
 class FeatureSamples:
     """Sampled feature values for validation."""
 
-    # Dict of feature_name -> list of (node, value) tuples
-    node_samples: dict[str, list[tuple[int, Any]]]
-    edge_samples: dict[str, list[tuple[int, int, Any]]]
-    # List of (node, text) tuples from T.text()
-    text_samples: list[tuple[int, str]]
+    # Dict of feature_name -> {node: value}
+    node_samples: dict[str, dict[int, Any]]
+    # Dict of feature_name -> {(node, target): value}
+    edge_samples: dict[str, dict[tuple[int, int], Any]]
+    # Dict of node -> T.text(node)
+    text_samples: dict[int, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class CorpusStats:
     """Statistics from loading a corpus."""
 
@@ -59,10 +126,14 @@ class CorpusStats:
     node_features: int = 0
     edge_features: int = 0
     samples: FeatureSamples | None = None
+    # Digest of the .cfm cache files, see hash_cfm_cache()
+    cfm_digest: str | None = None
     error: str | None = None
+    # Formatted traceback of the error, printed by print_tracebacks()
+    traceback: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating a single corpus."""
 
@@ -102,6 +173,7 @@ class ValidationResult:
             and self.cf_stats.max_node == self.cf_mmap_stats.max_node
             and self.cf_stats.node_features == self.cf_mmap_stats.node_features
             and self.cf_stats.edge_features == self.cf_mmap_stats.edge_features
+            and self.cf_stats.cfm_digest == self.cf_mmap_stats.cfm_digest
         )
 
     @property
@@ -116,14 +188,12 @@ class ValidationResult:
 
         # Compare node feature samples
         for feat, tf_vals in tf_samples.node_samples.items():
-            cfm_vals = cfm_samples.node_samples.get(feat, [])
-            if tf_vals != cfm_vals:
+            if tf_vals != cfm_samples.node_samples.get(feat, {}):
                 return False
 
         # Compare edge feature samples
         for feat, tf_vals in tf_samples.edge_samples.items():
-            cfm_vals = cfm_samples.edge_samples.get(feat, [])
-            if tf_vals != cfm_vals:
+            if tf_vals != cfm_samples.edge_samples.get(feat, {}):
                 return False
 
         # Compare T.text() samples
@@ -141,26 +211,26 @@ class ValidationResult:
             return mismatches
 
         for feat, tf_vals in tf_samples.node_samples.items():
-            cfm_vals = cfm_samples.node_samples.get(feat, [])
-            if tf_vals != cfm_vals:
+            if tf_vals != cfm_samples.node_samples.get(feat, {}):
                 mismatches.append(f"F.{feat}")
 
         for feat, tf_vals in tf_samples.edge_samples.items():
-            cfm_vals = cfm_samples.edge_samples.get(feat, [])
-            if tf_vals != cfm_vals:
+            if tf_vals != cfm_samples.edge_samples.get(feat, {}):
                 mismatches.append(f"E.{feat}")
 
-        if tf_samples.text_samples != cfm_samples.text_samples:
+        tf_texts = tf_samples.text_samples
+        cfm_texts = cfm_samples.text_samples
+        if tf_texts != cfm_texts:
             mismatches.append("T.text()")
-            # Add detailed text mismatch info
+            # Add detailed text mismatch info, matching samples up by node
             mismatch_count = 0
-            for (tf_node, tf_text), (cfm_node, cfm_text) in zip(
-                tf_samples.text_samples, cfm_samples.text_samples
-            ):
-                if tf_node != cfm_node or tf_text != cfm_text:
+            for node in sorted(tf_texts.keys() | cfm_texts.keys()):
+                tf_text = tf_texts.get(node)
+                cfm_text = cfm_texts.get(node)
+                if tf_text != cfm_text:
                     tf_preview = repr(tf_text[:50]) if tf_text else repr(tf_text)
                     cfm_preview = repr(cfm_text[:50]) if cfm_text else repr(cfm_text)
-                    mismatches.append(f"  node {tf_node}: .tf={tf_preview} vs .cfm={cfm_preview}")
+                    mismatches.append(f"  node {node}: .tf={tf_preview} vs .cfm={cfm_preview}")
                     mismatch_count += 1
                     if mismatch_count >= 5:
                         mismatches.append("  ... (more mismatches)")
@@ -181,41 +251,51 @@ def load_with_text_fabric(tf_path: Path) -> CorpusStats:
         stats.max_slot = api.F.otype.maxSlot
         stats.max_node = api.F.otype.maxNode
         stats.node_types = len(api.F.otype.all)
-        stats.node_features = len([f for f in dir(api.F) if not f.startswith("_")])
-        stats.edge_features = len([f for f in dir(api.E) if not f.startswith("_")])
+        stats.node_features = len(api.Fall())
+        stats.edge_features = len(api.Eall())
 
         del tf, api
         gc.collect()
 
     except Exception as e:
         stats.error = f"{type(e).__name__}: {e}"
-        traceback.print_exc()
+        stats.traceback = traceback.format_exc()
 
     return stats
 
 
-def sample_feature_values(api, sample_size: int = 100) -> FeatureSamples:
+def _python_value(val: Any) -> Any:
+    """Convert numpy scalars to Python values, so samples compare equal."""
+    return val.item() if hasattr(val, "item") else val
+
+
+def sample_feature_values(
+    api,
+    sample_size: int = 100,
+    node_features: list[str] | None = None,
+    edge_features: list[str] | None = None,
+) -> FeatureSamples:
     """Sample feature values from loaded API for validation.
 
     Samples nodes at regular intervals across the corpus to get representative coverage.
+    Callers that already listed the loaded features with Fall()/Eall() can pass those
+    lists; the warp features (otype, oslots) are skipped either way.
     """
-    node_samples: dict[str, list[tuple[int, Any]]] = {}
-    edge_samples: dict[str, list[tuple[int, int, Any]]] = {}
-    text_samples: list[tuple[int, str]] = []
+    node_samples: dict[str, dict[int, Any]] = {}
+    edge_samples: dict[str, dict[tuple[int, int], Any]] = {}
+    text_samples: dict[int, str] = {}
 
-    max_slot = api.F.otype.maxSlot
     max_node = api.F.otype.maxNode
 
     # Sample nodes at regular intervals (slots + non-slots)
-    all_nodes = list(range(1, max_node + 1))
-    step = max(1, len(all_nodes) // sample_size)
-    sample_nodes = all_nodes[::step][:sample_size]
+    # (a stepped range stays lazy instead of listing every node, and yields plain ints)
+    step = max(1, max_node // sample_size)
+    sample_nodes = range(1, max_node + 1, step)[:sample_size]
 
     # Get node feature names (excluding special ones)
-    node_features = [
-        f for f in dir(api.F)
-        if not f.startswith("_") and f not in ("otype", "oslots")
-    ]
+    if node_features is None:
+        node_features = api.Fall()
+    node_features = [name for name in node_features if name != "otype"]
 
     # Sample up to 5 node features
     features_to_sample = node_features[:5]
@@ -224,23 +304,26 @@ def sample_feature_values(api, sample_size: int = 100) -> FeatureSamples:
         feat = getattr(api.F, feat_name, None)
         if feat is None:
             continue
-        samples = []
-        for node in sample_nodes:
-            try:
-                val = feat.v(node)
-                # Convert numpy types to Python types for comparison
-                if hasattr(val, "item"):
-                    val = val.item()
-                samples.append((int(node), val))
-            except Exception:
-                pass
+        v = feat.v
+        # One read-ahead for all sampled pages instead of a fault per node;
+        # values still go through v(), the accessor being validated
+        feat.prefetch(sample_nodes)
+        try:
+            samples = {node: _python_value(v(node)) for node in sample_nodes}
+        except FEATURE_LOOKUP_ERRORS:
+            # Some node failed: sample node by node and skip the failures
+            samples = {}
+            for node in sample_nodes:
+                try:
+                    samples[node] = _python_value(v(node))
+                except FEATURE_LOOKUP_ERRORS:
+                    pass
         node_samples[feat_name] = samples
 
     # Get edge feature names
-    edge_features = [
-        f for f in dir(api.E)
-        if not f.startswith("_") and f not in ("oslots",)
-    ]
+    if edge_features is None:
+        edge_features = api.Eall()
+    edge_features = [name for name in edge_features if name != "oslots"]
 
     # Sample up to 3 edge features
     edge_features_to_sample = edge_features[:3]
@@ -249,18 +332,18 @@ def sample_feature_values(api, sample_size: int = 100) -> FeatureSamples:
         feat = getattr(api.E, feat_name, None)
         if feat is None:
             continue
-        samples = []
+        samples = {}
+        f = feat.f
+        v = getattr(feat, "v", None)
         # Sample edges from our sample nodes
         for node in sample_nodes[:20]:  # Limit edge sampling
             try:
-                targets = feat.f(node)
+                targets = f(node)
                 if targets:
-                    for target in list(targets)[:3]:  # Limit targets per node
+                    for target in islice(targets, 3):  # Limit targets per node
                         # Check if edge has values
-                        val = feat.v(node, target) if hasattr(feat, "v") else None
-                        if hasattr(val, "item"):
-                            val = val.item()
-                        samples.append((int(node), int(target), val))
+                        val = v(node, target) if v is not None else None
+                        samples[node, int(target)] = _python_value(val)
             except Exception:
                 pass
         edge_samples[feat_name] = samples
@@ -268,10 +351,11 @@ def sample_feature_values(api, sample_size: int = 100) -> FeatureSamples:
     # Sample T.text() for a subset of nodes (slots and non-slots)
     # Use fewer samples since T.text() can be slow for large nodes
     text_sample_nodes = sample_nodes[:50]
+    text_of = api.T.text
     for node in text_sample_nodes:
         try:
-            text = api.T.text(node)
-            text_samples.append((int(node), text))
+            text = text_of(node)
+            text_samples[node] = text
         except Exception:
             pass
 
@@ -282,6 +366,26 @@ def sample_feature_values(api, sample_size: int = 100) -> FeatureSamples:
     )
 
 
+def hash_cfm_cache(tf_path: Path) -> str | None:
+    """Digest every file of the .cfm cache, or None if there is no cache.
+
+    Files are hashed through a read-only mmap, so the kernel hands the page
+    cache straight to blake2b without copying the arrays into Python, and
+    the mapping is populated up front where the platform allows it.
+    """
+    cache_dir = tf_path / ".cfm"
+    if not cache_dir.is_dir():
+        return None
+    digest = hashlib.blake2b()
+    for path in sorted(p for p in cache_dir.rglob("*") if p.is_file()):
+        digest.update(str(path.relative_to(cache_dir)).encode())
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, **_HASH_MMAP_OPTIONS) as mm:
+                    digest.update(mm)
+    return digest.hexdigest()
+
+
 def load_with_context_fabric(tf_path: Path, collect_samples: bool = False) -> CorpusStats:
     """Load corpus with Context-Fabric and return stats."""
     stats = CorpusStats()
@@ -294,24 +398,62 @@ def load_with_context_fabric(tf_path: Path, collect_samples: bool = False) -> Co
         stats.max_slot = api.F.otype.maxSlot
         stats.max_node = api.F.otype.maxNode
         stats.node_types = len(api.F.otype.all)
-        stats.node_features = len([f for f in dir(api.F) if not f.startswith("_")])
-        stats.edge_features = len([f for f in dir(api.E) if not f.startswith("_")])
+        node_features = api.Fall()
+        edge_features = api.Eall()
+        stats.node_features = len(node_features)
+        stats.edge_features = len(edge_features)
 
         if collect_samples:
-            stats.samples = sample_feature_values(api)
+            stats.samples = sample_feature_values(
+                api, node_features=node_features, edge_features=edge_features
+            )
+        stats.cfm_digest = hash_cfm_cache(tf_path)
 
         del tf, api
         gc.collect()
 
     except Exception as e:
         stats.error = f"{type(e).__name__}: {e}"
-        traceback.print_exc()
+        stats.traceback = traceback.format_exc()
+
+    return stats
+
+
+def read_cfm_cache(tf_path: Path) -> CorpusStats:
+    """Read the stats of a compiled .cfm cache without loading the corpus.
+
+    The counts come from the cache's meta.json. Its feature lists leave out
+    the warp features, which a loaded corpus reports in Fall() and Eall().
+    """
+    stats = CorpusStats()
+    try:
+        meta_paths = sorted(tf_path.glob(".cfm/*/meta.json"))
+        if not meta_paths:
+            raise FileNotFoundError(f"No .cfm cache in {tf_path}")
+        meta = json.loads(meta_paths[-1].read_bytes())
+
+        stats.max_slot = meta["max_slot"]
+        stats.max_node = meta["max_node"]
+        stats.node_types = len(meta["node_types"])
+        stats.node_features = len({*meta["features"]["node"], "otype"})
+        stats.edge_features = len({*meta["features"]["edge"], "oslots"})
+        stats.cfm_digest = hash_cfm_cache(tf_path)
+
+    except Exception as e:
+        stats.error = f"{type(e).__name__}: {e}"
+        stats.traceback = traceback.format_exc()
 
     return stats
 
 
-def validate_corpus(corpus_name: str, corpus_dir: Path) -> ValidationResult:
-    """Validate a single corpus with both TF and CF."""
+def validate_corpus(
+    corpus_name: str, corpus_dir: Path, deep_mmap_check: bool = False
+) -> ValidationResult:
+    """Validate a single corpus with both TF and CF.
+
+    Unless deep_mmap_check is set, the .cfm cache is checked through its
+    metadata and file digest instead of a second full Context-Fabric load.
+    """
     tf_path = corpus_dir / "tf"
 
     print(f"\n{'=' * 60}")
@@ -339,7 +481,7 @@ def validate_corpus(corpus_name: str, corpus_dir: Path) -> ValidationResult:
 
     # Test Context-Fabric (from .tf, which auto-compiles to .cfm)
     print("\n[Context-Fabric] Loading from .tf...")
-    cf_stats = load_with_context_fabric(tf_path, collect_samples=True)
+    cf_stats = load_with_context_fabric(tf_path, collect_samples=deep_mmap_check)
     if cf_stats.error:
         print(f"  ERROR: {cf_stats.error}")
     else:
@@ -351,8 +493,12 @@ def validate_corpus(corpus_name: str, corpus_dir: Path) -> ValidationResult:
             print(f"  sampled: {len(cf_stats.samples.node_samples)} node features, {len(cf_stats.samples.edge_samples)} edge features, {len(cf_stats.samples.text_samples)} T.text() calls")
 
     # Test Context-Fabric loading from .cfm cache
-    print("\n[Context-Fabric] Loading from .cfm cache...")
-    cf_mmap_stats = load_with_context_fabric(tf_path, collect_samples=True)
+    if deep_mmap_check:
+        print("\n[Context-Fabric] Loading from .cfm cache...")
+        cf_mmap_stats = load_with_context_fabric(tf_path, collect_samples=True)
+    else:
+        print("\n[Context-Fabric] Checking .cfm cache...")
+        cf_mmap_stats = read_cfm_cache(tf_path)
     if cf_mmap_stats.error:
         print(f"  ERROR: {cf_mmap_stats.error}")
     else:
@@ -382,6 +528,8 @@ def validate_corpus(corpus_name: str, corpus_dir: Path) -> ValidationResult:
             print("\n[WARN] CF .tf vs .cfm stats differ!")
             print(f"  .tf: {cf_stats.node_features} node, {cf_stats.edge_features} edge")
             print(f"  .cfm: {cf_mmap_stats.node_features} node, {cf_mmap_stats.edge_features} edge")
+            if cf_stats.cfm_digest != cf_mmap_stats.cfm_digest:
+                print("  .cfm cache files changed after compiling")
         elif not result.samples_match:
             print("\n[FAIL] CF .tf vs .cfm feature values differ!")
             mismatches = result.get_sample_mismatches()
@@ -398,6 +546,83 @@ def validate_corpus(corpus_name: str, corpus_dir: Path) -> ValidationResult:
     return result
 
 
+def _validate_captured(
+    corpus_name: str, corpus_dir: Path, deep_mmap_check: bool
+) -> tuple[ValidationResult, str]:
+    """Validate a corpus in a pool worker and return its console output.
+
+    The output is returned rather than printed so that corpora validated at
+    the same time do not interleave their reports.
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        result = validate_corpus(corpus_name, corpus_dir, deep_mmap_check)
+        wait_for_cache_cleanup()
+    return result, buffer.getvalue()
+
+
+def validate_corpora(
+    corpus_dirs: list[Path], jobs: int, deep_mmap_check: bool = False
+) -> list[ValidationResult]:
+    """Validate corpora, up to jobs of them at once.
+
+    With more than one job each corpus gets a fresh process, so no state
+    from one corpus's loads carries over to the next; reports are printed
+    as corpora finish. Where the platform has a forkserver, it imports TF
+    and CF once and every worker is forked from it, instead of each spawned
+    worker importing them again.
+
+    Returns:
+        Results in the order of corpus_dirs
+    """
+    jobs = min(jobs, len(corpus_dirs))
+    if jobs <= 1:
+        results = []
+        for corpus_dir in corpus_dirs:
+            results.append(validate_corpus(corpus_dir.name, corpus_dir, deep_mmap_check))
+            gc.collect()
+        return results
+
+    if "forkserver" in mp.get_all_start_methods():
+        ctx = mp.get_context("forkserver")
+        ctx.set_forkserver_preload(WORKER_PRELOAD)
+    else:
+        ctx = mp.get_context("spawn")
+
+    by_corpus: dict[str, ValidationResult] = {}
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx, max_tasks_per_child=1) as pool:
+        futures = [
+            pool.submit(_validate_captured, d.name, d, deep_mmap_check) for d in corpus_dirs
+        ]
+        for future in as_completed(futures):
+            result, output = future.result()
+            print(output, end="", flush=True)
+            by_corpus[result.corpus] = result
+    return [by_corpus[d.name] for d in corpus_dirs]
+
+
+def print_tracebacks(results: list[ValidationResult]) -> None:
+    """Print the tracebacks of failed loads, grouped by corpus."""
+    for r in results:
+        failed = [
+            (label, stats.traceback)
+            for label, stats in [
+                ("Text-Fabric", r.tf_stats),
+                ("Context-Fabric .tf", r.cf_stats),
+                ("Context-Fabric .cfm", r.cf_mmap_stats),
+            ]
+            if stats.traceback
+        ]
+        if not failed:
+            continue
+        print(f"\n{'=' * 60}")
+        print(f"Tracebacks: {r.corpus}")
+        print("=" * 60)
+        for label, tb in failed:
+            print(f"\n[{label}]")
+            print(tb, end="")
+
+
 def print_summary(results: list[ValidationResult]) -> None:
     """Print summary table of all results."""
     print("\n" + "=" * 90)
@@ -436,16 +661,30 @@ def print_summary(results: list[ValidationResult]) -> None:
 def main():
     parser = argparse.ArgumentParser(description="Validate TF corpora loading")
     parser.add_argument("--corpus", help="Validate single corpus by name")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Corpora validated at once, each holding a full TF load (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--deep-mmap-check",
+        action="store_true",
+        help="Reload each corpus from its .cfm cache and compare sampled feature values",
+    )
     args = parser.parse_args()
 
     # Corpora at package root (.corpora at libs/benchmarks/ level)
     script_dir = Path(__file__).parent
     corpora_dir = script_dir.parent.parent / ".corpora"
 
-    # Find all corpora
-    corpus_dirs = sorted(
-        [d for d in corpora_dir.iterdir() if d.is_dir() and (d / "tf").exists()]
-    )
+    # Find all corpora (scandir entries know their file type, so only tf/ needs a stat)
+    with os.scandir(corpora_dir) as entries:
+        corpus_dirs = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_dir() and os.path.isdir(os.path.join(entry.path, "tf"))
+        )
 
     if args.corpus:
         # Single corpus mode
@@ -460,13 +699,11 @@ def main():
     print(f"\nCorpora directory: {corpora_dir}")
     print(f"Corpora to validate: {len(corpus_dirs)}")
 
-    results = []
-    for corpus_dir in corpus_dirs:
-        result = validate_corpus(corpus_dir.name, corpus_dir)
-        results.append(result)
-        gc.collect()
+    results = validate_corpora(corpus_dirs, args.jobs, args.deep_mmap_check)
 
     print_summary(results)
+    print_tracebacks(results)
+    wait_for_cache_cleanup()
 
     # Exit with error code if any failed
     if any(
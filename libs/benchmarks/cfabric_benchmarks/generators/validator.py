@@ -7,10 +7,19 @@ corpus before using them for full benchmarking.
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any
 
 from cfabric_benchmarks.models.latency import SearchQuery, ValidationReport
 
+# Results collected between two timeout checks in validate_query; well
+# below the default max_results, so the check runs repeatedly
+TIMEOUT_CHECK_INTERVAL = 64
+
+# Queries validated at once by validate_queries
+MAX_VALIDATION_WORKERS = 4
+
 
 class QueryValidator:
     """Validates search queries by executing them on a corpus.
@@ -52,17 +61,13 @@ class QueryValidator:
             # Execute the search
             results = self.S.search(query.template)
 
-            # Collect some results to verify it works
-            count = 0
-            for _ in results:
-                count += 1
-                if count >= self.max_results:
-                    break
-
-                # Check timeout
-                elapsed_ms = (time.perf_counter() - start) * 1000
-                if elapsed_ms > self.timeout_ms:
-                    break
+            # Collect some results to verify it works, checking the
+            # timeout every TIMEOUT_CHECK_INTERVAL results
+            for i, _ in enumerate(islice(results, self.max_results)):
+                if i % TIMEOUT_CHECK_INTERVAL == 0:
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    if elapsed_ms > self.timeout_ms:
+                        break
 
             # Query validated successfully
             return SearchQuery(
@@ -91,28 +96,32 @@ class QueryValidator:
         self,
         queries: list[SearchQuery],
         corpus_name: str = "unknown",
+        max_workers: int = MAX_VALIDATION_WORKERS,
     ) -> ValidationReport:
         """Validate a list of queries.
 
+        Queries run on a thread pool. Each search builds its own execution
+        state and only reads the API, so the threads share it safely; the
+        gain depends on how much of the search runs outside the GIL.
+
         Args:
             queries: List of queries to validate
             corpus_name: Name of the corpus being used for validation
+            max_workers: Queries validated at once (1 runs them in order
+                on this thread)
 
         Returns:
-            ValidationReport with results
+            ValidationReport with results, queries in their input order
         """
-        validated_queries: list[SearchQuery] = []
-        validated_count = 0
-        failed_count = 0
-
-        for query in queries:
-            result = self.validate_query(query)
-            validated_queries.append(result)
+        workers = min(max_workers, len(queries))
+        if workers <= 1:
+            validated_queries = [self.validate_query(query) for query in queries]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                validated_queries = list(pool.map(self.validate_query, queries))
 
-            if result.validated:
-                validated_count += 1
-            else:
-                failed_count += 1
+        validated_count = sum(1 for query in validated_queries if query.validated)
+        failed_count = len(validated_queries) - validated_count
 
         return ValidationReport(
             validation_corpus=corpus_name,
@@ -142,6 +151,7 @@ def validate_queries_on_corpus(
     api: Any,
     corpus_name: str = "unknown",
     timeout_ms: float = 5000.0,
+    max_workers: int = MAX_VALIDATION_WORKERS,
 ) -> ValidationReport:
     """Convenience function to validate queries on a corpus.
 
@@ -150,12 +160,13 @@ def validate_queries_on_corpus(
         api: Text-Fabric or Context-Fabric API object
         corpus_name: Name of the validation corpus
         timeout_ms: Maximum execution time per query
+        max_workers: Queries validated at once
 
     Returns:
         ValidationReport with results
     """
     validator = QueryValidator(api, timeout_ms=timeout_ms)
-    return validator.validate_queries(queries, corpus_name)
+    return validator.validate_queries(queries, corpus_name, max_workers=max_workers)
 
 
 def format_validation_report(report: ValidationReport) -> str:
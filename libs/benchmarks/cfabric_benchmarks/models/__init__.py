@@ -4,6 +4,7 @@ from cfabric_benchmarks.models.config import (
     BenchmarkConfig,
     CorpusConfig,
     CORPUS_SIZE_ORDER,
+    corpus_size_rank,
     discover_corpora,
     get_corpora_by_size,
 )
@@ -39,6 +40,7 @@ __all__ = [
     "BenchmarkConfig",
     "CorpusConfig",
     "CORPUS_SIZE_ORDER",
+    "corpus_size_rank",
     "discover_corpora",
     "get_corpora_by_size",
     # Environment
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CorpusConfig(BaseModel):
-    """Configuration for a single corpus."""
+    """Configuration for a single corpus.
+
+    Frozen, so a discovered corpus can be shared between benchmarks and
+    used as a dict key.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str
     path: Path
@@ -51,6 +58,33 @@ class BenchmarkConfig(BaseModel):
     num_workers: int = Field(default=4, ge=1, description="Workers for parallel tests")
     measure_fork: bool = Field(default=True, description="Include fork-mode tests")
     measure_spawn: bool = Field(default=True, description="Include spawn-mode tests")
+    spawn_context: Literal["spawn", "forkserver"] = Field(
+        default="spawn",
+        description=(
+            "Start method for spawn-mode workers; 'forkserver' imports TF and CF "
+            "once and forks workers from there (workers then share those module "
+            "pages, so compare PSS rather than RSS)"
+        ),
+    )
+    cf_prefault: bool = Field(
+        default=False,
+        description="Prefault CF's mmapped arrays inside the timed load (resident-data timing)",
+    )
+    cf_prefault_threads: int = Field(
+        default=1, ge=1, description="Threads used to prefault CF's mmapped arrays"
+    )
+    warm_cache: bool = Field(
+        default=True,
+        description="Read corpus caches into the OS page cache before timed loads",
+    )
+    parallel_corpora: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Corpora benchmarked concurrently in the memory benchmark; above 1 "
+            "the runs compete for CPU, memory bandwidth and page cache"
+        ),
+    )
 
     # Latency benchmark settings
     num_queries: int = Field(
@@ -96,6 +130,9 @@ CORPUS_SIZE_ORDER: list[str] = [
     "bhsa",  # 1.1 GB - BHSA
 ]
 
+# Position of each known corpus in CORPUS_SIZE_ORDER
+_SIZE_RANK: dict[str, int] = {name: rank for rank, name in enumerate(CORPUS_SIZE_ORDER)}
+
 
 def discover_corpora(corpora_dir: Path) -> list[CorpusConfig]:
     """Discover all corpora in the benchmark directory.
@@ -109,21 +146,36 @@ def discover_corpora(corpora_dir: Path) -> list[CorpusConfig]:
     # Resolve to absolute path to avoid issues with relative paths in subprocesses
     corpora_dir = corpora_dir.resolve()
     corpora = []
-    for corpus_dir in corpora_dir.iterdir():
-        if not corpus_dir.is_dir() or corpus_dir.name.startswith("."):
-            continue
-        tf_path = corpus_dir / "tf"
-        if tf_path.exists():
-            corpora.append(
-                CorpusConfig(
-                    name=corpus_dir.name,
-                    path=corpus_dir,
-                    tf_path=tf_path,
+    # scandir entries know their file type, so only tf/ needs a stat
+    with os.scandir(corpora_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            corpus_dir = Path(entry.path)
+            tf_path = corpus_dir / "tf"
+            if tf_path.is_dir():
+                corpora.append(
+                    CorpusConfig(
+                        name=entry.name,
+                        path=corpus_dir,
+                        tf_path=tf_path,
+                    )
                 )
-            )
     return sorted(corpora, key=lambda c: c.name)
 
 
+def corpus_size_rank(corpus: CorpusConfig) -> int:
+    """Get the position of a corpus in CORPUS_SIZE_ORDER.
+
+    Args:
+        corpus: Corpus config
+
+    Returns:
+        Rank by size (0 = smallest); corpora not in the list rank last
+    """
+    return _SIZE_RANK.get(corpus.name, len(_SIZE_RANK))
+
+
 def get_corpora_by_size(corpora: list[CorpusConfig]) -> list[CorpusConfig]:
     """Sort corpora by size for progressive loading tests.
 
@@ -131,21 +183,7 @@ def get_corpora_by_size(corpora: list[CorpusConfig]) -> list[CorpusConfig]:
         corpora: List of corpus configs
 
     Returns:
-        Corpora sorted by size (smallest first)
+        Corpora sorted by size (smallest first); corpora not in
+        CORPUS_SIZE_ORDER follow in their original order
     """
-    # Create a map for O(1) lookup
-    corpus_map = {c.name: c for c in corpora}
-
-    # Return in size order, filtering to only those that exist
-    result = []
-    for name in CORPUS_SIZE_ORDER:
-        if name in corpus_map:
-            result.append(corpus_map[name])
-
-    # Add any corpora not in the predefined order at the end
-    known_names = set(CORPUS_SIZE_ORDER)
-    for corpus in corpora:
-        if corpus.name not in known_names:
-            result.append(corpus)
-
-    return result
+    return sorted(corpora, key=corpus_size_rank)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import os
 import platform
 import subprocess
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 
 from pydantic import BaseModel, Field
 
@@ -71,13 +74,19 @@ class TestEnvironment(BaseModel):
 
     @classmethod
     def from_system(cls) -> TestEnvironment:
-        """Create TestEnvironment from the current system."""
+        """Create TestEnvironment from the current system.
+
+        The timestamp and RAM figure are read on every call; CPU model,
+        storage type and package versions cannot change during a run and
+        are probed (with subprocesses on some platforms) only once.
+        """
         return cls(
             hardware=_collect_hardware_info(),
             software=SoftwareInfo.from_environment(),
         )
 
 
+@lru_cache(maxsize=1)
 def _get_tf_version() -> str:
     """Get Text-Fabric version."""
     try:
@@ -88,6 +97,7 @@ def _get_tf_version() -> str:
         return "unknown"
 
 
+@lru_cache(maxsize=1)
 def _get_cf_version() -> str:
     """Get Context-Fabric version."""
     try:
@@ -100,8 +110,6 @@ def _get_cf_version() -> str:
 
 def _collect_hardware_info() -> HardwareInfo:
     """Collect hardware information from the current system."""
-    import os
-
     import psutil
 
     # CPU info
@@ -124,11 +132,17 @@ def _collect_hardware_info() -> HardwareInfo:
     )
 
 
+@lru_cache(maxsize=1)
 def _get_cpu_model() -> str:
     """Get CPU model name."""
     system = platform.system()
 
     if system == "Darwin":
+        # Read the sysctls in-process; the sysctl tool is only a fallback
+        for name in ("machdep.cpu.brand_string", "hw.chip"):
+            value = _sysctl_string(name)
+            if value:
+                return value
         try:
             result = subprocess.run(
                 ["sysctl", "-n", "machdep.cpu.brand_string"],
@@ -165,26 +179,20 @@ def _get_cpu_model() -> str:
     return platform.processor() or "Unknown"
 
 
+@lru_cache(maxsize=1)
 def _detect_storage_type() -> str:
     """Detect storage type (SSD/HDD)."""
     system = platform.system()
 
     if system == "Darwin":
-        # macOS - check for NVMe or SSD in disk info
-        try:
-            result = subprocess.run(
-                ["system_profiler", "SPNVMeDataType"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0 and "NVMe" in result.stdout:
-                return "SSD"
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
-        return "SSD"  # Most Macs use SSDs
+        # Macs ship with SSDs; asking system_profiler took seconds and could
+        # only confirm that
+        return "SSD"
 
     elif system == "Linux":
+        storage_type = _sysfs_storage_type()
+        if storage_type is not None:
+            return storage_type
         try:
             # Check for rotational flag
             result = subprocess.run(
@@ -206,3 +214,62 @@ def _detect_storage_type() -> str:
             pass
 
     return "Unknown"
+
+
+# Block devices that are not disks: loop files, RAM disks and compressed swap
+_VIRTUAL_BLOCK_PREFIXES = ("loop", "ram", "zram")
+
+
+def _sysfs_storage_type() -> str | None:
+    """Read the rotational flag of the first disk from /sys/block.
+
+    Returns:
+        "SSD" or "HDD", or None if sysfs has no usable disk entry
+    """
+    try:
+        with os.scandir("/sys/block") as entries:
+            names = sorted(entry.name for entry in entries)
+    except OSError:
+        return None
+    for name in names:
+        if name.startswith(_VIRTUAL_BLOCK_PREFIXES):
+            continue
+        device = Path("/sys/block", name)
+        try:
+            if (device / "size").read_text().strip() == "0":
+                continue
+            rotational = (device / "queue" / "rotational").read_text().strip()
+        except OSError:
+            continue
+        if rotational == "0":
+            return "SSD"
+        if rotational == "1":
+            return "HDD"
+    return None
+
+
+def _sysctl_string(name: str) -> str | None:
+    """Read a string sysctl through libc's sysctlbyname (macOS).
+
+    Args:
+        name: Sysctl name, e.g. "machdep.cpu.brand_string"
+
+    Returns:
+        The value, or None if it is not available
+    """
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"))
+        sysctlbyname = libc.sysctlbyname
+    except (OSError, AttributeError):
+        return None
+    key = name.encode()
+    size = ctypes.c_size_t(0)
+    if sysctlbyname(key, None, ctypes.byref(size), None, 0) != 0 or not size.value:
+        return None
+    buf = ctypes.create_string_buffer(size.value)
+    if sysctlbyname(key, buf, ctypes.byref(size), None, 0) != 0:
+        return None
+    return buf.value.decode(errors="replace").strip() or None
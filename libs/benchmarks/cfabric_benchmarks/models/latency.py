@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from cfabric_benchmarks.models.statistics import StatisticalSummary
 
@@ -24,6 +25,12 @@ class SearchQuery(BaseModel):
         default=None, description="Error message if validation failed"
     )
 
+    @field_validator("id", "category")
+    @classmethod
+    def _intern_labels(cls, value: str) -> str:
+        """Intern labels, so filters over many queries compare by identity."""
+        return sys.intern(value)
+
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
         return self.model_dump()
@@ -45,6 +52,12 @@ class QueryMeasurement(BaseModel):
     success: bool
     error: str | None = None
 
+    @field_validator("query_id", "implementation")
+    @classmethod
+    def _intern_labels(cls, value: str) -> str:
+        """Intern labels, so filters over many measurements compare by identity."""
+        return sys.intern(value)
+
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
         return self.model_dump()
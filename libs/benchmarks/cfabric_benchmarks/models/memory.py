@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Literal
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, computed_field, field_validator
 
 from cfabric_benchmarks.models.statistics import StatisticalSummary
 
@@ -44,9 +45,23 @@ class MemoryMeasurement(BaseModel):
     num_workers: int | None = None
     total_rss_mb: float | None = None
     per_worker_rss_mb: float | None = None
+    # PSS splits shared (mmapped / copy-on-write) pages between the processes
+    # mapping them, so it shows the real cost of sharing that RSS hides
+    total_pss_mb: float | None = None
+    per_worker_pss_mb: float | None = None
 
     # Cache info
     cache_size_mb: float | None = None
+    # Resident part of the memory-mapped cache files (CF only); the rest of
+    # the cache is mapped but has never been read
+    mapped_resident_mb: float | None = None
+    mapped_resident_by_file_mb: dict[str, float] | None = None
+
+    @field_validator("corpus", "implementation", "mode")
+    @classmethod
+    def _intern_labels(cls, value: str) -> str:
+        """Intern labels, so filters over many measurements compare by identity."""
+        return sys.intern(value)
 
     @computed_field
     @property
@@ -28,6 +28,11 @@ class ProgressiveLoadStep(BaseModel):
         """Convert to JSON-serializable dictionary."""
         return self.model_dump()
 
+    @property
+    def corpora_loaded_str(self) -> str:
+        """Loaded corpora joined with ";", as written to the CSV tables."""
+        return ";".join(self.corpora_loaded)
+
 
 class ScalingAnalysis(BaseModel):
     """Linear scaling analysis results."""
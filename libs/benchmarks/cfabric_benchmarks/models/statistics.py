@@ -64,7 +64,7 @@ class ComparisonResult(BaseModel):
 
     # Statistical significance
     p_value: float | None = Field(
-        default=None, description="P-value from Welch's t-test"
+        default=None, description="P-value from Welch's t-test, or a paired t-test for paired runs"
     )
     statistically_significant: bool = Field(
         default=False, description="True if p_value < 0.05"
@@ -1,14 +1,16 @@
 """Output utilities for benchmark results."""
 
 from cfabric_benchmarks.output.csv_writer import (
+    write_all,
     write_comparison_csv,
     write_latency_measurements_csv,
     write_latency_statistics_csv,
     write_memory_measurements_csv,
     write_memory_summary_csv,
-    write_queries_csv,
     write_progressive_steps_csv,
+    write_queries_csv,
 )
+from cfabric_benchmarks.output.json_writer import write_json, write_jsonl
 from cfabric_benchmarks.output.loaders import (
     load_latency_result,
     load_memory_results,
@@ -21,16 +23,29 @@ from cfabric_benchmarks.output.metadata import (
     load_environment,
     save_environment,
 )
+from cfabric_benchmarks.output.parquet_writer import (
+    write_latency_measurements_parquet,
+    write_memory_measurements_parquet,
+    write_progressive_steps_parquet,
+)
 
 __all__ = [
     # CSV writers
+    "write_all",
     "write_comparison_csv",
     "write_latency_measurements_csv",
     "write_latency_statistics_csv",
     "write_memory_measurements_csv",
     "write_memory_summary_csv",
-    "write_queries_csv",
     "write_progressive_steps_csv",
+    "write_queries_csv",
+    # Parquet writers
+    "write_latency_measurements_parquet",
+    "write_memory_measurements_parquet",
+    "write_progressive_steps_parquet",
+    # JSON writer
+    "write_json",
+    "write_jsonl",
     # Loaders
     "load_latency_result",
     "load_memory_results",
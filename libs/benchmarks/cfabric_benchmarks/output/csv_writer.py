@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import csv
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from pathlib import Path
-
-import pandas as pd
+from typing import Any, TextIO
 
 from cfabric_benchmarks.models.memory import MemoryBenchmarkResult, MemoryMeasurement
 from cfabric_benchmarks.models.latency import (
@@ -15,6 +18,126 @@ from cfabric_benchmarks.models.latency import (
 )
 from cfabric_benchmarks.models.progressive import ProgressiveLoadResult, ProgressiveLoadStep
 
+# Write buffer for CSV files. Raw tables run to tens of thousands of rows;
+# a large buffer turns them into a handful of write() calls instead of one
+# per 8 KiB of output.
+CSV_BUFFER_SIZE = 1 << 20
+
+
+def _open_csv(output_path: Path) -> TextIO:
+    """Open a CSV file for writing with a large write buffer.
+
+    Creates the parent directory if needed.
+
+    Args:
+        output_path: Path to output CSV file
+
+    Returns:
+        Text file handle; the caller closes it
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return open(output_path, "w", newline="", buffering=CSV_BUFFER_SIZE)
+
+
+def _write_rows_csv(
+    columns: Sequence[str], rows: Iterable[Sequence], output_path: Path
+) -> None:
+    """Stream row tuples to CSV.
+
+    Rows are written as they are produced instead of being collected into
+    a DataFrame first, so the raw per-run tables, which can have many
+    rows, are never held twice. Output matches
+    ``DataFrame.to_csv(index=False)``, except that integer columns with
+    gaps stay integers instead of becoming floats. Values are expected to
+    be Python scalars; pydantic models have already converted numpy ones.
+
+    Args:
+        columns: Header row
+        rows: Row values, in column order
+        output_path: Path to output CSV file
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    with _open_csv(output_path) as f:
+        if first is None:
+            f.write("\n")
+            return
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerow(first)
+        writer.writerows(rows)
+
+
+# Columns of the tables written from model lists; rows are read with
+# attrgetter, which runs in C, so these double as model attribute names
+MEMORY_MEASUREMENT_COLUMNS = (
+    "run_id",
+    "corpus",
+    "implementation",
+    "mode",
+    "compile_time_s",
+    "load_time_s",
+    "rss_before_mb",
+    "rss_after_mb",
+    "memory_used_mb",
+    "num_workers",
+    "total_rss_mb",
+    "per_worker_rss_mb",
+    "total_pss_mb",
+    "per_worker_pss_mb",
+    "cache_size_mb",
+    "mapped_resident_mb",
+)
+LATENCY_MEASUREMENT_COLUMNS = (
+    "query_id",
+    "implementation",
+    "run_id",
+    "iteration",
+    "execution_time_ms",
+    "result_count",
+    "success",
+    "error",
+)
+LATENCY_STATISTICS_COLUMNS = (
+    "query_id",
+    "category",
+    "implementation",
+    "mean_ms",
+    "std_ms",
+    "min_ms",
+    "max_ms",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "sample_count",
+    "error_count",
+)
+PROGRESSIVE_STEP_COLUMNS = (
+    "step",
+    "corpus_added",
+    "corpora_loaded",
+    "implementation",
+    "run_id",
+    "total_rss_mb",
+    "incremental_rss_mb",
+    "cumulative_load_time_s",
+    "step_load_time_s",
+)
+# The CSV holds the loaded corpora as one ";"-joined string
+_PROGRESSIVE_STEP_ATTRS = tuple(
+    "corpora_loaded_str" if column == "corpora_loaded" else column
+    for column in PROGRESSIVE_STEP_COLUMNS
+)
+QUERY_COLUMNS = (
+    "id",
+    "category",
+    "template",
+    "description",
+    "expected_complexity",
+    "validated",
+    "validation_error",
+)
+
 
 def write_memory_measurements_csv(
     measurements: list[MemoryMeasurement],
@@ -26,27 +149,8 @@ def write_memory_measurements_csv(
         measurements: List of memory measurements
         output_path: Path to output CSV file
     """
-    rows = []
-    for m in measurements:
-        rows.append({
-            "run_id": m.run_id,
-            "corpus": m.corpus,
-            "implementation": m.implementation,
-            "mode": m.mode,
-            "compile_time_s": m.compile_time_s,
-            "load_time_s": m.load_time_s,
-            "rss_before_mb": m.rss_before_mb,
-            "rss_after_mb": m.rss_after_mb,
-            "memory_used_mb": m.memory_used_mb,
-            "num_workers": m.num_workers,
-            "total_rss_mb": m.total_rss_mb,
-            "per_worker_rss_mb": m.per_worker_rss_mb,
-            "cache_size_mb": m.cache_size_mb,
-        })
-
-    df = pd.DataFrame(rows)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    rows = map(attrgetter(*MEMORY_MEASUREMENT_COLUMNS), measurements)
+    _write_rows_csv(MEMORY_MEASUREMENT_COLUMNS, rows, output_path)
 
 
 def write_latency_measurements_csv(
@@ -59,22 +163,8 @@ def write_latency_measurements_csv(
         measurements: List of query measurements
         output_path: Path to output CSV file
     """
-    rows = []
-    for m in measurements:
-        rows.append({
-            "query_id": m.query_id,
-            "implementation": m.implementation,
-            "run_id": m.run_id,
-            "iteration": m.iteration,
-            "execution_time_ms": m.execution_time_ms,
-            "result_count": m.result_count,
-            "success": m.success,
-            "error": m.error,
-        })
-
-    df = pd.DataFrame(rows)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    rows = map(attrgetter(*LATENCY_MEASUREMENT_COLUMNS), measurements)
+    _write_rows_csv(LATENCY_MEASUREMENT_COLUMNS, rows, output_path)
 
 
 def write_latency_statistics_csv(
@@ -87,26 +177,8 @@ def write_latency_statistics_csv(
         statistics: List of latency statistics
         output_path: Path to output CSV file
     """
-    rows = []
-    for s in statistics:
-        rows.append({
-            "query_id": s.query_id,
-            "category": s.category,
-            "implementation": s.implementation,
-            "mean_ms": s.mean_ms,
-            "std_ms": s.std_ms,
-            "min_ms": s.min_ms,
-            "max_ms": s.max_ms,
-            "p50_ms": s.p50_ms,
-            "p95_ms": s.p95_ms,
-            "p99_ms": s.p99_ms,
-            "sample_count": s.sample_count,
-            "error_count": s.error_count,
-        })
-
-    df = pd.DataFrame(rows)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    rows = map(attrgetter(*LATENCY_STATISTICS_COLUMNS), statistics)
+    _write_rows_csv(LATENCY_STATISTICS_COLUMNS, rows, output_path)
 
 
 def write_queries_csv(
@@ -119,21 +191,8 @@ def write_queries_csv(
         queries: List of search queries
         output_path: Path to output CSV file
     """
-    rows = []
-    for p in queries:
-        rows.append({
-            "id": p.id,
-            "category": p.category,
-            "template": p.template,
-            "description": p.description,
-            "expected_complexity": p.expected_complexity,
-            "validated": p.validated,
-            "validation_error": p.validation_error,
-        })
-
-    df = pd.DataFrame(rows)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    rows = map(attrgetter(*QUERY_COLUMNS), queries)
+    _write_rows_csv(QUERY_COLUMNS, rows, output_path)
 
 
 def write_progressive_steps_csv(
@@ -146,23 +205,19 @@ def write_progressive_steps_csv(
         steps: List of progressive load steps
         output_path: Path to output CSV file
     """
-    rows = []
-    for s in steps:
-        rows.append({
-            "step": s.step,
-            "corpus_added": s.corpus_added,
-            "corpora_loaded": ";".join(s.corpora_loaded),
-            "implementation": s.implementation,
-            "run_id": s.run_id,
-            "total_rss_mb": s.total_rss_mb,
-            "incremental_rss_mb": s.incremental_rss_mb,
-            "cumulative_load_time_s": s.cumulative_load_time_s,
-            "step_load_time_s": s.step_load_time_s,
-        })
-
-    df = pd.DataFrame(rows)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    rows = map(attrgetter(*_PROGRESSIVE_STEP_ATTRS), steps)
+    _write_rows_csv(PROGRESSIVE_STEP_COLUMNS, rows, output_path)
+
+
+MEMORY_SUMMARY_COLUMNS = (
+    "corpus",
+    "mode",
+    "tf_memory_mean_mb",
+    "tf_memory_std_mb",
+    "cf_memory_mean_mb",
+    "cf_memory_std_mb",
+    "reduction_percent",
+)
 
 
 def write_memory_summary_csv(
@@ -175,41 +230,37 @@ def write_memory_summary_csv(
         results: List of memory benchmark results
         output_path: Path to output CSV file
     """
-    rows = []
-    for r in results:
-        # Single process stats
-        if r.tf_memory_stats and r.cf_memory_stats:
-            rows.append({
-                "corpus": r.corpus,
-                "mode": "single",
-                "tf_memory_mean_mb": r.tf_memory_stats.mean,
-                "tf_memory_std_mb": r.tf_memory_stats.std,
-                "cf_memory_mean_mb": r.cf_memory_stats.mean,
-                "cf_memory_std_mb": r.cf_memory_stats.std,
-                "reduction_percent": (
-                    (r.tf_memory_stats.mean - r.cf_memory_stats.mean)
-                    / r.tf_memory_stats.mean
-                    * 100
-                    if r.tf_memory_stats.mean > 0
-                    else 0
-                ),
-            })
-
-        # Load time stats
-        if r.tf_load_time_stats and r.cf_load_time_stats:
-            rows.append({
-                "corpus": r.corpus,
-                "mode": "load_time",
-                "tf_memory_mean_mb": r.tf_load_time_stats.mean,
-                "tf_memory_std_mb": r.tf_load_time_stats.std,
-                "cf_memory_mean_mb": r.cf_load_time_stats.mean,
-                "cf_memory_std_mb": r.cf_load_time_stats.std,
-                "reduction_percent": None,  # Not applicable for time
-            })
 
-    df = pd.DataFrame(rows)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    def rows():
+        for r in results:
+            # Single process stats
+            if r.tf_memory_stats and r.cf_memory_stats:
+                tf_mean = r.tf_memory_stats.mean
+                yield (
+                    r.corpus,
+                    "single",
+                    tf_mean,
+                    r.tf_memory_stats.std,
+                    r.cf_memory_stats.mean,
+                    r.cf_memory_stats.std,
+                    (tf_mean - r.cf_memory_stats.mean) / tf_mean * 100
+                    if tf_mean > 0
+                    else 0.0,
+                )
+
+            # Load time stats; reduction is not applicable for time
+            if r.tf_load_time_stats and r.cf_load_time_stats:
+                yield (
+                    r.corpus,
+                    "load_time",
+                    r.tf_load_time_stats.mean,
+                    r.tf_load_time_stats.std,
+                    r.cf_load_time_stats.mean,
+                    r.cf_load_time_stats.std,
+                    None,
+                )
+
+    _write_rows_csv(MEMORY_SUMMARY_COLUMNS, rows(), output_path)
 
 
 def write_comparison_csv(
@@ -218,13 +269,43 @@ def write_comparison_csv(
 ) -> None:
     """Write comparison results to CSV.
 
+    Columns are the union of the dictionary keys, in order of first
+    appearance; keys missing from a row are written as empty cells.
+
     Args:
         comparisons: List of comparison dictionaries
         output_path: Path to output CSV file
     """
-    df = pd.DataFrame(comparisons)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    columns = tuple(dict.fromkeys(key for c in comparisons for key in c))
+    rows = ([c.get(key) for key in columns] for c in comparisons)
+    _write_rows_csv(columns, rows, output_path)
+
+
+def _cross_corpus_row(metric: str, unit: str, values: list[float]) -> dict:
+    """Aggregate one metric across corpora into a summary table row.
+
+    Args:
+        metric: Metric name
+        unit: Unit of the values
+        values: One value per corpus
+
+    Returns:
+        Row with the mean, sample std, 95% CI and extremes
+    """
+    from cfabric_benchmarks.analysis.statistics import compute_summary
+
+    summary = compute_summary(values, metric, unit)
+    return {
+        "metric": metric,
+        "unit": unit,
+        "n_corpora": summary.n,
+        "mean": summary.mean,
+        "std": summary.std,
+        "ci_lower_95": summary.ci_lower,
+        "ci_upper_95": summary.ci_upper,
+        "min": summary.min,
+        "max": summary.max,
+    }
 
 
 def write_cross_corpus_summary_csv(
@@ -239,8 +320,7 @@ def write_cross_corpus_summary_csv(
         results: List of memory benchmark results (one per corpus)
         output_path: Path to output CSV file
     """
-    import numpy as np
-    from scipy import stats
+    import pandas as pd
 
     rows = []
 
@@ -272,58 +352,36 @@ def write_cross_corpus_summary_csv(
                 speedups.append(speedup)
 
         if reductions:
-            arr = np.array(reductions)
-            n = len(arr)
-            mean = float(np.mean(arr))
-            std = float(np.std(arr, ddof=1)) if n > 1 else 0.0
-
-            # 95% CI
-            if n > 1:
-                sem = std / np.sqrt(n)
-                t_val = stats.t.ppf(0.975, df=n - 1)
-                ci_lower = mean - t_val * sem
-                ci_upper = mean + t_val * sem
-            else:
-                ci_lower = ci_upper = mean
-
-            rows.append({
-                "metric": f"memory_reduction_{mode}",
-                "unit": "%",
-                "n_corpora": n,
-                "mean": mean,
-                "std": std,
-                "ci_lower_95": ci_lower,
-                "ci_upper_95": ci_upper,
-                "min": float(np.min(arr)),
-                "max": float(np.max(arr)),
-            })
+            rows.append(_cross_corpus_row(f"memory_reduction_{mode}", "%", reductions))
 
         if speedups:
-            arr = np.array(speedups)
-            n = len(arr)
-            mean = float(np.mean(arr))
-            std = float(np.std(arr, ddof=1)) if n > 1 else 0.0
-
-            if n > 1:
-                sem = std / np.sqrt(n)
-                t_val = stats.t.ppf(0.975, df=n - 1)
-                ci_lower = mean - t_val * sem
-                ci_upper = mean + t_val * sem
-            else:
-                ci_lower = ci_upper = mean
-
-            rows.append({
-                "metric": "load_time_speedup",
-                "unit": "x",
-                "n_corpora": n,
-                "mean": mean,
-                "std": std,
-                "ci_lower_95": ci_lower,
-                "ci_upper_95": ci_upper,
-                "min": float(np.min(arr)),
-                "max": float(np.max(arr)),
-            })
+            rows.append(_cross_corpus_row("load_time_speedup", "x", speedups))
 
     df = pd.DataFrame(rows)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    with _open_csv(output_path) as f:
+        df.to_csv(f, index=False)
+
+
+def write_all(
+    tasks: Iterable[tuple[Callable[..., Any], tuple]],
+    max_workers: int | None = None,
+) -> None:
+    """Run independent writers on a thread pool.
+
+    Each writer owns its output file, so the writes can overlap. Threads
+    only gain where the GIL is released, mostly in the file writes and
+    pandas serialization; formatting rows is still serial.
+
+    Args:
+        tasks: (writer, args) pairs, e.g.
+            ``(write_memory_summary_csv, (results, path))``
+        max_workers: Writers run at once (None uses the executor default)
+
+    Raises:
+        Exception: The first error raised by a writer, after all writers
+            have finished
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(fn, *args) for fn, args in tasks]
+    for future in as_completed(futures):
+        future.result()
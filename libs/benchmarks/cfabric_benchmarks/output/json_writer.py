@@ -0,0 +1,44 @@
+"""JSON output utilities for benchmark results."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from pydantic_core import to_json
+
+
+def write_json(data: Any, output_path: Path) -> None:
+    """Write data to a JSON file with two-space indentation.
+
+    Serialization runs in pydantic-core, so pydantic models can be passed
+    as they are, also nested in lists and dicts, without a model_dump()
+    copy first. Paths, datetimes and the like are written as strings, as
+    ``model_dump(mode="json")`` would. Non-ASCII text is written as UTF-8
+    rather than escaped.
+
+    Args:
+        data: Models, or lists/dicts of models and JSON-compatible values
+        output_path: Path to output JSON file
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(to_json(data, indent=2))
+
+
+def write_jsonl(items: Iterable[Any], output_path: Path) -> None:
+    """Write items to a JSON Lines file, one compact JSON value per line.
+
+    Each item is serialized and written on its own, so a long list of
+    measurements is never held as one JSON document in memory. Values are
+    encoded as in :func:`write_json`.
+
+    Args:
+        items: Models or JSON-compatible values
+        output_path: Path to output JSONL file
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "wb") as f:
+        for item in items:
+            f.write(to_json(item))
+            f.write(b"\n")
@@ -6,6 +6,7 @@ import json
 from pathlib import Path
 
 import numpy as np
+from pydantic import TypeAdapter
 
 from cfabric_benchmarks.models.latency import (
     LatencyBenchmarkResult,
@@ -16,6 +17,9 @@ from cfabric_benchmarks.models.memory import CorpusStats, MemoryBenchmarkResult
 from cfabric_benchmarks.models.progressive import ProgressiveLoadResult
 from cfabric_benchmarks.models.statistics import StatisticalSummary
 
+# Parses queries.json straight into models, without a dict per query first
+_QUERY_LIST = TypeAdapter(list[SearchQuery])
+
 
 def _make_memory_stats(mean: float) -> StatisticalSummary:
     """Create a minimal StatisticalSummary with just the mean value."""
@@ -155,12 +159,11 @@ def load_progressive_result(results_dir: Path) -> ProgressiveLoadResult | None:
     tf_scaling = None
     cf_scaling = None
     if scaling_path.exists():
-        with open(scaling_path) as f:
-            scaling_data = json.load(f)
-            if "tf" in scaling_data:
-                tf_scaling = ScalingAnalysis(**scaling_data["tf"])
-            if "cf" in scaling_data:
-                cf_scaling = ScalingAnalysis(**scaling_data["cf"])
+        scaling_data = json.loads(scaling_path.read_bytes())
+        if "tf" in scaling_data:
+            tf_scaling = ScalingAnalysis(**scaling_data["tf"])
+        if "cf" in scaling_data:
+            cf_scaling = ScalingAnalysis(**scaling_data["cf"])
 
     return ProgressiveLoadResult(
         max_corpora=max_corpora,
@@ -190,8 +193,7 @@ def load_latency_result(results_dir: Path) -> LatencyBenchmarkResult | None:
         return None
 
     # Load queries
-    with open(queries_path) as f:
-        queries = [SearchQuery(**q) for q in json.load(f)]
+    queries = _QUERY_LIST.validate_json(queries_path.read_bytes())
 
     # Load measurements
     measurements = []
@@ -225,15 +227,18 @@ def load_latency_result(results_dir: Path) -> LatencyBenchmarkResult | None:
     def make_stats(times: list[float]) -> StatisticalSummary | None:
         if not times:
             return None
-        mean_val = float(np.mean(times))
-        std_val = float(np.std(times))
-        min_val = float(np.min(times))
-        max_val = float(np.max(times))
+        arr = np.asarray(times, dtype=np.float64)
+        mean_val = float(arr.mean())
+        std_val = float(arr.std())
+        # One partition of the data for the extremes and all percentiles
+        min_val, p25, p50, p75, p90, p95, p99, max_val = np.percentile(
+            arr, [0, 25, 50, 75, 90, 95, 99, 100]
+        ).tolist()
         return StatisticalSummary(
             metric_name="latency",
             unit="ms",
             mean=mean_val,
-            median=float(np.median(times)),
+            median=p50,
             std=std_val,
             variance=std_val**2,
             min=min_val,
@@ -242,12 +247,12 @@ def load_latency_result(results_dir: Path) -> LatencyBenchmarkResult | None:
             n=len(times),
             ci_lower=mean_val - 1.96 * std_val / np.sqrt(len(times)),
             ci_upper=mean_val + 1.96 * std_val / np.sqrt(len(times)),
-            p25=float(np.percentile(times, 25)),
-            p50=float(np.percentile(times, 50)),
-            p75=float(np.percentile(times, 75)),
-            p90=float(np.percentile(times, 90)),
-            p95=float(np.percentile(times, 95)),
-            p99=float(np.percentile(times, 99)),
+            p25=p25,
+            p50=p50,
+            p75=p75,
+            p90=p90,
+            p95=p95,
+            p99=p99,
         )
 
     # Determine corpus from results directory name or default
@@ -45,6 +45,9 @@ def load_environment(input_path: Path) -> TestEnvironment:
 def create_run_directory(base_dir: Path, prefix: str = "") -> Path:
     """Create a timestamped directory for benchmark results.
 
+    The directory is always new: if a run started in the same second
+    already took the name, a counter is appended (``..._2``, ``..._3``).
+
     Args:
         base_dir: Base directory for results
         prefix: Optional prefix for the directory name
@@ -54,9 +57,17 @@ def create_run_directory(base_dir: Path, prefix: str = "") -> Path:
     """
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     dir_name = f"{prefix}_{timestamp}" if prefix else timestamp
+    base_dir.mkdir(parents=True, exist_ok=True)
     run_dir = base_dir / dir_name
-    run_dir.mkdir(parents=True, exist_ok=True)
-    return run_dir
+    suffix = 1
+    while True:
+        try:
+            # Atomic, so concurrent runs cannot end up sharing a directory
+            run_dir.mkdir()
+            return run_dir
+        except FileExistsError:
+            suffix += 1
+            run_dir = base_dir / f"{dir_name}_{suffix}"
 
 
 def format_environment_summary(env: TestEnvironment) -> str:
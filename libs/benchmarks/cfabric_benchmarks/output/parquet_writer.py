@@ -0,0 +1,88 @@
+"""Parquet output utilities for raw benchmark measurements.
+
+Optional alternative to the raw-table CSV writers: numbers are stored in
+typed, compressed columns instead of text. Requires pyarrow (the
+``parquet`` extra). The summary tables and the result loaders stay CSV.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+
+from cfabric_benchmarks.models.latency import QueryMeasurement
+from cfabric_benchmarks.models.memory import MemoryMeasurement
+from cfabric_benchmarks.models.progressive import ProgressiveLoadStep
+from cfabric_benchmarks.output.csv_writer import (
+    LATENCY_MEASUREMENT_COLUMNS,
+    MEMORY_MEASUREMENT_COLUMNS,
+    PROGRESSIVE_STEP_COLUMNS,
+)
+
+
+def _write_columns_parquet(columns: Sequence[str], items: Sequence, output_path: Path) -> None:
+    """Write model attributes to Parquet, one column per attribute.
+
+    Columns are collected straight from the models, without a dict per
+    row; pyarrow infers their types, so lists such as ``corpora_loaded``
+    become list columns.
+
+    Args:
+        columns: Model attribute names, in column order
+        items: Models to write, one row each
+        output_path: Path to output Parquet file
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Parquet output. "
+            "Install it with: pip install cfabric-benchmarks[parquet]"
+        ) from e
+
+    table = pa.table({name: [getattr(item, name) for item in items] for name in columns})
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, output_path)
+
+
+def write_memory_measurements_parquet(
+    measurements: list[MemoryMeasurement],
+    output_path: Path,
+) -> None:
+    """Write memory measurements to Parquet.
+
+    Args:
+        measurements: List of memory measurements
+        output_path: Path to output Parquet file
+    """
+    _write_columns_parquet(MEMORY_MEASUREMENT_COLUMNS, measurements, output_path)
+
+
+def write_latency_measurements_parquet(
+    measurements: list[QueryMeasurement],
+    output_path: Path,
+) -> None:
+    """Write latency measurements to Parquet.
+
+    Args:
+        measurements: List of query measurements
+        output_path: Path to output Parquet file
+    """
+    _write_columns_parquet(LATENCY_MEASUREMENT_COLUMNS, measurements, output_path)
+
+
+def write_progressive_steps_parquet(
+    steps: list[ProgressiveLoadStep],
+    output_path: Path,
+) -> None:
+    """Write progressive loading steps to Parquet.
+
+    Args:
+        steps: List of progressive load steps
+        output_path: Path to output Parquet file
+    """
+    _write_columns_parquet(PROGRESSIVE_STEP_COLUMNS, steps, output_path)
@@ -2,6 +2,7 @@
 
 from cfabric_benchmarks.runners.base import (
     BaseBenchmarkRunner,
+    apply_tf_cache_settings,
     get_corpus_name,
     get_corpus_stats,
     load_cf_api,
@@ -9,12 +10,16 @@ from cfabric_benchmarks.runners.base import (
 )
 from cfabric_benchmarks.runners.isolation import (
     IsolatedResult,
+    Stopwatch,
     WorkerPool,
     get_dir_size_mb,
+    get_mapped_resident_mb,
     get_memory_mb,
+    get_pss_mb,
     get_total_memory_mb,
     measure_memory_in_subprocess,
     run_isolated,
+    stopwatch,
 )
 from cfabric_benchmarks.runners.latency import LatencyBenchmarkRunner
 from cfabric_benchmarks.runners.memory import MemoryBenchmarkRunner
@@ -23,18 +28,23 @@ from cfabric_benchmarks.runners.progressive import ProgressiveLoadRunner
 __all__ = [
     # Base
     "BaseBenchmarkRunner",
+    "apply_tf_cache_settings",
     "get_corpus_name",
     "get_corpus_stats",
     "load_cf_api",
     "load_tf_api",
     # Isolation
     "IsolatedResult",
+    "Stopwatch",
     "WorkerPool",
     "get_dir_size_mb",
+    "get_mapped_resident_mb",
     "get_memory_mb",
+    "get_pss_mb",
     "get_total_memory_mb",
     "measure_memory_in_subprocess",
     "run_isolated",
+    "stopwatch",
     # Runners
     "LatencyBenchmarkRunner",
     "MemoryBenchmarkRunner",
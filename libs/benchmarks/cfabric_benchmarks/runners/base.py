@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
+from time import monotonic
 from typing import Any, Generic, TypeVar
 
 from cfabric_benchmarks.models.config import BenchmarkConfig
@@ -11,6 +13,12 @@ from cfabric_benchmarks.models.config import BenchmarkConfig
 
 T = TypeVar("T")
 
+# Opt-in pickle protocol for Text-Fabric's .tf/ binary cache (unset = TF default)
+TF_PICKLE_PROTOCOL_ENV = "CFBENCH_TF_PICKLE_PROTOCOL"
+
+# Minimum seconds between progress messages from inner benchmark loops
+PROGRESS_INTERVAL = 2.0
+
 
 class BaseBenchmarkRunner(ABC, Generic[T]):
     """Abstract base class for benchmark runners.
@@ -26,6 +34,7 @@ class BaseBenchmarkRunner(ABC, Generic[T]):
             config: Benchmark configuration
         """
         self.config = config
+        self._last_progress = float("-inf")
 
     @abstractmethod
     def run(self, **kwargs) -> T:
@@ -53,6 +62,22 @@ class BaseBenchmarkRunner(ABC, Generic[T]):
         """
         print(f"[{self.name()}] {message}", flush=True)
 
+    def log_progress(self, message: str, final: bool = False) -> None:
+        """Log a progress message, at most once per PROGRESS_INTERVAL.
+
+        For loops that could report on every step: messages arriving
+        sooner than the interval after the last one are dropped, so slow
+        terminals and log collectors are not flooded.
+
+        Args:
+            message: Message to log
+            final: Log regardless of the interval (e.g. for the last step)
+        """
+        now = monotonic()
+        if final or now - self._last_progress >= PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.log(message)
+
 
 def get_corpus_name(source: str | Path) -> str:
     """Extract corpus name from path.
@@ -75,6 +100,24 @@ def get_corpus_name(source: str | Path) -> str:
     return path.parent.name.upper()
 
 
+def apply_tf_cache_settings() -> None:
+    """Apply opt-in Text-Fabric cache settings from the environment.
+
+    Set CFBENCH_TF_PICKLE_PROTOCOL=5 to have TF write its binary feature
+    cache with pickle protocol 5 instead of its built-in default (4).
+    Reads need no patching: pickle detects the protocol from the stream.
+    The setting is read from the environment so it also reaches spawned
+    worker processes.
+    """
+    protocol = os.environ.get(TF_PICKLE_PROTOCOL_ENV)
+    if not protocol:
+        return
+
+    import tf.core.data
+
+    tf.core.data.PICKLE_PROTOCOL = int(protocol)
+
+
 def load_tf_api(source: str | Path) -> Any:
     """Load Text-Fabric API for a corpus.
 
@@ -86,6 +129,8 @@ def load_tf_api(source: str | Path) -> Any:
     """
     from tf.fabric import Fabric as TFFabric
 
+    apply_tf_cache_settings()
+
     tf = TFFabric(locations=str(source), silent="deep")
     return tf.loadAll(silent="deep")
 
@@ -121,6 +166,6 @@ def get_corpus_stats(api: Any) -> dict:
         "max_slot": api.F.otype.maxSlot,
         "max_node": api.F.otype.maxNode,
         "node_types": len(api.F.otype.all),
-        "node_features": len([f for f in dir(api.F) if not f.startswith("_")]),
-        "edge_features": len([f for f in dir(api.E) if not f.startswith("_")]),
+        "node_features": len(api.Fall()),
+        "edge_features": len(api.Eall()),
     }
@@ -9,10 +9,11 @@ from __future__ import annotations
 import gc
 import multiprocessing as mp
 import os
-import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
+from time import perf_counter, perf_counter_ns
 from typing import Any, Literal, TypeVar
 
 import psutil
@@ -20,6 +21,11 @@ import psutil
 
 T = TypeVar("T")
 
+# On Linux RSS is read straight from /proc/<pid>/statm: a single small read
+# instead of the several /proc files psutil parses per memory_info() call
+_HAS_STATM = os.path.exists("/proc/self/statm")
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
 
 def _isolated_worker(
     queue: "mp.Queue[IsolatedResult]",
@@ -31,7 +37,7 @@ def _isolated_worker(
 
     Must be at module level to be picklable for spawn context.
     """
-    start_time = time.perf_counter()
+    start_time = perf_counter()
     try:
         result = fn(*fn_args, **fn_kwargs)
 
@@ -39,7 +45,7 @@ def _isolated_worker(
         gc.collect()
         memory = get_memory_mb()
 
-        execution_time = time.perf_counter() - start_time
+        execution_time = perf_counter() - start_time
         queue.put(
             IsolatedResult(
                 success=True,
@@ -49,7 +55,7 @@ def _isolated_worker(
             )
         )
     except Exception as e:
-        execution_time = time.perf_counter() - start_time
+        execution_time = perf_counter() - start_time
         queue.put(
             IsolatedResult(
                 success=False,
@@ -58,9 +64,6 @@ def _isolated_worker(
             )
         )
 
-    # Keep process alive briefly for external memory measurement
-    time.sleep(1)
-
 
 @dataclass
 class IsolatedResult:
@@ -73,6 +76,38 @@ class IsolatedResult:
     execution_time_s: float = 0.0
 
 
+@dataclass
+class Stopwatch:
+    """Elapsed time of a block timed with `stopwatch`."""
+
+    elapsed_s: float = 0.0
+
+
+@contextmanager
+def stopwatch() -> Iterator[Stopwatch]:
+    """Time a block with the cyclic garbage collector paused.
+
+    A full collection runs first, so the block starts from a clean heap,
+    and automatic collections are disabled until the block ends, so no
+    collection pause lands inside the measurement. Time is taken with
+    ``perf_counter_ns`` to avoid float rounding on short intervals.
+
+    Yields:
+        Stopwatch whose ``elapsed_s`` is set when the block exits
+    """
+    watch = Stopwatch()
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    start = perf_counter_ns()
+    try:
+        yield watch
+    finally:
+        watch.elapsed_s = (perf_counter_ns() - start) / 1e9
+        if was_enabled:
+            gc.enable()
+
+
 def get_memory_mb(pid: int | None = None) -> float:
     """Get process memory usage in MB (RSS).
 
@@ -82,6 +117,14 @@ def get_memory_mb(pid: int | None = None) -> float:
     Returns:
         Memory usage in megabytes (RSS - Resident Set Size)
     """
+    if _HAS_STATM:
+        try:
+            with open(f"/proc/{pid or 'self'}/statm", "rb") as f:
+                resident_pages = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return 0.0
+        return resident_pages * _PAGE_SIZE / 1024 / 1024
+
     try:
         proc = psutil.Process(pid or os.getpid())
         return proc.memory_info().rss / 1024 / 1024
@@ -89,21 +132,100 @@ def get_memory_mb(pid: int | None = None) -> float:
         return 0.0
 
 
-def get_total_memory_mb(pids: list[int]) -> float:
-    """Get total memory usage across multiple processes in MB (RSS).
+def get_pss_mb(pid: int | None = None) -> float:
+    """Get process memory usage in MB (PSS).
+
+    PSS (Proportional Set Size) charges each shared page to the processes
+    mapping it in equal parts, so unlike RSS it can be summed across workers
+    that share memory-mapped files or copy-on-write pages.
+
+    Args:
+        pid: Process ID to measure. If None, uses current process.
+
+    Returns:
+        Memory usage in megabytes, or 0.0 where PSS is not available
+    """
+    try:
+        with open(f"/proc/{pid or 'self'}/smaps_rollup", "rb") as f:
+            for line in f:
+                if line.startswith(b"Pss:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    try:
+        proc = psutil.Process(pid or os.getpid())
+        return getattr(proc.memory_full_info(), "pss", 0) / 1024 / 1024
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return 0.0
+
+
+def get_total_memory_mb(pids: list[int], use_pss: bool = False) -> float:
+    """Get total memory usage across multiple processes in MB.
 
     Args:
         pids: List of process IDs to measure
+        use_pss: Sum PSS instead of RSS, so shared pages are counted once
 
     Returns:
         Total memory usage in megabytes
     """
+    measure = get_pss_mb if use_pss else get_memory_mb
     total = 0.0
     for pid in pids:
-        total += get_memory_mb(pid)
+        total += measure(pid)
     return total
 
 
+def get_mapped_resident_mb(path: Path, pid: int | None = None) -> dict[str, float]:
+    """Get the resident part of each file a process has mapped below a directory.
+
+    A memory-mapped file counts towards RSS only for the pages that have
+    actually been touched, so this separates what a lazy loader really reads
+    from the size of the files it maps.
+
+    Args:
+        path: Directory whose mapped files are reported
+        pid: Process ID to inspect. If None, uses current process.
+
+    Returns:
+        Resident megabytes keyed by file path relative to `path`; empty
+        where the platform does not expose per-mapping memory
+    """
+    try:
+        maps = psutil.Process(pid or os.getpid()).memory_maps(grouped=True)
+    except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError, NotImplementedError):
+        return {}
+
+    root = os.path.join(os.path.realpath(path), "")
+    return {
+        m.path[len(root):]: m.rss / 1024 / 1024
+        for m in maps
+        if m.path.startswith(root)
+    }
+
+
+def _iter_files(path: Path) -> Iterator[os.DirEntry]:
+    """Yield the files below a directory, without following symlinked dirs.
+
+    Args:
+        path: Directory to walk (a missing directory yields nothing)
+
+    Yields:
+        Directory entries of regular files
+    """
+    if not path.is_dir():
+        return
+    stack = [os.fspath(path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
 def get_dir_size_mb(path: Path) -> float:
     """Get total size of directory in MB.
 
@@ -113,9 +235,43 @@ def get_dir_size_mb(path: Path) -> float:
     Returns:
         Total size in megabytes
     """
-    if not path.exists():
-        return 0.0
-    total = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+    # DirEntry hands back cached stat data for regular files, so this costs
+    # one directory read per directory rather than a stat call per file
+    total = sum(entry.stat().st_size for entry in _iter_files(path))
+    return total / 1024 / 1024
+
+
+def warm_page_cache(path: Path) -> float:
+    """Read every file under a directory so it is resident in the page cache.
+
+    Used right before a timed cache load, so that the timing does not depend
+    on whether the OS happened to keep the files from an earlier step.
+    All files get a ``POSIX_FADV_WILLNEED`` hint first so the kernel can
+    queue their I/O together, then each is read through a reused buffer.
+
+    Args:
+        path: Cache directory (missing directories are ignored)
+
+    Returns:
+        Amount of data read in megabytes
+    """
+    files = [entry.path for entry in _iter_files(path)]
+
+    fadvise = getattr(os, "posix_fadvise", None)
+    if fadvise is not None:
+        for file in files:
+            fd = os.open(file, os.O_RDONLY)
+            try:
+                fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+
+    total = 0
+    buffer = bytearray(1 << 20)
+    for file in files:
+        with open(file, "rb", buffering=0) as f:
+            while n := f.readinto(buffer):
+                total += n
     return total / 1024 / 1024
 
 
@@ -175,20 +331,27 @@ class WorkerPool:
     def __init__(
         self,
         num_workers: int,
-        context: Literal["spawn", "fork"] = "spawn",
+        context: Literal["spawn", "fork", "forkserver"] = "spawn",
+        preload: list[str] | None = None,
     ):
         """Initialize worker pool.
 
         Args:
             num_workers: Number of worker processes
             context: Multiprocessing context to use
+            preload: Modules the forkserver imports once before forking
+                workers (only used with the 'forkserver' context, and only
+                effective before the forkserver process has started)
         """
         self.num_workers = num_workers
         self.context = context
         self._ctx = mp.get_context(context)
+        if context == "forkserver" and preload:
+            self._ctx.set_forkserver_preload(preload)
         self._processes: list[mp.Process] = []
         self._ready_events: list[mp.Event] = []
         self._start_event: mp.Event | None = None
+        self._release_event: mp.Event | None = None
         self._result_queue: mp.Queue | None = None
 
     def start_workers(
@@ -199,6 +362,12 @@ class WorkerPool:
     ) -> None:
         """Start worker processes.
 
+        Each worker is called as ``worker_fn(ready_event, start_event,
+        result_queue, release_event, *worker_args)``. After putting its result
+        it should wait on ``release_event``, which is set once the parent has
+        measured memory (see `release`), so it stays alive exactly as long
+        as needed.
+
         Args:
             worker_fn: Function for each worker to execute
             worker_args: Arguments for worker function
@@ -208,6 +377,7 @@ class WorkerPool:
 
         self._ready_events = [self._ctx.Event() for _ in range(self.num_workers)]
         self._start_event = self._ctx.Event()
+        self._release_event = self._ctx.Event()
         self._result_queue = self._ctx.Queue()
 
         for i in range(self.num_workers):
@@ -217,6 +387,7 @@ class WorkerPool:
                     self._ready_events[i],
                     self._start_event,
                     self._result_queue,
+                    self._release_event,
                     *worker_args,
                 ),
                 kwargs=worker_kwargs,
@@ -243,6 +414,11 @@ class WorkerPool:
         if self._start_event:
             self._start_event.set()
 
+    def release(self) -> None:
+        """Let workers exit once their memory has been measured."""
+        if self._release_event:
+            self._release_event.set()
+
     def get_results(self, timeout: float = 120.0) -> list[Any]:
         """Collect results from all workers.
 
@@ -261,10 +437,10 @@ class WorkerPool:
                     pass
         return results
 
-    def get_total_memory_mb(self) -> float:
-        """Get total memory usage across all workers."""
+    def get_total_memory_mb(self, use_pss: bool = False) -> float:
+        """Get total memory usage (RSS, or PSS if requested) across all workers."""
         pids = [p.pid for p in self._processes if p.pid is not None]
-        return get_total_memory_mb(pids)
+        return get_total_memory_mb(pids, use_pss=use_pss)
 
     def get_pids(self) -> list[int]:
         """Get list of worker process IDs."""
@@ -276,6 +452,7 @@ class WorkerPool:
         Args:
             timeout: Maximum time to wait for graceful shutdown
         """
+        self.release()
         for p in self._processes:
             p.join(timeout=timeout / len(self._processes) if self._processes else timeout)
             if p.is_alive():
@@ -285,6 +462,7 @@ class WorkerPool:
         self._processes = []
         self._ready_events = []
         self._start_event = None
+        self._release_event = None
         self._result_queue = None
 
     def __enter__(self) -> "WorkerPool":
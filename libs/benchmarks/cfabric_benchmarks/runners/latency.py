@@ -6,12 +6,12 @@ Measures search query latency for Text-Fabric and Context-Fabric.
 from __future__ import annotations
 
 import random
-import time
+from time import perf_counter
 from typing import Any, Literal
 
 from cfabric_benchmarks.analysis.comparison import (
-    compute_latency_stats_by_category,
-    compute_latency_stats_by_query,
+    compute_latency_stats_by_categories,
+    compute_latency_stats_by_queries,
 )
 from cfabric_benchmarks.analysis.statistics import compute_summary
 from cfabric_benchmarks.generators.validator import validate_queries_on_corpus
@@ -113,8 +113,10 @@ class LatencyBenchmarkRunner(BaseBenchmarkRunner[LatencyBenchmarkResult]):
             random.shuffle(query_order)
 
             for query_idx, query in enumerate(query_order, 1):
-                if query_idx % 10 == 0 or query_idx == 1:
-                    self.log(f"    Query {query_idx}/{len(query_order)}")
+                self.log_progress(
+                    f"    Query {query_idx}/{len(query_order)}",
+                    final=query_idx == len(query_order),
+                )
                 for impl, api in [("TF", tf_api), ("CF", cf_api)]:
                     for iteration in range(1, self.config.latency_iterations + 1):
                         measurement = self._measure_query(
@@ -129,16 +131,12 @@ class LatencyBenchmarkRunner(BaseBenchmarkRunner[LatencyBenchmarkResult]):
         category_stats = self._compute_category_statistics(measurements, queries)
 
         # Overall statistics
-        tf_overall = compute_summary(
-            [m.execution_time_ms for m in measurements if m.implementation == "TF" and m.success],
-            "tf_latency",
-            "ms",
-        )
-        cf_overall = compute_summary(
-            [m.execution_time_ms for m in measurements if m.implementation == "CF" and m.success],
-            "cf_latency",
-            "ms",
-        )
+        times: dict[str, list[float]] = {"TF": [], "CF": []}
+        for m in measurements:
+            if m.success:
+                times[m.implementation].append(m.execution_time_ms)
+        tf_overall = compute_summary(times["TF"], "tf_latency", "ms")
+        cf_overall = compute_summary(times["CF"], "cf_latency", "ms")
 
         return LatencyBenchmarkResult(
             corpus=corpus.name,
@@ -170,13 +168,18 @@ class LatencyBenchmarkRunner(BaseBenchmarkRunner[LatencyBenchmarkResult]):
         Returns:
             QueryMeasurement with timing data
         """
-        start = time.perf_counter()
         success = True
         error = None
         result_count = 0
+        template = query.template
 
+        start = perf_counter()
         try:
-            results = api.S.search(query.template)
+            # Resolve the search method first and restart the timer, so the
+            # lookup is not timed but a failing lookup is still recorded
+            search = api.S.search
+            start = perf_counter()
+            results = search(template)
             # Consume results to get actual count
             for _ in results:
                 result_count += 1
@@ -187,7 +190,7 @@ class LatencyBenchmarkRunner(BaseBenchmarkRunner[LatencyBenchmarkResult]):
             success = False
             error = str(e)
 
-        execution_time_ms = (time.perf_counter() - start) * 1000
+        execution_time_ms = (perf_counter() - start) * 1000
 
         return QueryMeasurement(
             query_id=query.id,
@@ -214,12 +217,7 @@ class LatencyBenchmarkRunner(BaseBenchmarkRunner[LatencyBenchmarkResult]):
         Returns:
             List of LatencyStatistics per query/implementation
         """
-        statistics = []
-        for query in queries:
-            for impl in ["TF", "CF"]:
-                stats = compute_latency_stats_by_query(measurements, query.id, impl)
-                statistics.append(stats)
-        return statistics
+        return compute_latency_stats_by_queries(measurements, [q.id for q in queries])
 
     def _compute_category_statistics(
         self,
@@ -235,12 +233,5 @@ class LatencyBenchmarkRunner(BaseBenchmarkRunner[LatencyBenchmarkResult]):
         Returns:
             List of LatencyStatistics per category/implementation
         """
-        statistics = []
         categories = ["lexical", "structural", "quantified", "complex"]
-        for category in categories:
-            for impl in ["TF", "CF"]:
-                stats = compute_latency_stats_by_category(
-                    measurements, queries, category, impl
-                )
-                statistics.append(stats)
-        return statistics
+        return compute_latency_stats_by_categories(measurements, queries, categories)
@@ -10,8 +10,10 @@ import gc
 import multiprocessing as mp
 import os
 import shutil
-import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Literal
 
 from cfabric_benchmarks.analysis.statistics import compute_summary
@@ -23,17 +25,57 @@ from cfabric_benchmarks.models.memory import (
 )
 from cfabric_benchmarks.runners.base import (
     BaseBenchmarkRunner,
+    apply_tf_cache_settings,
     get_corpus_name,
     get_corpus_stats,
 )
 from cfabric_benchmarks.runners.isolation import (
     WorkerPool,
     get_dir_size_mb,
+    get_mapped_resident_mb,
     get_memory_mb,
+    get_pss_mb,
     get_total_memory_mb,
     run_isolated,
+    stopwatch,
+    warm_page_cache,
 )
 
+# Modules imported once by the forkserver when spawn_context is "forkserver".
+# A forkserver lives for the whole benchmark run, so it serves TF and CF
+# workers alike and has to preload both.
+SPAWN_PRELOAD = ["numpy", "tf.fabric", "cfabric.core.fabric"]
+
+# Upper bound on how long a finished worker waits for the parent to measure
+# its memory; normally the parent releases it right after the measurement
+WORKER_RELEASE_TIMEOUT = 60.0
+
+# Thread-count variables pinned to 1 in parallel runs, so numerical libraries
+# in the measured subprocesses stay within their runner's CPUs
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def _pin_runner_cpus(slots: Any, workers: int) -> None:
+    """Pool initializer: confine this runner process to its own CPUs.
+
+    Each pool process takes a distinct slot and keeps the matching share of
+    the CPUs it may run on; the measurement subprocesses it starts inherit
+    that affinity. Without sched_setaffinity (non-Linux) only the thread
+    variables are set.
+    """
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = "1"
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    slot = slots.get()
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) < workers:
+        share = {cpus[slot % len(cpus)]}
+    else:
+        per_worker = len(cpus) // workers
+        share = set(cpus[slot * per_worker:(slot + 1) * per_worker])
+    os.sched_setaffinity(0, share)
+
 
 class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
     """Runner for memory benchmarks.
@@ -45,6 +87,50 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
     def name(self) -> str:
         return "MemoryBenchmark"
 
+    def run_many(
+        self,
+        corpora: list[CorpusConfig],
+    ) -> Iterator[MemoryBenchmarkResult]:
+        """Run the memory benchmark for several corpora.
+
+        With `config.parallel_corpora` above 1 the corpora are benchmarked
+        in that many worker processes at once. Each run still measures in
+        its own isolated subprocesses, pinned to a separate share of the
+        CPUs where the platform allows. Concurrent runs still share memory
+        bandwidth, caches and the page cache, so use this for quick sweeps
+        rather than for published numbers.
+
+        Args:
+            corpora: Corpus configurations
+
+        Yields:
+            One MemoryBenchmarkResult per corpus, in the order given
+        """
+        workers = min(self.config.parallel_corpora, len(corpora))
+        if workers <= 1:
+            for corpus in corpora:
+                self.log(f"Benchmarking {corpus.name}...")
+                yield self.run(corpus)
+            return
+
+        self.log(
+            f"Benchmarking {len(corpora)} corpora, {workers} at a time: "
+            f"{', '.join(c.name for c in corpora)}"
+        )
+        # Spawned, so each runner process starts clean; runs start their own
+        # worker subprocesses, which a (non-daemon) pool process may do
+        ctx = mp.get_context("spawn")
+        slots = ctx.Queue()
+        for slot in range(workers):
+            slots.put(slot)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_pin_runner_cpus,
+            initargs=(slots, workers),
+        ) as pool:
+            yield from pool.map(self.run, corpora)
+
     def run(
         self,
         corpus: CorpusConfig,
@@ -100,6 +186,8 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
                                 rss_before_mb=result.rss_before_mb,
                                 rss_after_mb=result.rss_after_mb,
                                 cache_size_mb=result.cache_size_mb,
+                                mapped_resident_mb=result.mapped_resident_mb,
+                                mapped_resident_by_file_mb=result.mapped_resident_by_file_mb,
                             )
                             measurements.append(result)
 
@@ -162,19 +250,32 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
         """
         self.log(f"    [{impl}] Single-process measurement...")
 
+        compile_time = None
         if impl == "TF":
-            result = run_isolated(_load_tf_and_measure, args=(source,))
+            result = run_isolated(
+                _load_tf_and_measure, args=(source, self.config.warm_cache)
+            )
         else:
-            result = run_isolated(_load_cf_and_measure, args=(source,))
+            if not (Path(source) / ".cfm").exists():
+                # Compile in its own process so the load measurement below
+                # starts from a fresh heap rather than one left by compilation
+                compiled = run_isolated(_compile_cf, args=(source,))
+                if not compiled.success:
+                    self.log(f"    [{impl}] Compile failed: {compiled.error}")
+                    return None
+                compile_time = compiled.result
+            result = run_isolated(
+                _load_cf_and_measure,
+                args=(
+                    source,
+                    self.config.cf_prefault,
+                    self.config.cf_prefault_threads,
+                    self.config.warm_cache,
+                ),
+            )
 
         if result.success and result.result:
-            if impl == "TF":
-                memory_mb, load_time, cache_size = result.result
-                compile_time = None
-            else:
-                # CF returns compile_time as 4th element
-                memory_mb, load_time, cache_size, compile_time = result.result
-                compile_time = compile_time if compile_time > 0 else None
+            memory_mb, load_time, cache_size, resident = result.result
             return MemoryMeasurement(
                 run_id=run_id,
                 corpus=get_corpus_name(source),
@@ -185,6 +286,8 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
                 rss_before_mb=0,
                 rss_after_mb=memory_mb,
                 cache_size_mb=cache_size,
+                mapped_resident_mb=sum(resident.values()) if resident else None,
+                mapped_resident_by_file_mb=resident or None,
             )
 
         self.log(f"    [{impl}] Failed: {result.error}")
@@ -208,13 +311,20 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
         Returns:
             MemoryMeasurement or None if failed
         """
-        self.log(f"    [{impl}] Spawn mode ({self.config.num_workers} workers)...")
+        self.log(
+            f"    [{impl}] Spawn mode ({self.config.num_workers} workers, "
+            f"{self.config.spawn_context})..."
+        )
 
         try:
             worker_fn = _tf_spawn_worker if impl == "TF" else _cf_spawn_worker
 
-            with WorkerPool(self.config.num_workers, context="spawn") as pool:
-                start = time.perf_counter()
+            with WorkerPool(
+                self.config.num_workers,
+                context=self.config.spawn_context,
+                preload=SPAWN_PRELOAD,
+            ) as pool:
+                start = perf_counter()
                 pool.start_workers(worker_fn, worker_args=(source,))
 
                 if not pool.wait_for_ready(timeout=300):
@@ -224,10 +334,13 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
                 pool.signal_start()
                 results = pool.get_results(timeout=120)
 
-                load_time = time.perf_counter() - start
+                load_time = perf_counter() - start
                 total_memory = pool.get_total_memory_mb()
+                total_pss = pool.get_total_memory_mb(use_pss=True)
+                pool.release()
 
             per_worker = total_memory / self.config.num_workers
+            per_worker_pss = total_pss / self.config.num_workers if total_pss else None
 
             return MemoryMeasurement(
                 run_id=run_id,
@@ -240,6 +353,8 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
                 num_workers=self.config.num_workers,
                 total_rss_mb=total_memory,
                 per_worker_rss_mb=per_worker,
+                total_pss_mb=total_pss or None,
+                per_worker_pss_mb=per_worker_pss,
             )
 
         except Exception as e:
@@ -276,9 +391,10 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
             )
 
             if result.success and result.result:
-                main_rss, workers_rss = result.result
+                main_rss, workers_rss, total_pss = result.result
                 total_rss = main_rss + workers_rss
                 per_worker = total_rss / self.config.num_workers
+                per_worker_pss = total_pss / self.config.num_workers if total_pss else None
 
                 return MemoryMeasurement(
                     run_id=run_id,
@@ -291,6 +407,8 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
                     num_workers=self.config.num_workers,
                     total_rss_mb=total_rss,
                     per_worker_rss_mb=per_worker,
+                    total_pss_mb=total_pss or None,
+                    per_worker_pss_mb=per_worker_pss,
                 )
 
             self.log(f"    [{impl}] Fork failed: {result.error}")
@@ -342,73 +460,36 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
         Returns:
             Result with computed statistics
         """
-        # Single mode stats
-        tf_single = [
-            m.memory_used_mb
-            for m in result.measurements
-            if m.implementation == "TF" and m.mode == "single"
-        ]
-        cf_single = [
-            m.memory_used_mb
-            for m in result.measurements
-            if m.implementation == "CF" and m.mode == "single"
-        ]
-
-        if tf_single:
-            result.tf_memory_stats = compute_summary(tf_single, "tf_memory", "MB")
-        if cf_single:
-            result.cf_memory_stats = compute_summary(cf_single, "cf_memory", "MB")
+        # Sort the values into (implementation, mode) buckets in one pass
+        memory: dict[tuple[str, str], list[float]] = {}
+        load: dict[str, list[float]] = {"TF": [], "CF": []}
+        for m in result.measurements:
+            if m.mode == "single":
+                memory.setdefault((m.implementation, "single"), []).append(m.memory_used_mb)
+                load[m.implementation].append(m.load_time_s)
+            elif m.total_rss_mb:
+                memory.setdefault((m.implementation, m.mode), []).append(m.total_rss_mb)
+
+        stats_fields = {
+            # Single mode stats
+            ("TF", "single"): ("tf_memory_stats", "tf_memory"),
+            ("CF", "single"): ("cf_memory_stats", "cf_memory"),
+            # Spawn mode stats
+            ("TF", "spawn"): ("tf_spawn_stats", "tf_spawn"),
+            ("CF", "spawn"): ("cf_spawn_stats", "cf_spawn"),
+            # Fork mode stats
+            ("TF", "fork"): ("tf_fork_stats", "tf_fork"),
+            ("CF", "fork"): ("cf_fork_stats", "cf_fork"),
+        }
+        for key, values in memory.items():
+            field, metric_name = stats_fields[key]
+            setattr(result, field, compute_summary(values, metric_name, "MB"))
 
         # Load time stats
-        tf_load = [
-            m.load_time_s
-            for m in result.measurements
-            if m.implementation == "TF" and m.mode == "single"
-        ]
-        cf_load = [
-            m.load_time_s
-            for m in result.measurements
-            if m.implementation == "CF" and m.mode == "single"
-        ]
-
-        if tf_load:
-            result.tf_load_time_stats = compute_summary(tf_load, "tf_load_time", "s")
-        if cf_load:
-            result.cf_load_time_stats = compute_summary(cf_load, "cf_load_time", "s")
-
-        # Spawn mode stats
-        tf_spawn = [
-            m.total_rss_mb
-            for m in result.measurements
-            if m.implementation == "TF" and m.mode == "spawn" and m.total_rss_mb
-        ]
-        cf_spawn = [
-            m.total_rss_mb
-            for m in result.measurements
-            if m.implementation == "CF" and m.mode == "spawn" and m.total_rss_mb
-        ]
-
-        if tf_spawn:
-            result.tf_spawn_stats = compute_summary(tf_spawn, "tf_spawn", "MB")
-        if cf_spawn:
-            result.cf_spawn_stats = compute_summary(cf_spawn, "cf_spawn", "MB")
-
-        # Fork mode stats
-        tf_fork = [
-            m.total_rss_mb
-            for m in result.measurements
-            if m.implementation == "TF" and m.mode == "fork" and m.total_rss_mb
-        ]
-        cf_fork = [
-            m.total_rss_mb
-            for m in result.measurements
-            if m.implementation == "CF" and m.mode == "fork" and m.total_rss_mb
-        ]
-
-        if tf_fork:
-            result.tf_fork_stats = compute_summary(tf_fork, "tf_fork", "MB")
-        if cf_fork:
-            result.cf_fork_stats = compute_summary(cf_fork, "cf_fork", "MB")
+        if load["TF"]:
+            result.tf_load_time_stats = compute_summary(load["TF"], "tf_load_time", "s")
+        if load["CF"]:
+            result.cf_load_time_stats = compute_summary(load["CF"], "cf_load_time", "s")
 
         return result
 
@@ -416,72 +497,127 @@ class MemoryBenchmarkRunner(BaseBenchmarkRunner[MemoryBenchmarkResult]):
 # Worker functions (must be at module level for pickling)
 
 
-def _load_tf_and_measure(source: str) -> tuple[float, float, float]:
-    """Load TF corpus and measure memory."""
+def _load_tf_and_measure(
+    source: str, warm_cache: bool = True
+) -> tuple[float, float, float, None]:
+    """Load TF corpus and measure memory.
+
+    Args:
+        source: Path to corpus
+        warm_cache: Read the .tf cache into the page cache before timing
+
+    Returns:
+        Tuple of (memory_mb, load_time_s, cache_size_mb, None); TF reads its
+        cache into the heap, so there is no mapped residency to report
+    """
     from tf.fabric import Fabric as TFFabric
 
-    start = time.perf_counter()
-    tf = TFFabric(locations=source, silent="deep")
-    api = tf.loadAll(silent="deep")
-    load_time = time.perf_counter() - start
+    apply_tf_cache_settings()
+
+    if warm_cache:
+        warm_page_cache(Path(source) / ".tf")
+
+    with stopwatch() as watch:
+        tf = TFFabric(locations=source, silent="deep")
+        api = tf.loadAll(silent="deep")
+    load_time = watch.elapsed_s
 
     gc.collect()
     memory = get_memory_mb()
 
     cache_size = get_dir_size_mb(Path(source) / ".tf")
 
-    return memory, load_time, cache_size
+    return memory, load_time, cache_size, None
+
+
+def _compile_cf(source: str) -> float:
+    """Compile a corpus to CF's .cfm cache.
+
+    Args:
+        source: Path to corpus
+
+    Returns:
+        Compile time in seconds
+    """
+    from cfabric.core.fabric import Fabric as CFFabric
+
+    with stopwatch() as watch:
+        cf = CFFabric(locations=source, silent="deep")
+        cf.loadAll(silent="deep")
+    return watch.elapsed_s
+
 
+def _load_cf_and_measure(
+    source: str,
+    prefault: bool = False,
+    prefault_threads: int = 1,
+    warm_cache: bool = True,
+) -> tuple[float, float, float, dict[str, float]]:
+    """Load CF corpus from its .cfm cache and measure memory.
 
-def _load_cf_and_measure(source: str) -> tuple[float, float, float, float]:
-    """Load CF corpus and measure memory.
+    The cache must already exist; see `_compile_cf`.
+
+    Args:
+        source: Path to corpus
+        prefault: Page in all mapped arrays before stopping the load timer,
+            so load time and memory reflect resident data rather than
+            mmap setup only
+        prefault_threads: Threads that page in the arrays concurrently
+        warm_cache: Read the .cfm cache into the page cache before timing
 
     Returns:
-        Tuple of (memory_mb, load_time_s, cache_size_mb, compile_time_s)
+        Tuple of (memory_mb, load_time_s, cache_size_mb, resident_mb_by_file)
     """
     from cfabric.core.fabric import Fabric as CFFabric
 
-    compile_time = 0.0
     cache_path = Path(source) / ".cfm"
 
-    # Check if we need to compile first
-    if not cache_path.exists():
-        # Compile and discard to get compile time
-        compile_start = time.perf_counter()
-        cf_compile = CFFabric(locations=source, silent="deep")
-        cf_compile.loadAll(silent="deep")
-        compile_time = time.perf_counter() - compile_start
-        del cf_compile
-        gc.collect()
-
-    # Now measure load from cache
+    if warm_cache:
+        warm_page_cache(cache_path)
+
     # Embedding structures are preloaded automatically by default
-    start = time.perf_counter()
-    cf = CFFabric(locations=source, silent="deep")
-    api = cf.loadAll(silent="deep")
-    load_time = time.perf_counter() - start
+    with stopwatch() as watch:
+        cf = CFFabric(locations=source, silent="deep")
+        api = cf.loadAll(silent="deep")
+        if prefault:
+            _prefault_cf(cf, prefault_threads)
+    load_time = watch.elapsed_s
 
     gc.collect()
     memory = get_memory_mb()
+    resident = get_mapped_resident_mb(cache_path)
 
     cache_size = get_dir_size_mb(cache_path)
 
-    return memory, load_time, cache_size, compile_time
+    return memory, load_time, cache_size, resident
+
+
+def _prefault_cf(cf: Any, threads: int = 1) -> None:
+    """Page in every array CF has memory-mapped from its .cfm cache."""
+    mmap_mgr = getattr(cf, "_cfm_mmap_mgr", None)
+    if mmap_mgr is not None:
+        mmap_mgr.prefault(threads=threads)
 
 
 def _get_tf_corpus_stats(source: str) -> dict:
     """Get corpus stats via TF."""
     from tf.fabric import Fabric as TFFabric
 
+    apply_tf_cache_settings()
+
     tf = TFFabric(locations=source, silent="deep")
     api = tf.loadAll(silent="deep")
     return get_corpus_stats(api)
 
 
-def _tf_spawn_worker(ready_event, start_event, result_queue, source: str):
+def _tf_spawn_worker(
+    ready_event, start_event, result_queue, release_event, source: str
+):
     """TF worker for spawn mode."""
     from tf.fabric import Fabric as TFFabric
 
+    apply_tf_cache_settings()
+
     tf = TFFabric(locations=source, silent="deep")
     api = tf.loadAll(silent="deep")
 
@@ -494,10 +630,13 @@ def _tf_spawn_worker(ready_event, start_event, result_queue, source: str):
     gc.collect()
     mem = get_memory_mb()
     result_queue.put((os.getpid(), mem))
-    time.sleep(2)
+    # Stay alive until the parent has read this process's memory
+    release_event.wait(timeout=WORKER_RELEASE_TIMEOUT)
 
 
-def _cf_spawn_worker(ready_event, start_event, result_queue, source: str):
+def _cf_spawn_worker(
+    ready_event, start_event, result_queue, release_event, source: str
+):
     """CF worker for spawn mode.
 
     Embedding structures are preloaded automatically by default.
@@ -516,11 +655,19 @@ def _cf_spawn_worker(ready_event, start_event, result_queue, source: str):
     gc.collect()
     mem = get_memory_mb()
     result_queue.put((os.getpid(), mem))
-    time.sleep(2)
+    # Stay alive until the parent has read this process's memory
+    release_event.wait(timeout=WORKER_RELEASE_TIMEOUT)
 
 
 def _exercise_features(api: Any) -> int:
-    """Access string features to exercise memory."""
+    """Access string features to exercise memory.
+
+    Both implementations read every value through ``F.<feature>.v``, with
+    no CF-only read-ahead, so TF and CF workers do the same work and their
+    memory is comparable.
+
+    Returns the number of (slot, feature) pairs that carry a value.
+    """
     count = 0
     string_features = []
 
@@ -537,19 +684,26 @@ def _exercise_features(api: Any) -> int:
             string_features.append(getattr(api.F, fname))
 
     max_slot = min(api.F.otype.maxSlot, 50000)
-    for n in range(1, max_slot + 1):
-        for feat in string_features:
-            val = feat.v(n)
-            if val:
-                count += 1
+    nodes = range(1, max_slot + 1)
+    for feat in string_features:
+        v = feat.v
+        count += sum(1 for n in nodes if v(n))
 
     return count
 
 
-def _run_tf_fork_scenario(source: str, num_workers: int) -> tuple[float, float]:
-    """Run TF fork scenario."""
+def _run_tf_fork_scenario(
+    source: str, num_workers: int
+) -> tuple[float, float, float]:
+    """Run TF fork scenario.
+
+    Returns the parent's RSS, the workers' summed RSS, and the PSS of parent
+    and workers together (0.0 where PSS is not available).
+    """
     from tf.fabric import Fabric as TFFabric
 
+    apply_tf_cache_settings()
+
     tf = TFFabric(locations=source, silent="deep")
     api = tf.loadAll(silent="deep")
 
@@ -559,14 +713,16 @@ def _run_tf_fork_scenario(source: str, num_workers: int) -> tuple[float, float]:
     ctx = mp.get_context("fork")
     worker_queue = ctx.Queue()
 
-    def worker(api_ref, q):
+    release_event = ctx.Event()
+
+    def worker(api_ref, q, release):
         _exercise_features(api_ref)
         q.put(os.getpid())
-        time.sleep(2)
+        release.wait(timeout=WORKER_RELEASE_TIMEOUT)
 
     processes = []
     for _ in range(num_workers):
-        p = ctx.Process(target=worker, args=(api, worker_queue))
+        p = ctx.Process(target=worker, args=(api, worker_queue, release_event))
         p.start()
         processes.append(p)
 
@@ -578,18 +734,25 @@ def _run_tf_fork_scenario(source: str, num_workers: int) -> tuple[float, float]:
 
     pids = [p.pid for p in processes]
     workers_rss = get_total_memory_mb(pids)
+    total_pss = get_pss_mb() + get_total_memory_mb(pids, use_pss=True)
+    release_event.set()
 
     for p in processes:
         p.join(timeout=5)
         if p.is_alive():
             p.terminate()
 
-    return main_rss, workers_rss
+    return main_rss, workers_rss, total_pss
 
 
-def _run_cf_fork_scenario(source: str, num_workers: int) -> tuple[float, float]:
+def _run_cf_fork_scenario(
+    source: str, num_workers: int
+) -> tuple[float, float, float]:
     """Run CF fork scenario.
 
+    Returns the parent's RSS, the workers' summed RSS, and the PSS of parent
+    and workers together (0.0 where PSS is not available).
+
     Embedding structures are preloaded automatically by default.
     """
     from cfabric.core.fabric import Fabric as CFFabric
@@ -603,14 +766,16 @@ def _run_cf_fork_scenario(source: str, num_workers: int) -> tuple[float, float]:
     ctx = mp.get_context("fork")
     worker_queue = ctx.Queue()
 
-    def worker(api_ref, q):
+    release_event = ctx.Event()
+
+    def worker(api_ref, q, release):
         _exercise_features(api_ref)
         q.put(os.getpid())
-        time.sleep(2)
+        release.wait(timeout=WORKER_RELEASE_TIMEOUT)
 
     processes = []
     for _ in range(num_workers):
-        p = ctx.Process(target=worker, args=(api, worker_queue))
+        p = ctx.Process(target=worker, args=(api, worker_queue, release_event))
         p.start()
         processes.append(p)
 
@@ -622,10 +787,12 @@ def _run_cf_fork_scenario(source: str, num_workers: int) -> tuple[float, float]:
 
     pids = [p.pid for p in processes]
     workers_rss = get_total_memory_mb(pids)
+    total_pss = get_pss_mb() + get_total_memory_mb(pids, use_pss=True)
+    release_event.set()
 
     for p in processes:
         p.join(timeout=5)
         if p.is_alive():
             p.terminate()
 
-    return main_rss, workers_rss
+    return main_rss, workers_rss, total_pss
@@ -6,7 +6,6 @@ Measures memory scaling as multiple corpora are loaded sequentially.
 from __future__ import annotations
 
 import gc
-import time
 from pathlib import Path
 from typing import Any, Literal
 
@@ -17,8 +16,8 @@ from cfabric_benchmarks.models.progressive import (
     ProgressiveLoadStep,
     ScalingAnalysis,
 )
-from cfabric_benchmarks.runners.base import BaseBenchmarkRunner
-from cfabric_benchmarks.runners.isolation import get_memory_mb, run_isolated
+from cfabric_benchmarks.runners.base import BaseBenchmarkRunner, apply_tf_cache_settings
+from cfabric_benchmarks.runners.isolation import get_memory_mb, run_isolated, stopwatch
 
 
 class ProgressiveLoadRunner(BaseBenchmarkRunner[ProgressiveLoadResult]):
@@ -228,16 +227,18 @@ def _tf_progressive_loader(
     """Load TF corpora progressively and measure memory."""
     from tf.fabric import Fabric as TFFabric
 
+    apply_tf_cache_settings()
+
     results = []
     loaded_apis = []
     loaded_names = []
     cumulative_time = 0.0
 
     for i, (path, name) in enumerate(zip(corpus_paths, corpus_names)):
-        start = time.perf_counter()
-        tf = TFFabric(locations=path, silent="deep")
-        api = tf.loadAll(silent="deep")
-        load_time = time.perf_counter() - start
+        with stopwatch() as watch:
+            tf = TFFabric(locations=path, silent="deep")
+            api = tf.loadAll(silent="deep")
+        load_time = watch.elapsed_s
         cumulative_time += load_time
 
         loaded_apis.append(api)
@@ -264,11 +265,11 @@ def _cf_progressive_loader(
     cumulative_time = 0.0
 
     for i, (path, name) in enumerate(zip(corpus_paths, corpus_names)):
-        start = time.perf_counter()
-        cf = CFFabric(locations=path, silent="deep")
-        api = cf.loadAll(silent="deep")
-        # Embedding structures are preloaded automatically by default
-        load_time = time.perf_counter() - start
+        with stopwatch() as watch:
+            cf = CFFabric(locations=path, silent="deep")
+            api = cf.loadAll(silent="deep")
+            # Embedding structures are preloaded automatically by default
+        load_time = watch.elapsed_s
         cumulative_time += load_time
 
         loaded_apis.append(api)
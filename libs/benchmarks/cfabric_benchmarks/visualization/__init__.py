@@ -1,5 +1,15 @@
 """Visualization tools for benchmark results."""
 
+import os
+import sys
+
+import matplotlib
+
+# Charts are only ever saved to files, so skip GUI backend detection, unless
+# the user picked a backend (MPLBACKEND) or pyplot is already in use
+if "MPLBACKEND" not in os.environ and "matplotlib.pyplot" not in sys.modules:
+    matplotlib.use("Agg")
+
 from cfabric_benchmarks.visualization.charts import (
     COLORS,
     create_latency_distribution_chart,
@@ -11,6 +21,7 @@ from cfabric_benchmarks.visualization.charts import (
 )
 from cfabric_benchmarks.visualization.reports import (
     generate_full_report,
+    render_charts,
     save_individual_charts,
 )
 
@@ -26,5 +37,6 @@ __all__ = [
     "create_latency_percentiles_chart",
     # Reports
     "generate_full_report",
+    "render_charts",
     "save_individual_charts",
 ]
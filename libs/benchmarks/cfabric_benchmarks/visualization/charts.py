@@ -5,6 +5,7 @@ Uses dark mode styling for reusable visualizations.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -37,10 +38,143 @@ def setup_dark_style() -> None:
             "axes.labelcolor": "#e0e0e0",
             "xtick.color": "#e0e0e0",
             "ytick.color": "#e0e0e0",
+            "text.usetex": False,
         },
     )
 
 
+def _format_mb(val: float) -> str:
+    """Format a memory amount in MB, switching to GB from 1000 MB."""
+    return f"{val:.0f} MB" if val < 1000 else f"{val/1024:.1f} GB"
+
+
+def _num_workers(result: MemoryBenchmarkResult, default: int = 4) -> int:
+    """Worker count of the first parallel measurement in a result."""
+    for m in result.measurements:
+        if m.num_workers:
+            return m.num_workers
+    return default
+
+
+def _comparison_bars(
+    ax: Any,
+    values: list[float],
+    ylabel: str,
+    title: str,
+    fmt: Callable[[float], str],
+    errors: list[float] | None = None,
+) -> None:
+    """Draw a labelled TF vs CF bar pair with headroom for the ratio badge.
+
+    Args:
+        ax: Matplotlib axes
+        values: TF and CF values
+        ylabel: Y-axis label
+        title: Panel title
+        fmt: Formats a value for the label above its bar
+        errors: Optional error bar sizes
+    """
+    top = max(values)
+    bars = ax.bar(
+        ["Text-Fabric", "Context-Fabric"],
+        values,
+        yerr=errors,
+        color=[COLORS["tf"], COLORS["cf"]],
+        edgecolor="white",
+        linewidth=2,
+        capsize=5 if errors else 0,
+    )
+    ax.set_ylabel(ylabel, fontsize=14)
+    ax.set_title(title, fontsize=16, fontweight="bold", pad=15)
+    ax.tick_params(axis="both", labelsize=13)
+    ax.set_ylim(0, top * 1.35)
+    for bar, val in zip(bars, values):
+        ax.text(
+            bar.get_x() + bar.get_width() / 2,
+            bar.get_height() + top * 0.05,
+            fmt(val),
+            ha="center",
+            va="bottom",
+            fontsize=15,
+            fontweight="bold",
+        )
+
+
+def _ratio_badge(ax: Any, label: str) -> None:
+    """Put a highlighted TF/CF comparison label at the top of a panel."""
+    ax.text(
+        0.5,
+        0.92,
+        label,
+        transform=ax.transAxes,
+        ha="center",
+        va="top",
+        fontsize=16,
+        color=COLORS["cf"],
+        fontweight="bold",
+        bbox=dict(
+            boxstyle="round",
+            facecolor="#1a1a2e",
+            edgecolor=COLORS["cf"],
+            alpha=0.8,
+        ),
+    )
+
+
+def _mean_pss_per_worker(
+    result: MemoryBenchmarkResult, impl: str, mode: str
+) -> float | None:
+    """Average per-worker PSS over the runs of one implementation and mode."""
+    values = [
+        m.per_worker_pss_mb
+        for m in result.measurements
+        if m.implementation == impl and m.mode == mode and m.per_worker_pss_mb
+    ]
+    return float(np.mean(values)) if values else None
+
+
+def _annotate_pss(ax: Any, result: MemoryBenchmarkResult, mode: str) -> None:
+    """Show per-worker PSS under the bars, when it was measured.
+
+    RSS counts pages shared through mmap or copy-on-write once per worker;
+    PSS splits them between the workers, which is the real cost of sharing.
+    """
+    tf_pss = _mean_pss_per_worker(result, "TF", mode)
+    cf_pss = _mean_pss_per_worker(result, "CF", mode)
+    if not tf_pss or not cf_pss:
+        return
+    ax.set_xlabel(
+        f"PSS per worker: {tf_pss:.0f} vs {cf_pss:.0f} MB ({tf_pss / cf_pss:.1f}x less)",
+        fontsize=12,
+        color=COLORS["cf"],
+    )
+
+
+def _annotate_mapped_resident(ax: Any, result: MemoryBenchmarkResult) -> None:
+    """Show how much of CF's memory-mapped cache was resident after loading.
+
+    Mapped pages only count towards RSS once they are read, so this puts
+    CF's low RSS next to the size of the cache it maps.
+    """
+    runs = [
+        m
+        for m in result.measurements
+        if m.implementation == "CF"
+        and m.mode == "single"
+        and m.mapped_resident_mb is not None
+        and m.cache_size_mb
+    ]
+    if not runs:
+        return
+    resident = float(np.mean([m.mapped_resident_mb for m in runs]))
+    mapped = float(np.mean([m.cache_size_mb for m in runs]))
+    ax.set_xlabel(
+        f"CF mmap resident: {_format_mb(resident)} of {_format_mb(mapped)} mapped",
+        fontsize=12,
+        color=COLORS["cf"],
+    )
+
+
 def create_memory_comparison_chart(
     result: MemoryBenchmarkResult,
     output_path: Path,
@@ -71,36 +205,14 @@ def create_memory_comparison_chart(
         y=0.98,
     )
 
-    colors = [COLORS["tf"], COLORS["cf"]]
-
     # 1. Load Time Comparison
     ax1 = axes[0]
     if result.tf_load_time_stats and result.cf_load_time_stats:
         times = [result.tf_load_time_stats.mean, result.cf_load_time_stats.mean]
         errors = [result.tf_load_time_stats.std, result.cf_load_time_stats.std]
-        bars1 = ax1.bar(
-            ["Text-Fabric", "Context-Fabric"],
-            times,
-            yerr=errors,
-            color=colors,
-            edgecolor="white",
-            linewidth=2,
-            capsize=5,
+        _comparison_bars(
+            ax1, times, "Time (seconds)", "Cache Load Time", lambda v: f"{v:.2f}s", errors
         )
-        ax1.set_ylabel("Time (seconds)", fontsize=14)
-        ax1.set_title("Cache Load Time", fontsize=16, fontweight="bold", pad=15)
-        ax1.tick_params(axis="both", labelsize=13)
-        ax1.set_ylim(0, max(times) * 1.35)
-        for bar, val in zip(bars1, times):
-            ax1.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + max(times) * 0.05,
-                f"{val:.2f}s",
-                ha="center",
-                va="bottom",
-                fontsize=15,
-                fontweight="bold",
-            )
         # Calculate speedup ratio (TF/CF)
         # If > 1, CF is faster; if < 1, TF is faster
         if times[1] > 0 and times[0] > 0:
@@ -114,23 +226,7 @@ def create_memory_comparison_chart(
                 speedup_label = f"{speedup:.1f}x slower"
         else:
             speedup_label = "N/A"
-        ax1.text(
-            0.5,
-            0.92,
-            speedup_label,
-            transform=ax1.transAxes,
-            ha="center",
-            va="top",
-            fontsize=16,
-            color=COLORS["cf"],
-            fontweight="bold",
-            bbox=dict(
-                boxstyle="round",
-                facecolor="#1a1a2e",
-                edgecolor=COLORS["cf"],
-                alpha=0.8,
-            ),
-        )
+        _ratio_badge(ax1, speedup_label)
     else:
         ax1.text(0.5, 0.5, "No load time data", ha="center", va="center", fontsize=14)
         ax1.set_title("Cache Load Time", fontsize=16, fontweight="bold", pad=15)
@@ -140,48 +236,10 @@ def create_memory_comparison_chart(
     if result.tf_memory_stats and result.cf_memory_stats:
         memory = [result.tf_memory_stats.mean, result.cf_memory_stats.mean]
         errors = [result.tf_memory_stats.std, result.cf_memory_stats.std]
-        bars2 = ax2.bar(
-            ["Text-Fabric", "Context-Fabric"],
-            memory,
-            yerr=errors,
-            color=colors,
-            edgecolor="white",
-            linewidth=2,
-            capsize=5,
-        )
-        ax2.set_ylabel("Memory (MB)", fontsize=14)
-        ax2.set_title("Memory Usage", fontsize=16, fontweight="bold", pad=15)
-        ax2.tick_params(axis="both", labelsize=13)
-        ax2.set_ylim(0, max(memory) * 1.35)
-        for bar, val in zip(bars2, memory):
-            label = f"{val:.0f} MB" if val < 1000 else f"{val/1024:.1f} GB"
-            ax2.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + max(memory) * 0.05,
-                label,
-                ha="center",
-                va="bottom",
-                fontsize=15,
-                fontweight="bold",
-            )
+        _comparison_bars(ax2, memory, "Memory (MB)", "Memory Usage", _format_mb, errors)
         reduction = (1 - memory[1] / memory[0]) * 100 if memory[0] > 0 else 0
-        ax2.text(
-            0.5,
-            0.92,
-            f"{reduction:.0f}% reduction",
-            transform=ax2.transAxes,
-            ha="center",
-            va="top",
-            fontsize=16,
-            color=COLORS["cf"],
-            fontweight="bold",
-            bbox=dict(
-                boxstyle="round",
-                facecolor="#1a1a2e",
-                edgecolor=COLORS["cf"],
-                alpha=0.8,
-            ),
-        )
+        _ratio_badge(ax2, f"{reduction:.0f}% reduction")
+        _annotate_mapped_resident(ax2, result)
     else:
         ax2.text(0.5, 0.5, "No memory data", ha="center", va="center", fontsize=14)
         ax2.set_title("Memory Usage", fontsize=16, fontweight="bold", pad=15)
@@ -190,61 +248,21 @@ def create_memory_comparison_chart(
     ax3 = axes[2]
     if result.tf_spawn_stats and result.cf_spawn_stats:
         # Calculate per-worker from total
-        num_workers = 4  # Default
-        for m in result.measurements:
-            if m.num_workers:
-                num_workers = m.num_workers
-                break
+        num_workers = _num_workers(result)
         par_mem = [
             result.tf_spawn_stats.mean / num_workers,
             result.cf_spawn_stats.mean / num_workers,
         ]
-        bars3 = ax3.bar(
-            ["Text-Fabric", "Context-Fabric"],
+        _comparison_bars(
+            ax3,
             par_mem,
-            color=colors,
-            edgecolor="white",
-            linewidth=2,
-        )
-        ax3.set_ylabel("Memory per Worker (MB)", fontsize=14)
-        ax3.set_title(
+            "Memory per Worker (MB)",
             f"Spawn Workers ({num_workers}w, cold start)",
-            fontsize=16,
-            fontweight="bold",
-            pad=15,
+            _format_mb,
         )
-        ax3.tick_params(axis="both", labelsize=13)
-        ax3.set_ylim(0, max(par_mem) * 1.35)
-        for bar, val in zip(bars3, par_mem):
-            label = f"{val:.0f} MB" if val < 1000 else f"{val/1024:.1f} GB"
-            ax3.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + max(par_mem) * 0.05,
-                label,
-                ha="center",
-                va="bottom",
-                fontsize=15,
-                fontweight="bold",
-            )
         if par_mem[1] > 0:
-            ratio = par_mem[0] / par_mem[1]
-            ax3.text(
-                0.5,
-                0.92,
-                f"{ratio:.1f}x less",
-                transform=ax3.transAxes,
-                ha="center",
-                va="top",
-                fontsize=16,
-                color=COLORS["cf"],
-                fontweight="bold",
-                bbox=dict(
-                    boxstyle="round",
-                    facecolor="#1a1a2e",
-                    edgecolor=COLORS["cf"],
-                    alpha=0.8,
-                ),
-            )
+            _ratio_badge(ax3, f"{par_mem[0] / par_mem[1]:.1f}x less")
+        _annotate_pss(ax3, result, "spawn")
     else:
         ax3.text(0.5, 0.5, "No spawn data", ha="center", va="center", fontsize=14)
         ax3.set_title("Spawn Workers (cold start)", fontsize=16, fontweight="bold", pad=15)
@@ -252,61 +270,21 @@ def create_memory_comparison_chart(
     # 4. Fork Workers (if available)
     ax4 = axes[3]
     if result.tf_fork_stats and result.cf_fork_stats:
-        num_workers = 4
-        for m in result.measurements:
-            if m.num_workers:
-                num_workers = m.num_workers
-                break
+        num_workers = _num_workers(result)
         api_mem = [
             result.tf_fork_stats.mean / num_workers,
             result.cf_fork_stats.mean / num_workers,
         ]
-        bars4 = ax4.bar(
-            ["Text-Fabric", "Context-Fabric"],
+        _comparison_bars(
+            ax4,
             api_mem,
-            color=colors,
-            edgecolor="white",
-            linewidth=2,
-        )
-        ax4.set_ylabel("Memory per Worker (MB)", fontsize=14)
-        ax4.set_title(
+            "Memory per Worker (MB)",
             f"Fork Workers ({num_workers}w, pre-loaded API)",
-            fontsize=16,
-            fontweight="bold",
-            pad=15,
+            _format_mb,
         )
-        ax4.tick_params(axis="both", labelsize=13)
-        ax4.set_ylim(0, max(api_mem) * 1.35)
-        for bar, val in zip(bars4, api_mem):
-            label = f"{val:.0f} MB" if val < 1000 else f"{val/1024:.1f} GB"
-            ax4.text(
-                bar.get_x() + bar.get_width() / 2,
-                bar.get_height() + max(api_mem) * 0.05,
-                label,
-                ha="center",
-                va="bottom",
-                fontsize=15,
-                fontweight="bold",
-            )
         if api_mem[1] > 0:
-            ratio = api_mem[0] / api_mem[1]
-            ax4.text(
-                0.5,
-                0.92,
-                f"{ratio:.1f}x less",
-                transform=ax4.transAxes,
-                ha="center",
-                va="top",
-                fontsize=16,
-                color=COLORS["cf"],
-                fontweight="bold",
-                bbox=dict(
-                    boxstyle="round",
-                    facecolor="#1a1a2e",
-                    edgecolor=COLORS["cf"],
-                    alpha=0.8,
-                ),
-            )
+            _ratio_badge(ax4, f"{api_mem[0] / api_mem[1]:.1f}x less")
+        _annotate_pss(ax4, result, "fork")
     else:
         ax4.text(0.5, 0.5, "No fork data", ha="center", va="center", fontsize=14)
         ax4.set_title("Fork Workers (pre-loaded API)", fontsize=16, fontweight="bold", pad=15)
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import multiprocessing as mp
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from matplotlib.backends.backend_pdf import PdfPages
 
@@ -17,12 +22,46 @@ from cfabric_benchmarks.visualization.charts import (
     create_progressive_scaling_chart,
 )
 
+# A chart to render: (chart function, the result it plots, output path)
+ChartTask = tuple[Callable[[Any, Path], None], Any, Path]
+
+
+def _render_chart(task: ChartTask) -> None:
+    chart_func, data, path = task
+    chart_func(data, path)
+
+
+def render_charts(tasks: list[ChartTask], max_workers: int | None = None) -> None:
+    """Render charts, several at once in worker processes.
+
+    pyplot keeps a global current figure and is not thread-safe, so the
+    charts are spread over spawned processes rather than threads. Each
+    worker imports matplotlib once and then renders its share.
+
+    Args:
+        tasks: Charts to render
+        max_workers: Worker processes (default: one per CPU, at most one
+            per chart); 1 renders in this process
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        for task in tasks:
+            _render_chart(task)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=mp.get_context("spawn")
+    ) as pool:
+        # list() re-raises the first rendering error, if any
+        list(pool.map(_render_chart, tasks))
+
 
 def generate_full_report(
     output_path: Path,
     memory_results: list[MemoryBenchmarkResult] | None = None,
     latency_result: LatencyBenchmarkResult | None = None,
     progressive_result: ProgressiveLoadResult | None = None,
+    max_workers: int | None = None,
 ) -> None:
     """Generate a complete PDF report with all charts.
 
@@ -31,41 +70,40 @@ def generate_full_report(
         memory_results: Memory benchmark results
         latency_result: Latency benchmark result
         progressive_result: Progressive load result
+        max_workers: Processes rendering charts (see render_charts)
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     temp_dir = output_path.parent / ".temp_charts"
     temp_dir.mkdir(exist_ok=True)
 
-    charts = []
+    tasks: list[ChartTask] = []
 
     # Memory comparison for each corpus
     if memory_results:
         for result in memory_results:
             chart_path = temp_dir / f"memory_{result.corpus}.pdf"
-            create_memory_comparison_chart(result, chart_path)
-            charts.append(chart_path)
+            tasks.append((create_memory_comparison_chart, result, chart_path))
 
         # Multi-corpus comparison
         if len(memory_results) > 1:
             chart_path = temp_dir / "memory_multicorpus.pdf"
-            create_multi_corpus_memory_chart(memory_results, chart_path)
-            charts.append(chart_path)
+            tasks.append((create_multi_corpus_memory_chart, memory_results, chart_path))
 
     # Progressive scaling
     if progressive_result:
         chart_path = temp_dir / "progressive_scaling.pdf"
-        create_progressive_scaling_chart(progressive_result, chart_path)
-        charts.append(chart_path)
+        tasks.append((create_progressive_scaling_chart, progressive_result, chart_path))
 
     # Latency charts
     if latency_result:
         chart_path = temp_dir / "latency_distribution.pdf"
-        create_latency_distribution_chart(latency_result, chart_path)
-        charts.append(chart_path)
+        tasks.append((create_latency_distribution_chart, latency_result, chart_path))
 
         chart_path = temp_dir / "latency_percentiles.pdf"
-        create_latency_percentiles_chart(latency_result, chart_path)
-        charts.append(chart_path)
+        tasks.append((create_latency_percentiles_chart, latency_result, chart_path))
+
+    render_charts(tasks, max_workers)
+    charts = [path for _, _, path in tasks]
 
     # Combine into single PDF
     if charts:
@@ -102,6 +140,7 @@ def save_individual_charts(
     memory_results: list[MemoryBenchmarkResult] | None = None,
     latency_result: LatencyBenchmarkResult | None = None,
     progressive_result: ProgressiveLoadResult | None = None,
+    max_workers: int | None = None,
 ) -> list[Path]:
     """Save individual chart files.
 
@@ -110,49 +149,44 @@ def save_individual_charts(
         memory_results: Memory benchmark results
         latency_result: Latency benchmark result
         progressive_result: Progressive load result
+        max_workers: Processes rendering charts (see render_charts)
 
     Returns:
         List of created file paths
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    created = []
+    charts: list[tuple[Callable[[Any, Path], None], Any, str]] = []
 
     # Memory charts
     if memory_results:
         for result in memory_results:
-            pdf_path = output_dir / f"fig_memory_{result.corpus}.pdf"
-            png_path = output_dir / f"fig_memory_{result.corpus}.png"
-            create_memory_comparison_chart(result, pdf_path)
-            create_memory_comparison_chart(result, png_path)
-            created.extend([pdf_path, png_path])
+            charts.append((create_memory_comparison_chart, result, f"fig_memory_{result.corpus}"))
 
         if len(memory_results) > 1:
-            pdf_path = output_dir / "fig_memory_multicorpus.pdf"
-            png_path = output_dir / "fig_memory_multicorpus.png"
-            create_multi_corpus_memory_chart(memory_results, pdf_path)
-            create_multi_corpus_memory_chart(memory_results, png_path)
-            created.extend([pdf_path, png_path])
+            charts.append(
+                (create_multi_corpus_memory_chart, memory_results, "fig_memory_multicorpus")
+            )
 
     # Progressive chart
     if progressive_result:
-        pdf_path = output_dir / "fig_scaling_progressive.pdf"
-        png_path = output_dir / "fig_scaling_progressive.png"
-        create_progressive_scaling_chart(progressive_result, pdf_path)
-        create_progressive_scaling_chart(progressive_result, png_path)
-        created.extend([pdf_path, png_path])
+        charts.append(
+            (create_progressive_scaling_chart, progressive_result, "fig_scaling_progressive")
+        )
 
     # Latency charts
     if latency_result:
-        pdf_path = output_dir / "fig_latency_distribution.pdf"
-        png_path = output_dir / "fig_latency_distribution.png"
-        create_latency_distribution_chart(latency_result, pdf_path)
-        create_latency_distribution_chart(latency_result, png_path)
-        created.extend([pdf_path, png_path])
-
-        pdf_path = output_dir / "fig_latency_percentiles.pdf"
-        png_path = output_dir / "fig_latency_percentiles.png"
-        create_latency_percentiles_chart(latency_result, pdf_path)
-        create_latency_percentiles_chart(latency_result, png_path)
-        created.extend([pdf_path, png_path])
-
-    return created
+        charts.append(
+            (create_latency_distribution_chart, latency_result, "fig_latency_distribution")
+        )
+        charts.append(
+            (create_latency_percentiles_chart, latency_result, "fig_latency_percentiles")
+        )
+
+    # PDF and PNG of a chart are rendered independently
+    tasks: list[ChartTask] = [
+        (chart_func, data, output_dir / f"{stem}.{ext}")
+        for chart_func, data, stem in charts
+        for ext in ("pdf", "png")
+    ]
+    render_charts(tasks, max_workers)
+    return [path for _, _, path in tasks]
@@ -0,0 +1,236 @@
+"""Tests for TF vs CF comparison builders."""
+
+from __future__ import annotations
+
+import pytest
+
+from cfabric_benchmarks.analysis.comparison import (
+    compare_all,
+    compare_latency_results,
+    compare_load_times,
+    compare_memory_results,
+    compute_latency_stats_by_categories,
+    compute_latency_stats_by_category,
+    compute_latency_stats_by_queries,
+    compute_latency_stats_by_query,
+)
+from cfabric_benchmarks.models.latency import (
+    LatencyBenchmarkResult,
+    QueryMeasurement,
+    SearchQuery,
+)
+from cfabric_benchmarks.models.memory import (
+    CorpusStats,
+    MemoryBenchmarkResult,
+    MemoryMeasurement,
+)
+
+
+def _memory_result() -> MemoryBenchmarkResult:
+    measurements = [
+        MemoryMeasurement(
+            run_id=run_id,
+            corpus="test",
+            implementation=impl,
+            mode=mode,
+            load_time_s=load_time + run_id - 1,
+            rss_before_mb=0.0,
+            rss_after_mb=rss + run_id - 1,
+        )
+        for run_id in range(3)
+        for impl, mode, load_time, rss in [
+            ("TF", "single", 10.0, 1000.0),
+            ("CF", "single", 2.0, 200.0),
+            ("TF", "spawn", 12.0, 4000.0),
+            ("CF", "spawn", 3.0, 800.0),
+        ]
+    ]
+    return MemoryBenchmarkResult(
+        corpus="test",
+        corpus_stats=CorpusStats(
+            name="test",
+            max_slot=100,
+            max_node=150,
+            node_types=3,
+            node_features=5,
+            edge_features=1,
+        ),
+        measurements=measurements,
+    )
+
+
+def _latency_result() -> LatencyBenchmarkResult:
+    queries = [
+        SearchQuery(
+            id="q1",
+            category="lexical",
+            template="word",
+            description="words",
+            expected_complexity="low",
+        ),
+        SearchQuery(
+            id="q2",
+            category="structural",
+            template="phrase\n  word",
+            description="words in phrases",
+            expected_complexity="medium",
+        ),
+    ]
+    measurements = [
+        QueryMeasurement(
+            query_id=query_id,
+            implementation=impl,
+            run_id=0,
+            iteration=0,
+            execution_time_ms=time_ms,
+            result_count=1,
+            success=success,
+        )
+        for query_id, impl, time_ms, success in [
+            ("q1", "TF", 10.0, True),
+            ("q1", "CF", 5.0, True),
+            ("q2", "TF", 40.0, True),
+            ("q2", "CF", 20.0, True),
+            ("q2", "CF", 999.0, False),
+        ]
+    ]
+    return LatencyBenchmarkResult(
+        corpus="test", queries=queries, measurements=measurements, statistics=[]
+    )
+
+
+class TestCompareMemoryResults:
+    """Tests for compare_memory_results and compare_load_times."""
+
+    def test_filters_by_mode(self) -> None:
+        """Test that only measurements of the requested mode are compared."""
+        comparison = compare_memory_results(_memory_result(), mode="spawn")
+
+        assert comparison.tf_stats.n == 3
+        assert comparison.tf_stats.mean == 4000.0
+        assert comparison.cf_stats.mean == 800.0
+
+    def test_load_times_use_single_mode(self) -> None:
+        """Test that load times come from single-process runs only."""
+        comparison = compare_load_times(_memory_result())
+
+        assert comparison.tf_stats.mean == 10.0
+        assert comparison.cf_stats.mean == 2.0
+
+
+class TestCompareLatencyResults:
+    """Tests for compare_latency_results."""
+
+    def test_overall_skips_failures(self) -> None:
+        """Test that failed queries are left out of the comparison."""
+        comparison = compare_latency_results(_latency_result())
+
+        assert comparison.metric_name == "latency_overall"
+        assert comparison.tf_stats.n == 2
+        assert comparison.cf_stats.n == 2
+        assert comparison.cf_stats.max == 20.0
+
+    def test_category_filter(self) -> None:
+        """Test that a category keeps only the queries in that category."""
+        comparison = compare_latency_results(_latency_result(), category="structural")
+
+        assert comparison.metric_name == "latency_structural"
+        assert comparison.tf_stats.mean == 40.0
+        assert comparison.cf_stats.mean == 20.0
+
+
+class TestLatencyStatsBuilders:
+    """Tests for the per-query and per-category latency statistics."""
+
+    def test_by_query_counts_errors(self) -> None:
+        """Test that failed runs count as errors, not samples."""
+        result = _latency_result()
+        stats = compute_latency_stats_by_query(result.measurements, "q2", "CF")
+
+        assert stats.sample_count == 1
+        assert stats.error_count == 1
+        assert stats.mean_ms == 20.0
+
+    def test_by_category(self) -> None:
+        """Test that category statistics only use queries in the category."""
+        result = _latency_result()
+        stats = compute_latency_stats_by_category(
+            result.measurements, result.queries, "lexical", "TF"
+        )
+
+        assert stats.sample_count == 1
+        assert stats.mean_ms == 10.0
+
+    def test_sees_appended_measurements(self) -> None:
+        """Test that measurements added after a first call are picked up."""
+        result = _latency_result()
+        measurements = result.measurements
+        compute_latency_stats_by_query(measurements, "q1", "TF")
+        measurements.append(measurements[0].model_copy(update={"execution_time_ms": 30.0}))
+
+        stats = compute_latency_stats_by_query(measurements, "q1", "TF")
+
+        assert stats.sample_count == 2
+        assert stats.mean_ms == 20.0
+
+    def test_sees_replaced_measurements(self) -> None:
+        """Test that a measurement replaced in place is picked up."""
+        result = _latency_result()
+        measurements = result.measurements
+        compute_latency_stats_by_query(measurements, "q1", "TF")
+        measurements[0] = measurements[0].model_copy(update={"execution_time_ms": 30.0})
+
+        stats = compute_latency_stats_by_query(measurements, "q1", "TF")
+
+        assert stats.mean_ms == 30.0
+
+    def test_batches_match_single_calls(self) -> None:
+        """Test that the batch builders equal one call per selection."""
+        result = _latency_result()
+        measurements, queries = result.measurements, result.queries
+
+        assert compute_latency_stats_by_queries(measurements, ["q1", "q2"]) == [
+            compute_latency_stats_by_query(measurements, query_id, impl)
+            for query_id in ("q1", "q2")
+            for impl in ("TF", "CF")
+        ]
+        assert compute_latency_stats_by_categories(
+            measurements, queries, ["lexical", "structural"]
+        ) == [
+            compute_latency_stats_by_category(measurements, queries, category, impl)
+            for category in ("lexical", "structural")
+            for impl in ("TF", "CF")
+        ]
+
+
+class TestCompareAll:
+    """Tests for compare_all."""
+
+    def test_matches_individual_comparisons(self) -> None:
+        """Test that the concurrent comparisons equal the sequential ones."""
+        memory = _memory_result()
+        latency = _latency_result()
+
+        comparisons = compare_all(memory, latency, max_workers=4)
+
+        assert set(comparisons) == {
+            "memory_single",
+            "memory_spawn",
+            "memory_fork",
+            "load_time",
+            "latency_overall",
+            "latency_lexical",
+            "latency_structural",
+        }
+        assert comparisons["memory_spawn"] == compare_memory_results(memory, "spawn")
+        assert comparisons["latency_structural"] == compare_latency_results(
+            latency, "structural"
+        )
+
+    def test_rejects_colliding_categories(self) -> None:
+        """Test that a category cannot overwrite the overall comparison."""
+        latency = _latency_result()
+
+        for category in ("overall", ""):
+            with pytest.raises(ValueError):
+                compare_all(latency_result=latency, categories=[category])
@@ -0,0 +1,45 @@
+"""Tests for corpus download helpers."""
+
+from __future__ import annotations
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from cfabric_benchmarks.corpora.download import _copy_file
+
+
+class TestCopyFile:
+    """Tests for _copy_file."""
+
+    def test_plain_copy(self, tmp_path: Path) -> None:
+        """Test that the kernel copy reproduces the file."""
+        src = tmp_path / "word.tf"
+        src.write_bytes(b"@node\n@valueType=str\n\nhello\nworld\n")
+        dst = tmp_path / "copy.tf"
+
+        _copy_file(str(src), dst, src.stat().st_size)
+
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_fallback_after_partial_copy(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a kernel copy failing partway leaves no stray bytes."""
+        data = os.urandom(100_000)
+        src = tmp_path / "word.tf"
+        src.write_bytes(data)
+        dst = tmp_path / "copy.tf"
+
+        def partial_copy(fd_in: int, fd_out: int, count: int, *offsets: int) -> int:
+            os.write(fd_out, data[:4096])
+            raise OSError(errno.EXDEV, "cross-device copy")
+
+        monkeypatch.setattr(os, "copy_file_range", partial_copy, raising=False)
+        monkeypatch.delattr(os, "sendfile", raising=False)
+
+        _copy_file(str(src), dst, len(data))
+
+        assert dst.read_bytes() == data
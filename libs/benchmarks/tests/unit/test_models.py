@@ -10,6 +10,8 @@ from cfabric_benchmarks.models.config import (
     CORPUS_SIZE_ORDER,
     BenchmarkConfig,
     CorpusConfig,
+    corpus_size_rank,
+    discover_corpora,
     get_corpora_by_size,
 )
 from cfabric_benchmarks.models.latency import (
@@ -47,6 +49,7 @@ class TestBenchmarkConfig:
         assert config.latency_iterations == 10
         assert config.validation_corpus == "cuc"
         assert config.generate_pdf is True
+        assert config.parallel_corpora == 1
 
     def test_custom_values(self, tmp_path: Path) -> None:
         """Test custom configuration values."""
@@ -63,6 +66,15 @@ class TestBenchmarkConfig:
         assert config.num_queries == 100
         assert config.generate_pdf is False
 
+    def test_parallel_corpora_positive(self, tmp_path: Path) -> None:
+        """Test that at least one corpus must be benchmarked at a time."""
+        with pytest.raises(ValueError):
+            BenchmarkConfig(
+                corpora_dir=tmp_path / "corpora",
+                output_dir=tmp_path / "output",
+                parallel_corpora=0,
+            )
+
 
 class TestCorpusConfig:
     """Tests for CorpusConfig model."""
@@ -78,6 +90,29 @@ class TestCorpusConfig:
         assert config.path == corpus_dir
         assert config.tf_path == tf_path
 
+    def test_frozen(self, tmp_path: Path) -> None:
+        """Test that corpus configs are immutable and usable as dict keys."""
+        config = CorpusConfig(name="cuc", path=tmp_path, tf_path=tmp_path / "tf")
+        same = CorpusConfig(name="cuc", path=tmp_path, tf_path=tmp_path / "tf")
+
+        with pytest.raises(ValueError):
+            config.name = "bhsa"
+        assert {config: 1}[same] == 1
+
+    def test_discover(self, tmp_path: Path) -> None:
+        """Test that only visible directories with a tf/ subdirectory are found."""
+        for name in ["lxx", "cuc", ".hidden"]:
+            (tmp_path / name / "tf").mkdir(parents=True)
+        (tmp_path / "notes").mkdir()
+        (tmp_path / "draft").mkdir()
+        (tmp_path / "draft" / "tf").write_text("not a directory")
+        (tmp_path / "README.md").write_text("corpora")
+
+        corpora = discover_corpora(tmp_path)
+
+        assert [c.name for c in corpora] == ["cuc", "lxx"]
+        assert corpora[0].tf_path == tmp_path.resolve() / "cuc" / "tf"
+
     def test_size_ordering(self, tmp_path: Path) -> None:
         """Test corpus size ordering."""
         # Create directories
@@ -96,6 +131,17 @@ class TestCorpusConfig:
         assert names.index("cuc") < names.index("lxx")
         assert names.index("lxx") < names.index("bhsa")
 
+    def test_unknown_corpora_last(self, tmp_path: Path) -> None:
+        """Test that corpora outside CORPUS_SIZE_ORDER keep their order at the end."""
+        corpora = [
+            CorpusConfig(name=name, path=tmp_path / name, tf_path=tmp_path / name / "tf")
+            for name in ["zeta", "bhsa", "alpha", "cuc"]
+        ]
+        names = [c.name for c in get_corpora_by_size(corpora)]
+        assert names == ["cuc", "bhsa", "zeta", "alpha"]
+        assert corpus_size_rank(corpora[3]) == 0
+        assert corpus_size_rank(corpora[0]) == len(CORPUS_SIZE_ORDER)
+
 
 class TestSearchQuery:
     """Tests for SearchQuery model."""
@@ -211,6 +257,33 @@ class TestMemoryMeasurement:
         assert m.rss_after_mb == 600.0
         assert m.memory_used_mb == 500.0  # computed field
 
+    def test_pss_fields(self) -> None:
+        """PSS fields are optional and default to None."""
+        m = MemoryMeasurement(
+            corpus="bhsa",
+            implementation="CF",
+            mode="fork",
+            run_id=1,
+            rss_before_mb=0.0,
+            rss_after_mb=800.0,
+            load_time_s=0.0,
+            num_workers=4,
+            total_rss_mb=800.0,
+            per_worker_rss_mb=200.0,
+            total_pss_mb=300.0,
+            per_worker_pss_mb=75.0,
+        )
+        assert m.per_worker_pss_mb == 75.0
+        assert MemoryMeasurement(
+            corpus="bhsa",
+            implementation="TF",
+            mode="single",
+            run_id=1,
+            rss_before_mb=0.0,
+            rss_after_mb=1.0,
+            load_time_s=0.0,
+        ).total_pss_mb is None
+
 
 class TestProgressiveLoadStep:
     """Tests for ProgressiveLoadStep model."""
@@ -230,9 +303,51 @@ class TestProgressiveLoadStep:
         )
         assert step.step == 3
         assert len(step.corpora_loaded) == 3
+        assert step.corpora_loaded_str == "cuc;syrnt;lxx"
+        assert "corpora_loaded_str" not in step.model_dump()
+        updated = step.model_copy(update={"corpora_loaded": ["cuc", "sp"]})
+        assert updated.corpora_loaded_str == "cuc;sp"
         assert step.incremental_rss_mb == 200.0
 
 
+class TestProgressiveLoadResult:
+    """Tests for ProgressiveLoadResult model."""
+
+    def test_step_lookups(self) -> None:
+        """Lookups return fresh lists and follow changes to the steps."""
+        steps = [
+            ProgressiveLoadStep(
+                step=1,
+                corpus_added="cuc",
+                corpora_loaded=["cuc"],
+                implementation=impl,
+                run_id=run_id,
+                total_rss_mb=100.0,
+                incremental_rss_mb=100.0,
+                cumulative_load_time_s=1.0,
+                step_load_time_s=1.0,
+            )
+            for run_id in (1, 2)
+            for impl in ("TF", "CF")
+        ]
+        result = ProgressiveLoadResult(
+            max_corpora=2, corpora_order=["cuc"], num_runs=2, steps=steps
+        )
+        dumped = result.model_dump()
+
+        assert result.get_steps_by_impl("CF") == [steps[1], steps[3]]
+        assert result.get_steps_by_run(2) == steps[2:]
+        assert result.get_steps_by_run(3) == []
+        result.get_steps_by_run(1).clear()
+        assert result.get_steps_by_run(1) == steps[:2]
+        assert result.model_dump() == dumped
+
+        copy = result.model_copy(update={"steps": steps[:1]})
+        assert copy.get_steps_by_impl("CF") == []
+        result.steps = steps[2:]
+        assert result.get_steps_by_run(1) == []
+
+
 class TestScalingAnalysis:
     """Tests for ScalingAnalysis model."""
 
@@ -11,16 +11,21 @@ import pytest
 from cfabric_benchmarks.models.latency import (
     LatencyStatistics,
     QueryMeasurement,
+    SearchQuery,
 )
 from cfabric_benchmarks.models.memory import MemoryMeasurement
 from cfabric_benchmarks.models.progressive import ProgressiveLoadStep
 from cfabric_benchmarks.output.csv_writer import (
+    write_all,
     write_latency_measurements_csv,
     write_latency_statistics_csv,
     write_memory_measurements_csv,
     write_progressive_steps_csv,
+    write_queries_csv,
 )
-from cfabric_benchmarks.output.metadata import collect_environment
+from cfabric_benchmarks.output.json_writer import write_json, write_jsonl
+from cfabric_benchmarks.output.loaders import load_latency_result
+from cfabric_benchmarks.output.metadata import collect_environment, create_run_directory
 
 
 class TestMemoryMeasurementsCSV:
@@ -150,6 +155,34 @@ class TestLatencyStatisticsCSV:
         assert float(rows[0]["mean_ms"]) == 15.0
 
 
+class TestQueriesCSV:
+    """Tests for search query CSV output."""
+
+    def test_write_queries(self, tmp_path: Path) -> None:
+        """Test that multi-line templates survive and missing errors are blank."""
+        queries = [
+            SearchQuery(
+                id="str_001",
+                category="structural",
+                template='phrase function=Pred\n  word sp="verb"',
+                description="verbs, in predicate phrases",
+                expected_complexity="medium",
+                validated=True,
+            ),
+        ]
+
+        output_file = tmp_path / "queries.csv"
+        write_queries_csv(queries, output_file)
+
+        with open(output_file, newline="") as f:
+            rows = list(csv.DictReader(f))
+
+        assert rows[0]["template"] == queries[0].template
+        assert rows[0]["description"] == "verbs, in predicate phrases"
+        assert rows[0]["validated"] == "True"
+        assert rows[0]["validation_error"] == ""
+
+
 class TestProgressiveStepsCSV:
     """Tests for progressive loading steps CSV output."""
 
@@ -194,6 +227,135 @@ class TestProgressiveStepsCSV:
         assert float(rows[1]["total_rss_mb"]) == 200.0
 
 
+class TestWriteAll:
+    """Tests for running CSV writers concurrently."""
+
+    def test_writes_every_file(self, tmp_path: Path) -> None:
+        """Test that every task writes its file."""
+        queries = [
+            SearchQuery(
+                id="lex_001",
+                category="lexical",
+                template="word",
+                description="all words",
+                expected_complexity="low",
+            ),
+        ]
+        write_all([
+            (write_queries_csv, (queries, tmp_path / "a.csv")),
+            (write_queries_csv, (queries, tmp_path / "b.csv")),
+        ])
+
+        assert (tmp_path / "a.csv").read_text() == (tmp_path / "b.csv").read_text()
+
+    def test_error_propagates(self, tmp_path: Path) -> None:
+        """Test that a failing writer raises after the others finish."""
+
+        def fail(path: Path) -> None:
+            raise OSError(f"cannot write {path}")
+
+        with pytest.raises(OSError):
+            write_all([
+                (fail, (tmp_path / "a.csv",)),
+                (write_queries_csv, ([], tmp_path / "b.csv")),
+            ])
+
+        assert (tmp_path / "b.csv").exists()
+
+
+class TestProgressiveStepsParquet:
+    """Tests for progressive steps Parquet output."""
+
+    def test_write_steps(self, tmp_path: Path) -> None:
+        """Test that list and numeric columns keep their types."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        from cfabric_benchmarks.output.parquet_writer import write_progressive_steps_parquet
+
+        steps = [
+            ProgressiveLoadStep(
+                step=2,
+                corpus_added="syrnt",
+                corpora_loaded=["cuc", "syrnt"],
+                implementation="CF",
+                run_id=1,
+                total_rss_mb=250.5,
+                incremental_rss_mb=120.0,
+                cumulative_load_time_s=3.0,
+                step_load_time_s=1.5,
+            )
+        ]
+        output_file = tmp_path / "progressive" / "raw_steps.parquet"
+        write_progressive_steps_parquet(steps, output_file)
+
+        rows = pq.read_table(output_file).to_pylist()
+        assert rows == [steps[0].model_dump()]
+
+
+class TestWriteJSON:
+    """Tests for JSON output."""
+
+    def test_models_match_model_dump(self, tmp_path: Path) -> None:
+        """Test that models are written as their JSON-mode dump."""
+        queries = [
+            SearchQuery(
+                id="q1",
+                category="lexical",
+                template="word lex=>L/",
+                description="Hebrew \u05d0 text",
+                expected_complexity="low",
+            )
+        ]
+        output_file = tmp_path / "latency" / "queries.json"
+        write_json({"queries": queries, "path": tmp_path}, output_file)
+
+        data = json.loads(output_file.read_bytes())
+        assert data["queries"] == [q.model_dump(mode="json") for q in queries]
+        assert data["path"] == str(tmp_path)
+
+    def test_queries_round_trip(self, tmp_path: Path) -> None:
+        """Test that written queries load back through the loaders."""
+        query = SearchQuery(
+            id="q1",
+            category="lexical",
+            template="word",
+            description="\u05d0",
+            expected_complexity="low",
+        )
+        write_json([query], tmp_path / "latency" / "queries.json")
+        write_latency_measurements_csv([], tmp_path / "latency" / "raw_measurements.csv")
+
+        result = load_latency_result(tmp_path)
+
+        assert result is not None
+        assert result.queries == [query]
+
+
+class TestWriteJSONL:
+    """Tests for JSON Lines output."""
+
+    def test_one_record_per_line(self, tmp_path: Path) -> None:
+        """Test that each measurement is written as one JSON line."""
+        measurements = [
+            QueryMeasurement(
+                query_id="q1",
+                implementation="CF",
+                run_id=run_id,
+                iteration=0,
+                execution_time_ms=1.5,
+                result_count=10,
+                success=True,
+            )
+            for run_id in (1, 2)
+        ]
+        output_file = tmp_path / "latency" / "raw_measurements.jsonl"
+        write_jsonl(measurements, output_file)
+
+        lines = output_file.read_bytes().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            m.model_dump(mode="json") for m in measurements
+        ]
+
+
 class TestEnvironmentMetadata:
     """Tests for environment metadata collection."""
 
@@ -226,3 +388,15 @@ class TestEnvironmentMetadata:
         parsed = json.loads(json_str)
         assert "hardware" in parsed
         assert "software" in parsed
+
+
+class TestRunDirectory:
+    """Tests for timestamped run directories."""
+
+    def test_same_second_runs_get_distinct_directories(self, tmp_path: Path) -> None:
+        """Test that runs started in the same second never share a directory."""
+        base_dir = tmp_path / "results"
+        run_dirs = [create_run_directory(base_dir, prefix="memory") for _ in range(3)]
+
+        assert len(set(run_dirs)) == 3
+        assert all(d.is_dir() and d.name.startswith("memory_") for d in run_dirs)
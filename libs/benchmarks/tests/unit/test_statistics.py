@@ -13,7 +13,9 @@ from cfabric_benchmarks.analysis.statistics import (
     compute_percentiles,
     compute_summary,
     linear_regression,
+    paired_t_test,
     welch_t_test,
+    welch_t_test_from_moments,
 )
 
 
@@ -49,6 +51,16 @@ class TestComputeSummary:
         # Expected sample std is approximately 2.14
         assert abs(summary.std - 2.14) < 0.2
 
+    def test_small_sample_matches_exact_moments(self) -> None:
+        """Test small samples against the exact stdlib moments."""
+        import statistics
+
+        values = [0.013, 0.02, 1.5, 37.0, 980.25, 0.5, 12.75]
+        summary = compute_summary(values, "latency", "ms")
+
+        assert summary.mean == statistics.fmean(values)
+        assert summary.variance == pytest.approx(statistics.variance(values), rel=1e-15)
+
     def test_empty_values(self) -> None:
         """Test summary with empty values."""
         summary = compute_summary([], "test", "unit")
@@ -150,6 +162,66 @@ class TestWelchTTest:
         assert t_stat == 0.0
         assert p_value == 1.0
 
+    def test_matches_scipy(self) -> None:
+        """Test that the inline test agrees with scipy's Welch t-test."""
+        from scipy import stats
+
+        a = [10.0, 12.5, 9.0, 11.0, 13.0, 10.5]
+        b = [14.0, 9.5, 15.0, 12.0]
+        expected = stats.ttest_ind(a, b, equal_var=False)
+        t_stat, p_value = welch_t_test(a, b)
+
+        assert t_stat == pytest.approx(expected.statistic)
+        assert p_value == pytest.approx(expected.pvalue)
+
+    def test_from_moments_matches_samples(self) -> None:
+        """Test that the moments form gives the same result as the samples."""
+        a = [10.0, 12.5, 9.0, 11.0, 13.0, 10.5]
+        b = [14.0, 9.5, 15.0, 12.0]
+        summary_a = compute_summary(a, "a", "ms")
+        summary_b = compute_summary(b, "b", "ms")
+
+        t_stat, p_value = welch_t_test_from_moments(
+            summary_a.mean,
+            summary_a.variance,
+            summary_a.n,
+            summary_b.mean,
+            summary_b.variance,
+            summary_b.n,
+        )
+
+        assert (t_stat, p_value) == pytest.approx(welch_t_test(a, b))
+
+    def test_zero_variance(self) -> None:
+        """Test t-test on constant samples."""
+        t_stat, p_value = welch_t_test([1.0, 1.0, 1.0], [2.0, 2.0, 2.0])
+        assert t_stat == -math.inf
+        assert p_value == 0.0
+
+        t_stat, p_value = welch_t_test([1.0, 1.0], [1.0, 1.0])
+        assert math.isnan(p_value)
+
+
+class TestPairedTTest:
+    """Tests for paired_t_test function."""
+
+    def test_matches_scipy(self) -> None:
+        """Test that the paired test agrees with scipy's ttest_rel."""
+        from scipy import stats
+
+        a = [10.0, 12.5, 9.0, 11.0, 13.0]
+        b = [9.0, 11.0, 8.5, 10.5, 11.0]
+        expected = stats.ttest_rel(a, b)
+        t_stat, p_value = paired_t_test(a, b)
+
+        assert t_stat == pytest.approx(expected.statistic)
+        assert p_value == pytest.approx(expected.pvalue)
+
+    def test_unequal_lengths(self) -> None:
+        """Test that unpaired samples are rejected."""
+        with pytest.raises(ValueError):
+            paired_t_test([1.0, 2.0, 3.0], [1.0, 2.0])
+
 
 class TestCompareImplementations:
     """Tests for compare_implementations function."""
@@ -180,6 +252,23 @@ class TestCompareImplementations:
 
         assert result.speedup_factor == pytest.approx(2.0, rel=0.1)
 
+    def test_paired(self) -> None:
+        """Test that paired runs use the paired t-test."""
+        tf_values = [100.0, 120.0, 90.0, 110.0]
+        cf_values = [95.0, 114.0, 86.0, 104.0]
+
+        paired = compare_implementations(
+            tf_values, cf_values, "latency", "ms", metric_type="time", paired=True
+        )
+        unpaired = compare_implementations(
+            tf_values, cf_values, "latency", "ms", metric_type="time"
+        )
+
+        # The shared run-to-run spread cancels out in the differences
+        assert paired.p_value == pytest.approx(paired_t_test(tf_values, cf_values)[1])
+        assert paired.statistically_significant
+        assert not unpaired.statistically_significant
+
 
 class TestLinearRegression:
     """Tests for linear_regression function."""
@@ -258,3 +347,12 @@ class TestAggregateRuns:
 
         assert means == [10.0, 20.0, 30.0]
         assert stds == [0.0, 0.0, 0.0]
+
+    def test_ragged_runs(self) -> None:
+        """Test that each step only counts the runs that reached it."""
+        runs = [[10.0, 20.0, 30.0], [12.0, 22.0], [14.0, 24.0, 34.0, 44.0]]
+        means, stds = aggregate_runs(runs)
+
+        assert means == [12.0, 22.0, 32.0]
+        assert stds[0] == pytest.approx(2.0)
+        assert stds[2] == pytest.approx(math.sqrt(8.0))
@@ -60,8 +60,7 @@ from cfabric.features.computed import (
 )
 from cfabric.storage.mmap_manager import MmapManager
 from cfabric.io.compiler import Compiler, compile_corpus
-from cfabric.storage.csr import CSRArray
-from cfabric.storage.string_pool import StringPool, IntFeatureArray
+from cfabric.storage.string_pool import StringPool
 from cfabric.features.node import NodeFeature
 from cfabric.features.edge import EdgeFeature
 from cfabric.features.warp.otype import OtypeFeature
@@ -195,6 +194,20 @@ class Fabric:
     silent: string, optional "auto"
         Verbosity level: "verbose", "auto", "terse", or "deep"
 
+    advise: string, optional None
+        Kernel access hint for the memory-mapped `.cfm` arrays:
+        "normal", "sequential", "random" or "willneed".
+        Defaults to the `CF_MMAP_ADVICE` environment variable, else "normal".
+        Use "sequential" for scan-heavy workloads and "random" for
+        point lookups such as search queries.
+
+    prefault: integer, optional 0
+        Number of threads that page in the memory-mapped `.cfm` arrays
+        right after loading. Several threads keep more reads in flight,
+        which shortens cold-cache loads on fast SSDs.
+        With 0 nothing is paged in up front; leave it at that for
+        random-access workloads that only touch a small part of the data.
+
     _withGc: boolean, optional False
         If False, it disables the Python garbage collector before
         loading features. Used to experiment with performance.
@@ -218,10 +231,14 @@ class Fabric:
         locations: str | Iterable[str] | None = None,
         modules: str | Iterable[str] | None = None,
         silent: str = SILENT_D,
+        advise: str | None = None,
+        prefault: int = 0,
         _withGc: bool = False,
     ) -> None:
         silent = silentConvert(silent)
         self._withGc = _withGc
+        self._mmapAdvice = advise
+        self._prefaultThreads = prefault
         self.silent = silent
 
         # Configure logging
@@ -339,7 +356,7 @@ class Fabric:
             if cfm_path is not None:
                 logger.info(f"Loading from {cfm_path}")
                 try:
-                    mmap_mgr = MmapManager(cfm_path)
+                    mmap_mgr = MmapManager(cfm_path, advice=self._mmapAdvice)
                     api = self._makeApiFromCfm(mmap_mgr)
                     if api is not None:
                         self.api = api
@@ -360,6 +377,7 @@ class Fabric:
                             logger.info(f"Loaded {len(featuresRequested)} features from .cfm format")
                         else:
                             logger.info("Loaded WARP features from .cfm format")
+                        self._prefaultCfm()
                         return api
                 except Exception as e:
                     logger.error(f".cfm cache exists but failed to load: {e}")
@@ -558,6 +576,13 @@ class Fabric:
             )
         return None
 
+    def _prefaultCfm(self) -> None:
+        """Page in the mapped .cfm arrays if a prefault thread count was given."""
+        threads = self._prefaultThreads
+        if threads:
+            count = self._cfm_mmap_mgr.prefault(threads=threads)
+            logger.debug(f"Prefaulted {count} mapped arrays with {threads} threads")
+
     def loadAll(self, silent: str = SILENT_D) -> Api | bool:
         """Load all loadable features.
 
@@ -587,6 +612,7 @@ class Fabric:
             logger.info(f"Loading {len(edge_features)} edge features from .cfm")
             for fname in edge_features:
                 self._loadEdgeFeatureFromCfm(api, mmap_mgr, fname)
+            self._prefaultCfm()
         else:
             allFeatures = self.explore(silent=silent, show=True)
             loadableFeatures = allFeatures["nodes"] + allFeatures["edges"]
@@ -1451,8 +1477,6 @@ class Fabric:
 
     def _loadNodeFeatureFromCfm(self, api: Api, mmap_mgr: MmapManager, fname: str) -> None:
         """Load a node feature from .cfm format."""
-        features_dir = mmap_mgr.cfm_path / 'features'
-
         # Get metadata
         try:
             meta = mmap_mgr.get_json('features', f'{fname}_meta')
@@ -1463,7 +1487,7 @@ class Fabric:
 
         if value_type == 'int':
             # Load integer feature
-            int_arr = IntFeatureArray.load(str(features_dir / f'{fname}.npy'), mmap_mode='r')
+            int_arr = mmap_mgr.get_int_array(fname)
             feature = NodeFeature(api, meta, int_arr)
         else:
             # Load string feature
@@ -1477,10 +1501,6 @@ class Fabric:
 
     def _loadEdgeFeatureFromCfm(self, api: Api, mmap_mgr: MmapManager, fname: str) -> None:
         """Load an edge feature from .cfm format."""
-        from cfabric.storage.csr import CSRArrayWithValues
-
-        edges_dir = mmap_mgr.cfm_path / 'edges'
-
         # Get metadata
         try:
             meta = mmap_mgr.get_json('edges', f'{fname}_meta')
@@ -1491,13 +1511,13 @@ class Fabric:
 
         if has_values:
             # Load edge with values (CSRArrayWithValues)
-            csr = CSRArrayWithValues.load(str(edges_dir / fname), mmap_mode='r')
-            inv_csr = CSRArrayWithValues.load(str(edges_dir / f'{fname}_inv'), mmap_mode='r')
+            csr = mmap_mgr.get_csr_with_values('edges', fname)
+            inv_csr = mmap_mgr.get_csr_with_values('edges', f'{fname}_inv')
             feature = EdgeFeature(api, meta, csr, has_values, dataInv=inv_csr)
         else:
             # Load edge without values (CSRArray)
-            csr = CSRArray.load(str(edges_dir / fname), mmap_mode='r')
-            inv_csr = CSRArray.load(str(edges_dir / f'{fname}_inv'), mmap_mode='r')
+            csr = mmap_mgr.get_csr('edges', fname)
+            inv_csr = mmap_mgr.get_csr('edges', f'{fname}_inv')
             feature = EdgeFeature(api, meta, csr, has_values, dataInv=inv_csr)
 
         setattr(api.E, fname, feature)
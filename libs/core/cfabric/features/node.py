@@ -19,7 +19,7 @@ dictionary: `cfabric.nodefeature.NodeFeature.items`
 from __future__ import annotations
 
 import collections
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any
 
 from cfabric.storage.string_pool import StringPool, IntFeatureArray
@@ -128,6 +128,27 @@ class NodeFeature:
             return self._data[n]
         return None
 
+    def prefetch(self, nodes: Iterable[int]) -> int:
+        """Ask the kernel to read ahead the values of the given nodes.
+
+        Only the pages that hold these nodes are requested, which suits
+        query-style access on a corpus loaded with `advise="random"`.
+        Dict-based features are already in memory and are left alone.
+
+        Parameters
+        ----------
+        nodes: iterable of integer
+            The nodes that are about to be looked up
+
+        Returns
+        -------
+        integer
+            The number of page spans that were requested
+        """
+        if self._is_mmap:
+            return self._data.prefetch(list(nodes))
+        return 0
+
     def s(self, val: str | int) -> tuple[int, ...]:
         """Query all nodes having a specified feature value.
 
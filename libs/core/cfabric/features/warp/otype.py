@@ -13,11 +13,12 @@ Supports two backends:
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+from cfabric.storage.mmap_hints import prefetch_indices
 from cfabric.utils.helpers import safe_rank_key
 
 if TYPE_CHECKING:
@@ -171,6 +172,18 @@ class OtypeFeature:
                 return self._data[m - 1]
         return None
 
+    def prefetch(self, nodes: Iterable[int]) -> int:
+        """Ask the kernel to read ahead the types of the given nodes.
+
+        As in `cfabric.nodefeature.NodeFeature.prefetch`.
+        Slot nodes need no data, so only non-slot nodes are requested.
+        """
+        if not self._is_mmap or self.maxSlot is None:
+            return 0
+        assert isinstance(self._data, np.ndarray)
+        indices = np.fromiter(nodes, dtype=np.int64) - (self.maxSlot + 1)
+        return prefetch_indices(self._data, indices)
+
     def s(self, val: str) -> tuple[int, ...]:
         """Query all nodes having a specified node type.
 
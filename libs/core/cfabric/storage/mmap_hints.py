@@ -0,0 +1,210 @@
+"""
+Kernel access hints for memory-mapped arrays.
+
+Thin wrappers around ``mmap.madvise`` for the numpy memmaps that back a
+.cfm corpus. Hints are advisory: on platforms without ``madvise`` (e.g.
+Windows) every call is a no-op.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+from typing import Any
+
+import numpy as np
+
+# Environment variable to control the default access hint for .cfm mappings
+# Values: "normal" (default), "sequential", "random", "willneed"
+# Set CF_MMAP_ADVICE=sequential to favour large readahead on first load
+_MMAP_ADVICE_MODE = os.environ.get('CF_MMAP_ADVICE', 'normal').lower()
+
+# MADV_POPULATE_READ (Linux >= 5.14) is not exposed by every Python build
+_MADV_POPULATE_READ = getattr(
+    mmap, 'MADV_POPULATE_READ', 22 if sys.platform.startswith('linux') else None
+)
+
+ADVICE_FLAGS: dict[str, str] = {
+    'normal': 'MADV_NORMAL',
+    'sequential': 'MADV_SEQUENTIAL',
+    'random': 'MADV_RANDOM',
+    'willneed': 'MADV_WILLNEED',
+}
+
+
+def check_advice(advice: str) -> str:
+    """
+    Validate an access hint name.
+
+    Parameters
+    ----------
+    advice : str
+        One of the keys of ``ADVICE_FLAGS``
+
+    Returns
+    -------
+    str
+        The normalized (lower-case) hint name
+
+    Raises
+    ------
+    ValueError
+        If the hint name is unknown
+    """
+    advice = advice.lower()
+    if advice not in ADVICE_FLAGS:
+        raise ValueError(
+            f"Unknown mmap advice {advice!r}, expected one of {sorted(ADVICE_FLAGS)}"
+        )
+    return advice
+
+
+def get_mmap(arr: Any) -> mmap.mmap | None:
+    """
+    Return the mmap object backing a numpy memmap, or None.
+
+    Works for memmaps returned by ``np.load(..., mmap_mode=...)`` and for
+    views of them.
+    """
+    mm = getattr(arr, '_mmap', None)
+    if isinstance(mm, mmap.mmap):
+        return mm
+    base = getattr(arr, 'base', None)
+    if isinstance(base, mmap.mmap):
+        return base
+    return None
+
+
+def advise_array(arr: Any, advice: str) -> bool:
+    """
+    Apply an access hint to the whole mapping behind an array.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array to advise; arrays that are not memory-mapped are ignored
+    advice : str
+        One of the keys of ``ADVICE_FLAGS``
+
+    Returns
+    -------
+    bool
+        True if the kernel accepted the hint
+    """
+    flag = getattr(mmap, ADVICE_FLAGS[check_advice(advice)], None)
+    mm = get_mmap(arr)
+    if flag is None or mm is None or not hasattr(mm, 'madvise'):
+        return False
+    try:
+        mm.madvise(flag)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def populate_array(arr: Any) -> bool:
+    """
+    Prefault the whole mapping behind an array into the page cache.
+
+    Uses ``MADV_POPULATE_READ`` where the kernel supports it, which returns
+    once the pages are resident, and falls back to the asynchronous
+    ``MADV_WILLNEED`` otherwise.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array to prefault; arrays that are not memory-mapped are ignored
+
+    Returns
+    -------
+    bool
+        True if either hint was accepted
+    """
+    mm = get_mmap(arr)
+    if mm is None or not hasattr(mm, 'madvise'):
+        return False
+    if _MADV_POPULATE_READ is not None:
+        try:
+            mm.madvise(_MADV_POPULATE_READ)
+            return True
+        except (OSError, ValueError):
+            pass
+    return advise_array(arr, 'willneed')
+
+
+def touch_array(arr: Any) -> int:
+    """
+    Fault in the mapping behind an array by reading one byte per page.
+
+    The strided read runs inside numpy, which releases the GIL, so several
+    mappings can be touched concurrently from a thread pool.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array to touch; arrays that are not memory-mapped are ignored
+
+    Returns
+    -------
+    int
+        Number of pages touched
+    """
+    mm = get_mmap(arr)
+    if mm is None or mm.closed or len(mm) == 0:
+        return 0
+    pages = np.frombuffer(mm, dtype=np.uint8)[::mmap.PAGESIZE]
+    pages.sum()
+    return len(pages)
+
+
+def prefetch_indices(arr: Any, indices: Any) -> int:
+    """
+    Ask the kernel to read ahead only the pages holding selected elements.
+
+    The pages of the requested elements are merged into contiguous spans
+    and each span gets its own ``MADV_WILLNEED``. Combined with the
+    ``random`` hint on the whole mapping this fetches what a query will
+    touch without the readahead overfetch of scattered page faults.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        One-dimensional array; arrays that are not memory-mapped are ignored
+    indices : array-like of int
+        0-based element indices; out-of-range indices are skipped
+
+    Returns
+    -------
+    int
+        Number of spans advised
+    """
+    flag = getattr(mmap, 'MADV_WILLNEED', None)
+    mm = get_mmap(arr)
+    if flag is None or mm is None or mm.closed or not hasattr(mm, 'madvise'):
+        return 0
+
+    idx = np.asarray(indices, dtype=np.int64).ravel()
+    idx = idx[(idx >= 0) & (idx < len(arr))]
+    if not len(idx):
+        return 0
+
+    base = np.frombuffer(mm, dtype=np.uint8).ctypes.data
+    offsets = (arr.ctypes.data - base) + idx * arr.strides[0]
+    pages = np.unique(offsets // mmap.PAGESIZE)
+
+    # Split the sorted page numbers wherever they are not consecutive
+    breaks = np.flatnonzero(np.diff(pages) != 1) + 1
+    starts = pages[np.r_[0, breaks]]
+    stops = pages[np.r_[breaks - 1, len(pages) - 1]] + 1
+
+    size = len(mm)
+    spans = 0
+    for first, last in zip(starts.tolist(), stops.tolist()):
+        start = first * mmap.PAGESIZE
+        try:
+            mm.madvise(flag, start, min(last * mmap.PAGESIZE, size) - start)
+        except (OSError, ValueError):
+            continue
+        spans += 1
+    return spans
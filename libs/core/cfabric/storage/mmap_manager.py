@@ -13,8 +13,16 @@ import numpy as np
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
-from cfabric.storage.csr import CSRArray
-from cfabric.storage.string_pool import StringPool
+from cfabric.storage.csr import CSRArray, CSRArrayWithValues
+from cfabric.storage.mmap_hints import (
+    _MMAP_ADVICE_MODE,
+    advise_array,
+    check_advice,
+    get_mmap,
+    populate_array,
+    touch_array,
+)
+from cfabric.storage.string_pool import IntFeatureArray, StringPool
 
 
 class MmapManager:
@@ -27,9 +35,12 @@ class MmapManager:
     ----------
     cfm_path : Path
         Path to .cfm/{version}/ directory
+    advice : str, optional
+        Kernel access hint applied to every mapped array
+        (default: CF_MMAP_ADVICE environment variable, else "normal")
     """
 
-    def __init__(self, cfm_path: Path | str) -> None:
+    def __init__(self, cfm_path: Path | str, advice: str | None = None) -> None:
         """
         Initialize manager for a .cfm directory.
 
@@ -37,9 +48,13 @@ class MmapManager:
         ----------
         cfm_path : Path
             Path to .cfm/{version}/ directory
+        advice : str, optional
+            Kernel access hint: "normal", "sequential", "random" or "willneed"
         """
         self.cfm_path = Path(cfm_path)
+        self.advice = check_advice(advice or _MMAP_ADVICE_MODE)
         self._arrays: dict[str, NDArray[Any]] = {}
+        self._mapped: list[NDArray[Any]] = []
         self._meta: dict[str, Any] | None = None
 
     @property
@@ -84,7 +99,7 @@ class MmapManager:
         key = '/'.join(path_parts)
         if key not in self._arrays:
             file_path = self.cfm_path.joinpath(*path_parts[:-1]) / f"{path_parts[-1]}.npy"
-            self._arrays[key] = np.load(file_path, mmap_mode='r')
+            self._arrays[key] = self._track(np.load(file_path, mmap_mode='r'))
         return self._arrays[key]
 
     def get_json(self, *path_parts: str) -> Any:
@@ -95,15 +110,91 @@ class MmapManager:
 
     def get_string_pool(self, feature_name: str) -> StringPool:
         """Get string pool for a string-valued feature."""
-        return StringPool.load(
+        pool = StringPool.load(
             str(self.cfm_path / 'features' / feature_name),
             mmap_mode='r'
         )
+        self._track(pool.indices)
+        return pool
+
+    def get_int_array(self, feature_name: str) -> IntFeatureArray:
+        """Get integer array for an int-valued feature."""
+        int_arr = IntFeatureArray.load(
+            str(self.cfm_path / 'features' / f"{feature_name}.npy"),
+            mmap_mode='r'
+        )
+        self._track(int_arr.values)
+        return int_arr
 
     def get_csr(self, *path_parts: str) -> CSRArray:
         """Get CSR array pair."""
         base_path = self.cfm_path.joinpath(*path_parts[:-1]) / path_parts[-1]
-        return CSRArray.load(str(base_path), mmap_mode='r')
+        csr = CSRArray.load(str(base_path), mmap_mode='r')
+        self._track(csr.indptr)
+        self._track(csr.data)
+        return csr
+
+    def get_csr_with_values(self, *path_parts: str) -> CSRArrayWithValues:
+        """Get CSR array with per-edge values."""
+        base_path = self.cfm_path.joinpath(*path_parts[:-1]) / path_parts[-1]
+        csr = CSRArrayWithValues.load(str(base_path), mmap_mode='r')
+        self._track(csr.indptr)
+        self._track(csr.indices)
+        self._track(csr.values)
+        return csr
+
+    @property
+    def mapped_arrays(self) -> list[NDArray[Any]]:
+        """All memory-mapped arrays handed out so far."""
+        return self._mapped
+
+    def advise(self, advice: str) -> int:
+        """
+        Apply a kernel access hint to all arrays mapped so far.
+
+        Parameters
+        ----------
+        advice : str
+            "normal", "sequential", "random" or "willneed"
+
+        Returns
+        -------
+        int
+            Number of mappings the kernel accepted the hint for
+        """
+        return sum(advise_array(arr, advice) for arr in self._mapped)
+
+    def prefault(self, threads: int = 1) -> int:
+        """
+        Bring all arrays mapped so far into the page cache.
+
+        Parameters
+        ----------
+        threads : int, optional
+            With more than one thread, mappings are faulted in concurrently
+            by touching each page, which keeps more I/O in flight on fast
+            SSDs (default: 1, a single madvise per mapping)
+
+        Returns
+        -------
+        int
+            Number of mappings that were prefaulted
+        """
+        if threads <= 1:
+            return sum(populate_array(arr) for arr in self._mapped)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            return sum(pages > 0 for pages in pool.map(touch_array, self._mapped))
+
+    def _track(self, arr: NDArray[Any]) -> NDArray[Any]:
+        """Record a mapped array and apply the manager's access hint."""
+        if get_mmap(arr) is not None:
+            self._mapped.append(arr)
+            if self.advice != 'normal':
+                advise_array(arr, self.advice)
+        return arr
 
     def exists(self) -> bool:
         """Check if the .cfm directory exists and has metadata."""
@@ -112,4 +203,5 @@ class MmapManager:
     def close(self) -> None:
         """Release all memory mappings."""
         self._arrays.clear()
+        self._mapped.clear()
         self._meta = None
@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from cfabric.storage.mmap_hints import prefetch_indices
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
@@ -104,6 +106,22 @@ class StringPool:
         """
         return len(self.indices)
 
+    def prefetch(self, nodes: list[int] | range) -> int:
+        """
+        Read ahead the pages of indices that hold the given nodes.
+
+        Parameters
+        ----------
+        nodes : list[int] | range
+            Nodes that are about to be accessed (1-indexed)
+
+        Returns
+        -------
+        int
+            Number of page spans advised (0 if not memory-mapped)
+        """
+        return prefetch_indices(self.indices, np.asarray(nodes, dtype=np.int64) - 1)
+
     def items(self) -> Iterator[tuple[int, str]]:
         """
         Iterate over (node, value) pairs efficiently using numpy.
@@ -461,6 +479,22 @@ class IntFeatureArray:
         """
         return len(self.values)
 
+    def prefetch(self, nodes: list[int] | range) -> int:
+        """
+        Read ahead the pages of values that hold the given nodes.
+
+        Parameters
+        ----------
+        nodes : list[int] | range
+            Nodes that are about to be accessed (1-indexed)
+
+        Returns
+        -------
+        int
+            Number of page spans advised (0 if not memory-mapped)
+        """
+        return prefetch_indices(self.values, np.asarray(nodes, dtype=np.int64) - 1)
+
     def items(self) -> Iterator[tuple[int, int]]:
         """
         Iterate over (node, value) pairs efficiently using numpy.
@@ -3,6 +3,8 @@
 Provides loaded API objects for testing the full Context-Fabric stack.
 """
 
+import shutil
+
 import pytest
 from pathlib import Path
 
@@ -14,9 +16,21 @@ def fixtures_dir():
 
 
 @pytest.fixture(scope="module")
-def mini_corpus_path(fixtures_dir):
-    """Path to minimal test corpus as string."""
-    return str(fixtures_dir / "mini_corpus")
+def mini_corpus_path(fixtures_dir, tmp_path_factory):
+    """Path to a compiled copy of the minimal test corpus as string.
+
+    The `.cfm` cache is built from the `.tf` files in a temporary copy,
+    so it always matches the current format and the fixtures stay
+    source-only.
+    """
+    from cfabric.io.compiler import Compiler
+
+    corpus = tmp_path_factory.mktemp("corpus") / "mini_corpus"
+    shutil.copytree(
+        fixtures_dir / "mini_corpus", corpus, ignore=shutil.ignore_patterns(".cfm")
+    )
+    assert Compiler(str(corpus)).compile(), "Failed to compile mini_corpus"
+    return str(corpus)
 
 
 @pytest.fixture(scope="module")
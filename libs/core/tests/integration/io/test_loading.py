@@ -96,6 +96,24 @@ class TestFabricLoadSpecific:
         assert hasattr(api.F, "pos")
 
 
+class TestFabricPrefault:
+    """Tests for paging in the .cfm arrays after loading."""
+
+    def test_load_all_with_prefault(self, mini_corpus_path):
+        """prefault should page in mapped arrays without changing the API."""
+        from cfabric.core.fabric import Fabric
+
+        Fabric(locations=mini_corpus_path, silent="deep").loadAll(silent="deep")
+
+        TF = Fabric(locations=mini_corpus_path, silent="deep", prefault=2)
+        api = TF.loadAll(silent="deep")
+
+        assert api is not False
+        assert TF._loaded_from_cfm
+        assert TF._cfm_mmap_mgr.mapped_arrays
+        assert hasattr(api.F, "word")
+
+
 class TestFabricErrors:
     """Tests for error handling during loading."""
 
@@ -64,6 +64,17 @@ class TestNodeFeatureV:
         assert nf.v(2) == 200
 
 
+class TestNodeFeaturePrefetch:
+    """Tests for NodeFeature.prefetch() method."""
+
+    def test_dict_backend_is_noop(self, mock_api, sample_node_data):
+        """prefetch() should do nothing for dict-based data."""
+        nf = NodeFeature(mock_api, {}, sample_node_data)
+
+        assert nf.prefetch([1, 2, 3]) == 0
+        assert nf.v(1) == "word1"
+
+
 class TestNodeFeatureItems:
     """Tests for NodeFeature.items() method."""
 
@@ -0,0 +1,65 @@
+"""Tests for mmap access hints."""
+
+import mmap
+
+import numpy as np
+import pytest
+from cfabric.storage.mmap_hints import (
+    advise_array,
+    check_advice,
+    get_mmap,
+    populate_array,
+    prefetch_indices,
+    touch_array,
+)
+
+
+class TestMmapHints:
+    """Test madvise wrappers."""
+
+    @pytest.fixture
+    def memmap(self, tmp_path):
+        """Create a memory-mapped array."""
+        path = tmp_path / 'arr.npy'
+        np.save(str(path), np.arange(1000, dtype='uint32'))
+        return np.load(str(path), mmap_mode='r')
+
+    def test_get_mmap(self, memmap):
+        """get_mmap finds the mapping behind memmaps and their views."""
+        assert isinstance(get_mmap(memmap), mmap.mmap)
+        assert get_mmap(memmap[10:20]) is get_mmap(memmap)
+        assert get_mmap(np.arange(5)) is None
+
+    def test_check_advice(self):
+        """Hint names are normalized and validated."""
+        assert check_advice('Sequential') == 'sequential'
+        with pytest.raises(ValueError):
+            check_advice('bogus')
+
+    def test_advise_array(self, memmap):
+        """Hints apply to mappings and are ignored for in-memory arrays."""
+        expected = hasattr(mmap, 'MADV_SEQUENTIAL')
+        assert advise_array(memmap, 'sequential') is expected
+        assert advise_array(np.arange(5), 'sequential') is False
+        assert int(memmap[999]) == 999
+
+    def test_populate_array(self, memmap):
+        """Prefaulting leaves the data intact and skips in-memory arrays."""
+        populate_array(memmap)
+        assert populate_array(np.arange(5)) is False
+        assert int(memmap[0]) == 0
+
+    def test_touch_array(self, memmap):
+        """Touching reads one byte per page of the mapping."""
+        assert touch_array(memmap) >= 1
+        assert touch_array(np.arange(5)) == 0
+
+    def test_prefetch_indices(self, memmap):
+        """Selected elements are grouped into page spans."""
+        if not hasattr(mmap, 'MADV_WILLNEED'):
+            pytest.skip('madvise not available')
+        assert prefetch_indices(memmap, [0, 1, 2]) == 1
+        assert prefetch_indices(memmap, [0, 999]) >= 1
+        assert prefetch_indices(memmap[500:], [0, 10]) == 1
+        assert prefetch_indices(memmap, [-1, 5000]) == 0
+        assert prefetch_indices(np.arange(5), [0]) == 0
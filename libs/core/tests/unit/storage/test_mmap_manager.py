@@ -78,3 +78,30 @@ class TestMmapManager:
         assert len(mgr._arrays) > 0
         mgr.close()
         assert len(mgr._arrays) == 0
+
+    def test_mapped_arrays_tracked(self, cfm_dir):
+        """Every memory-mapped array handed out is tracked."""
+        mgr = MmapManager(cfm_dir)
+        arr = mgr.get_array('warp', 'otype')
+
+        assert len(mgr.mapped_arrays) == 1
+        assert mgr.mapped_arrays[0] is arr
+
+    def test_advice(self, cfm_dir):
+        """Access hints are validated and can be re-applied."""
+        mgr = MmapManager(cfm_dir, advice='sequential')
+        assert mgr.advice == 'sequential'
+
+        assert list(mgr.get_array('warp', 'otype')) == [0, 0, 1]
+        assert mgr.advise('random') <= len(mgr.mapped_arrays)
+
+        with pytest.raises(ValueError):
+            MmapManager(cfm_dir, advice='bogus')
+
+    def test_prefault(self, cfm_dir):
+        """Prefaulting works single- and multi-threaded."""
+        mgr = MmapManager(cfm_dir)
+        mgr.get_array('warp', 'otype')
+
+        assert mgr.prefault(threads=2) == 1
+        assert mgr.prefault() <= 1
@@ -102,6 +102,19 @@ class TestIntFeatureArray:
             assert loaded.get(2) == 200
             assert loaded.get(3) is None
 
+    def test_prefetch(self):
+        """prefetch() only advises memory-mapped arrays."""
+        arr = IntFeatureArray.from_dict({1: 100, 2: 200}, max_node=3)
+        assert arr.prefetch([1, 2]) == 0
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'test.npy'
+            arr.save(str(path))
+
+            loaded = IntFeatureArray.load(str(path))
+            assert loaded.prefetch([1, 2, 99]) <= 1
+            assert loaded.get(2) == 200
+
 
 class TestStringPoolVectorized:
     """Tests for vectorized filtering operations on StringPool."""